@@ -0,0 +1,104 @@
+import copy
+import os
+
+import pytest
+
+tests_dir = os.path.join(os.path.dirname(__file__), os.pardir, "tests")
+
+SIZES = [10, 1000, 10000, 100000]
+
+# File types cycled through when generating source files. This roughly matches
+# the mix in a large design, with mostly HDL source files and some include files
+# and scripts
+FILE_TYPES = [
+    ("rtl/mod_{}.v", {"file_type": "verilogSource"}),
+    ("rtl/mod_{}.sv", {"file_type": "systemVerilogSource"}),
+    ("rtl/mod_{}.sv", {"file_type": "systemVerilogSource"}),
+    ("rtl/mod_{}.vhd", {"file_type": "vhdlSource-2008", "logical_name": "lib"}),
+    ("rtl/mod_{}.vhd", {"file_type": "vhdlSource"}),
+    ("include/inc_{}.vh", {"file_type": "verilogSource", "is_include_file": True}),
+    ("rtl/mod_{}.v", {"file_type": "verilogSource", "define": {"KEY": "VAL"}}),
+    ("scripts/s_{}.tcl", {"file_type": "tclSource"}),
+    ("data/d_{}.mem", {"file_type": "user"}),
+]
+
+# Several tools only accept a single constraint file of each type
+CONSTRAINT_FILES = [
+    {"name": "constraints/top.xdc", "file_type": "xdc"},
+    {"name": "constraints/top.sdc", "file_type": "SDC"},
+    {"name": "constraints/top.pcf", "file_type": "PCF"},
+]
+
+PARAM_TYPES = ["plusarg", "vlogdefine", "vlogparam", "generic", "cmdlinearg"]
+DATA_TYPES = [("bool", True), ("int", 42), ("str", "hello")]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--max-files",
+        type=int,
+        default=max(SIZES),
+        help="Skip synthetic EDAMs with more files than this",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "nfiles" in metafunc.fixturenames:
+        max_files = metafunc.config.getoption("max_files")
+        metafunc.parametrize("nfiles", [n for n in SIZES if n <= max_files])
+
+
+def make_edam(nfiles, nparams=100, tool_options={}, flow_options={}):
+    """Create a synthetic EDAM with nfiles files and nparams parameters"""
+    files = copy.deepcopy(CONSTRAINT_FILES)
+    for i in range(nfiles - len(files)):
+        (name, attrs) = FILE_TYPES[i % len(FILE_TYPES)]
+        files.append({"name": name.format(i), **copy.deepcopy(attrs)})
+
+    parameters = {}
+    for i in range(nparams):
+        (datatype, default) = DATA_TYPES[i % len(DATA_TYPES)]
+        parameters[f"param_{i}"] = {
+            "datatype": datatype,
+            "default": default,
+            "description": "",
+            "paramtype": PARAM_TYPES[i % len(PARAM_TYPES)],
+        }
+
+    return {
+        "name": "design",
+        "files": files,
+        "parameters": parameters,
+        "tool_options": tool_options,
+        "flow_options": flow_options,
+        "toplevel": "top",
+    }
+
+
+@pytest.fixture
+def mock_commands(monkeypatch):
+    """Put the mock EDA tools from the test suite first in PATH"""
+    monkeypatch.setenv("PATH", os.path.join(tests_dir, "mock_commands"), ":")
+
+
+def rounds(nfiles):
+    # Keep the total time for the largest EDAMs reasonable
+    return 10 if nfiles <= 1000 else 3
+
+
+@pytest.fixture
+def bench_configure(benchmark):
+    """Benchmark target with a fresh copy of edam for every round
+
+    Copying the EDAM is not included in the timing. This is needed since
+    backends modify the EDAM they are set up with.
+    """
+
+    def _bench(target, edam):
+        return benchmark.pedantic(
+            target,
+            setup=lambda: ((copy.deepcopy(edam),), {}),
+            rounds=rounds(len(edam["files"])),
+        )
+
+    return _bench
@@ -0,0 +1,45 @@
+"""Time Edaflow.__init__ and configure() for the main flows"""
+
+import pytest
+
+from edalize.flows.f4pga import F4pga
+from edalize.flows.icestorm import Icestorm
+from edalize.flows.lint import Lint
+from edalize.flows.sim import Sim
+from edalize.flows.vivado import Vivado
+
+from .conftest import make_edam
+
+FLOWS = {
+    "sim": (Sim, {"tool": "icarus"}),
+    "lint": (Lint, {"tool": "verilator"}),
+    "vivado": (Vivado, {"part": "xc7a35tcsg324-1"}),
+    "icestorm": (Icestorm, {}),
+    "f4pga": (
+        F4pga,
+        {"device": "artix7", "part": "xc7a35tcpg236-1", "chip": "xc7a50t_test"},
+    ),
+}
+
+# Flows that can't be configured yet. Benchmarked anyway so that the results
+# show up once they are fixed
+BROKEN = {
+    "f4pga": "F4pga.configure_flow returns a list instead of a FlowGraph",
+}
+
+
+@pytest.mark.parametrize(
+    "flow_name",
+    [
+        pytest.param(f, marks=pytest.mark.xfail(reason=BROKEN[f])) if f in BROKEN else f
+        for f in FLOWS
+    ],
+)
+def test_flow_configure(bench_configure, mock_commands, tmp_path, flow_name, nfiles):
+    (flow_class, flow_options) = FLOWS[flow_name]
+
+    def configure(edam):
+        flow_class(edam, tmp_path).configure()
+
+    bench_configure(configure, make_edam(nfiles, flow_options=flow_options))
+    assert (tmp_path / "Makefile").exists()
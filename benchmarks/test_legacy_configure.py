@@ -0,0 +1,32 @@
+"""Time configure() for the main legacy Tool API backends"""
+
+import copy
+
+import pytest
+
+from edalize.edatool import get_edatool
+
+from .conftest import make_edam, rounds
+
+BACKENDS = {
+    "modelsim": {},
+    "vcs": {},
+    "xsim": {},
+    "quartus": {"family": "Cyclone V", "device": "5CSXFC6D6F31C8ES"},
+}
+
+
+@pytest.mark.parametrize("tool", BACKENDS)
+def test_legacy_configure(benchmark, mock_commands, tmp_path, tool, nfiles):
+    edam = make_edam(nfiles, tool_options={tool: BACKENDS[tool]})
+    tool_class = get_edatool(tool)
+
+    # Only configure() is timed. The backend is instantiated from a fresh
+    # EDAM for each round since backends modify the EDAM
+    def setup():
+        return ((tool_class(edam=copy.deepcopy(edam), work_root=str(tmp_path)),), {})
+
+    benchmark.pedantic(
+        lambda backend: backend.configure(), setup=setup, rounds=rounds(nfiles)
+    )
+    assert (tmp_path / "Makefile").exists()
@@ -0,0 +1,118 @@
+# Copyright edalize contributors
+# Licensed under the 2-Clause BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-2-Clause
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+# Bump this if the key calculation or cache layout changes
+CACHE_VERSION = 1
+
+
+class ActionCache(object):
+    """Content-addressed cache for the outputs of build graph commands
+
+    Each command is keyed on a hash of its shell command lines, which include
+    the environment variables set for the command, together with the names and
+    contents of its dependencies. When a command is executed with a key that
+    is already in the cache, its outputs are copied from the cache directory
+    instead.
+
+    Entries are stored as cache_dir/ab/abcdef.../ and are created by renaming
+    a complete temporary directory, so several builds can share a cache
+    directory, e.g. on a network file system.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self._hashes = {}
+
+    def _file_hash(self, path):
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._hashes.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        self._hashes[path] = (stamp, h.hexdigest())
+        return h.hexdigest()
+
+    def key(self, rule, work_root):
+        """Calculate the cache key for a rule from the build graph
+
+        Dependencies that don't exist as files (e.g. phony targets) only
+        contribute with their names.
+        """
+        deps = []
+        for d in rule["depends"]:
+            path = os.path.join(work_root, d)
+            deps.append((d, self._file_hash(path) if os.path.isfile(path) else None))
+        desc = {
+            "version": CACHE_VERSION,
+            "commands": rule["commands"],
+            "depends": deps,
+        }
+        return hashlib.sha256(
+            json.dumps(desc, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def _entry(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    @staticmethod
+    def _cacheable(targets):
+        # Only outputs inside the work root can be stored in an entry
+        return all(
+            not os.path.isabs(t) and not os.path.normpath(t).startswith("..")
+            for t in targets
+        )
+
+    def restore(self, key, targets, work_root):
+        """Copy cached outputs to work_root
+
+        Returns True if all targets were found in the cache
+        """
+        entry = self._entry(key)
+        if not self._cacheable(targets):
+            return False
+        if not all(os.path.isfile(os.path.join(entry, t)) for t in targets):
+            return False
+        for t in targets:
+            dst = os.path.join(work_root, t)
+            os.makedirs(os.path.dirname(dst) or ".", exist_ok=True)
+            # Plain copy to give the outputs a fresh mtime
+            shutil.copyfile(os.path.join(entry, t), dst)
+        logger.debug(f"Restored {' '.join(targets)} from cache entry {key}")
+        return True
+
+    def store(self, key, targets, work_root):
+        """Add the outputs of a command to the cache
+
+        Commands where not all targets are regular files, such as phony
+        targets, are not cached
+        """
+        entry = self._entry(key)
+        if os.path.exists(entry) or not self._cacheable(targets):
+            return
+        if not all(os.path.isfile(os.path.join(work_root, t)) for t in targets):
+            return
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=".tmp-", dir=os.path.dirname(entry))
+        try:
+            for t in targets:
+                dst = os.path.join(tmp_dir, t)
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                shutil.copyfile(os.path.join(work_root, t), dst)
+            os.rename(tmp_dir, entry)
+        except OSError:
+            # Most likely another build stored the same entry first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
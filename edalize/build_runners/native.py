@@ -0,0 +1,315 @@
+# Copyright edalize contributors
+# Licensed under the 2-Clause BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-2-Clause
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+from edalize.build_runners.action_cache import ActionCache
+from edalize.utils import OUTPUT_TAIL_LINES, EdaCommands
+
+logger = logging.getLogger(__name__)
+
+GRAPH_FILE = "edalize_build.json"
+
+# Size of the largest single line that is streamed from a child process. Longer
+# lines are passed on in chunks of this size
+_LINE_LIMIT = 1 << 20
+
+
+class Native(object):
+    """Execute the build graph in-process with asyncio
+
+    Instead of writing a Makefile and launching make, the command graph is
+    written to a JSON file in the work root and executed directly by Python.
+    Independent targets are launched in parallel, up to the number of jobs set
+    by the build_jobs flow option. Output from each command is streamed as it
+    is produced, unless the build is quiet.
+
+    If the build_cache flow option is set, command outputs are looked up in
+    and stored to an ActionCache in that directory.
+    """
+
+    def __init__(self, flow_options):
+        self.jobs = flow_options.get("build_jobs") or os.cpu_count() or 1
+        self.cache_dir = flow_options.get("build_cache")
+        self.results = {}
+
+    def get_build_command(self):
+        args = ["-m", "edalize.build_runners.native", "-j", str(self.jobs)]
+        if self.cache_dir:
+            args += ["--cache", os.path.abspath(self.cache_dir)]
+        return (sys.executable, args)
+
+    def write(self, commands: EdaCommands, work_root: Path):
+        if not commands.default_target:
+            raise RuntimeError("Internal Edalize error. Missing default target")
+
+        rules = []
+        for c in commands.commands:
+            rules.append(
+                {
+                    "targets": c.targets,
+                    "depends": [d for d in c.depends if d],
+                    "order_only_deps": [d for d in c.order_only_deps if d],
+                    "commands": commands.shell_commands(c),
+                }
+            )
+
+        graph = {"default_target": commands.default_target, "rules": rules}
+        with open(Path(work_root) / GRAPH_FILE, "w") as f:
+            json.dump(graph, f, indent=1)
+
+    def build(self, work_root, targets=[], env={}, quiet=False):
+        """Build targets from the graph previously written to work_root
+
+        Commands are executed with env added to the environment, and with
+        EDALIZE_TARGET set to the first target of the rule being executed.
+        If quiet is set, the output of the commands is captured instead of
+        streamed, and the last OUTPUT_TAIL_LINES lines of each stream are
+        logged for commands that fail.
+
+        Returns a dict with the first target of each executed rule as key and
+        a dict with the start time, elapsed time, return code and whether the
+        outputs were restored from the cache as value. These are also kept in
+        the results attribute.
+        """
+        with open(Path(work_root) / GRAPH_FILE) as f:
+            graph = json.load(f)
+
+        cache = ActionCache(self.cache_dir) if self.cache_dir else None
+        scheduler = _Scheduler(graph, work_root, self.jobs, cache, env, quiet)
+        self.results = scheduler.results
+        asyncio.run(scheduler.run(targets or [graph["default_target"]]))
+        return self.results
+
+
+class _Tail(object):
+    """Keeps the last OUTPUT_TAIL_LINES lines written to it"""
+
+    def __init__(self):
+        self.lines = deque(maxlen=OUTPUT_TAIL_LINES)
+
+    def write(self, line):
+        self.lines.append(line)
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        return "".join(self.lines)
+
+
+class _Scheduler(object):
+    def __init__(self, graph, work_root, jobs, cache=None, env={}, quiet=False):
+        self.work_root = str(work_root)
+        self.cache = cache
+        self.quiet = quiet
+        self.env = {**os.environ, **env}
+        self.rules = graph["rules"]
+        self.rule_of = {}
+        for i, rule in enumerate(self.rules):
+            for t in rule["targets"]:
+                self.rule_of[t] = i
+        self.default_target = graph["default_target"]
+        self.jobs = jobs
+        self.results = {}
+        self.failed = False
+
+    def _resolve(self, target):
+        return self.default_target if target == "all" else target
+
+    def _check_cycles(self, targets):
+        # Iterative DFS to stay clear of the recursion limit on large graphs
+        state = {}
+        for root in targets:
+            stack = [(root, iter(self._deps(root)))]
+            path = [root]
+            state[root] = "visiting"
+            while stack:
+                node, it = stack[-1]
+                dep = next(it, None)
+                if dep is None:
+                    state[node] = "done"
+                    stack.pop()
+                    path.pop()
+                elif state.get(dep) == "visiting":
+                    cycle = path[path.index(dep) :] + [dep]
+                    raise RuntimeError(
+                        "Circular dependency in build graph: " + " -> ".join(cycle)
+                    )
+                elif dep not in state:
+                    state[dep] = "visiting"
+                    stack.append((dep, iter(self._deps(dep))))
+                    path.append(dep)
+
+    def _deps(self, target):
+        i = self.rule_of.get(self._resolve(target))
+        if i is None:
+            return []
+        return self.rules[i]["depends"] + self.rules[i]["order_only_deps"]
+
+    async def run(self, targets):
+        self._check_cycles(targets)
+        self.sem = asyncio.Semaphore(self.jobs)
+        self.tasks = {}
+        self.total = len([r for r in self.rules if r["commands"]])
+        self.finished = 0
+        try:
+            await asyncio.gather(*[self._make(t) for t in targets])
+        except RuntimeError:
+            # Like make, let running commands finish but don't start new ones
+            self.failed = True
+            await asyncio.gather(*self.tasks.values(), return_exceptions=True)
+            raise
+
+    def _make(self, target):
+        """Returns a future that resolves to True if target was remade"""
+        target = self._resolve(target)
+        i = self.rule_of.get(target)
+        if i is None:
+            return self._source(target)
+        if i not in self.tasks:
+            self.tasks[i] = asyncio.ensure_future(self._build_rule(self.rules[i]))
+        return self.tasks[i]
+
+    async def _source(self, name):
+        if not os.path.exists(os.path.join(self.work_root, name)):
+            raise RuntimeError(f"No rule to make target '{name}'")
+        return False
+
+    def _mtime(self, name):
+        try:
+            return os.stat(os.path.join(self.work_root, name)).st_mtime
+        except FileNotFoundError:
+            return None
+
+    async def _build_rule(self, rule):
+        remade = await asyncio.gather(*[self._make(d) for d in rule["depends"]])
+        await asyncio.gather(*[self._make(d) for d in rule["order_only_deps"]])
+
+        # Like make, a rule is executed if any target is missing, if any
+        # prerequisite was remade or if any prerequisite is newer than the
+        # oldest target
+        target_mtimes = [self._mtime(t) for t in rule["targets"]]
+        dirty = any(remade) or None in target_mtimes
+        if not dirty and rule["depends"]:
+            oldest = min(target_mtimes)
+            dirty = any(
+                (self._mtime(d) or float("inf")) > oldest for d in rule["depends"]
+            )
+        if not dirty:
+            return False
+
+        if rule["commands"]:
+            async with self.sem:
+                if self.failed:
+                    raise RuntimeError("Build aborted")
+                name = rule["targets"][0]
+                start = time.time()
+                returncode = 0
+                cached = False
+                try:
+                    if self.cache:
+                        key = await asyncio.to_thread(
+                            self.cache.key, rule, self.work_root
+                        )
+                        cached = await asyncio.to_thread(
+                            self.cache.restore, key, rule["targets"], self.work_root
+                        )
+                    if not cached:
+                        for command in rule["commands"]:
+                            returncode = await self._run_command(command, name)
+                            if returncode:
+                                raise RuntimeError(
+                                    f"'{command}' exited with an error: {returncode}"
+                                )
+                        if self.cache:
+                            await asyncio.to_thread(
+                                self.cache.store, key, rule["targets"], self.work_root
+                            )
+                finally:
+                    self.results[name] = {
+                        "start": start,
+                        "elapsed": time.time() - start,
+                        "returncode": returncode,
+                        "cached": cached,
+                    }
+                self.finished += 1
+                logger.info(
+                    f"[{self.finished}/{self.total}] {' '.join(rule['targets'])}"
+                )
+        return True
+
+    async def _run_command(self, command, target):
+        logger.debug("Running " + command)
+        proc = await asyncio.create_subprocess_shell(
+            command,
+            cwd=self.work_root,
+            env={**self.env, "EDALIZE_TARGET": target},
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=_LINE_LIMIT,
+        )
+        (stdout, stderr) = (
+            (_Tail(), _Tail()) if self.quiet else (sys.stdout, sys.stderr)
+        )
+        try:
+            await asyncio.gather(
+                self._stream(proc.stdout, stdout),
+                self._stream(proc.stderr, stderr),
+            )
+            returncode = await proc.wait()
+        except BaseException:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            raise
+
+        # Like _run_tool, only show the captured output of failing commands
+        if self.quiet and returncode:
+            if stdout.getvalue():
+                logger.info(stdout.getvalue())
+            if stderr.getvalue():
+                logger.error(stderr.getvalue())
+        return returncode
+
+    @staticmethod
+    async def _stream(reader, out):
+        while True:
+            try:
+                line = await reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError as e:
+                line = e.partial
+            except asyncio.LimitOverrunError as e:
+                line = await reader.read(e.consumed)
+            if not line:
+                break
+            out.write(line.decode(errors="replace"))
+            out.flush()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="python -m edalize.build_runners.native",
+        description="Execute a build graph written by the native build runner",
+    )
+    parser.add_argument("-j", "--jobs", type=int, help="Number of parallel jobs")
+    parser.add_argument("--cache", help="Action cache directory")
+    parser.add_argument("targets", nargs="*", help="Targets to build")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    try:
+        Native({"build_jobs": args.jobs, "build_cache": args.cache}).build(
+            Path.cwd(), args.targets
+        )
+    except RuntimeError as e:
+        sys.exit(str(e))
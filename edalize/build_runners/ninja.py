@@ -0,0 +1,82 @@
+# Copyright edalize contributors
+# Licensed under the 2-Clause BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import shlex
+from pathlib import Path
+
+from edalize.utils import EdaCommands, write_if_changed
+
+
+def _escape_path(s):
+    return s.replace("$", "$$").replace(" ", "$ ").replace(":", "$:")
+
+
+def _escape_value(s):
+    return s.replace("$", "$$")
+
+
+class Ninja(object):
+    """Execute the build graph with Ninja
+
+    Targets without commands become phony targets. All commands use a rule
+    with restat enabled, so that commands which leave their outputs untouched
+    don't cause downstream targets to be rebuilt.
+    """
+
+    def __init__(self, flow_options):
+        self.build_options = flow_options.get("flow_ninja_options", [])
+        self.jobs = flow_options.get("build_jobs")
+        self.stats = flow_options.get("build_stats") or flow_options.get("build_trace")
+
+    def get_build_command(self):
+        jobs = ["-j", str(self.jobs)] if self.jobs else []
+        return ("ninja", jobs + self.build_options)
+
+    def write(self, commands: EdaCommands, work_root: Path):
+        if not commands.default_target:
+            raise RuntimeError("Internal Edalize error. Missing default target")
+
+        lines = [
+            "#Auto generated by Edalize",
+            "",
+            "rule edalize",
+            "  command = $cmd",
+            "  description = $desc",
+            "  restat = 1",
+            "",
+        ]
+
+        for c in commands.commands:
+            outputs = " ".join(_escape_path(t) for t in c.targets)
+            inputs = " ".join(_escape_path(d) for d in c.depends if d)
+            order_only = " ".join(_escape_path(d) for d in c.order_only_deps if d)
+
+            shell_commands = commands.shell_commands(c)
+            if self.stats:
+                # Tell the stats launcher which target each command belongs to
+                shell_commands = [
+                    f"export EDALIZE_TARGET={shlex.quote(c.targets[0])}; " + s
+                    for s in shell_commands
+                ]
+            rule = "edalize" if shell_commands else "phony"
+
+            build = f"build {outputs}: {rule}"
+            if inputs:
+                build += " " + inputs
+            if order_only:
+                build += " || " + order_only
+            lines.append(build)
+            if shell_commands:
+                lines.append("  cmd = " + _escape_value(" && ".join(shell_commands)))
+                lines.append("  desc = " + _escape_value(" ".join(c.targets)))
+            lines.append("")
+
+        lines.append(f"build all: phony {_escape_path(commands.default_target)}")
+        lines.append("default all")
+        lines.append("")
+
+        # Leave the file untouched if nothing has changed to avoid having ninja
+        # consider the manifest as modified
+        write_if_changed(os.path.join(work_root, "build.ninja"), "\n".join(lines))
@@ -0,0 +1,162 @@
+# Copyright edalize contributors
+# Licensed under the 2-Clause BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-2-Clause
+
+"""Record resource usage for the commands in a build graph
+
+Every command written by the build runners is prefixed with
+$(EDALIZE_LAUNCHER). When statistics are enabled, EDALIZE_LAUNCHER is set to
+run this module, which executes the command (through any previously set
+launcher), and appends the wall time, CPU time, peak memory usage and exit code
+of the command to a records file. The build runners make the name of the
+target being built available in EDALIZE_TARGET.
+
+After each invocation of a build runner, the records are read back with
+read_records and can be summarized per target into a JSON file with
+update_summary. Each target keeps the statistics from the last time it was
+executed.
+"""
+
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+
+STATS_FILE = "edalize_stats.json"
+RECORDS_FILE = "edalize_stats.records"
+
+_RECORDS_ENV = "EDALIZE_STATS_RECORDS"
+_LAUNCHER_ENV = "EDALIZE_STATS_LAUNCHER"
+
+
+def launcher_env(records_file, launcher=None):
+    """Return the environment variables that enable recording to records_file
+
+    Commands are executed through launcher, or the current EDALIZE_LAUNCHER
+    if launcher is not set.
+    """
+    if launcher is None:
+        launcher = os.environ.get("EDALIZE_LAUNCHER", "")
+    return {
+        # Run this file directly to not depend on edalize being importable
+        # from the environment of the build
+        "EDALIZE_LAUNCHER": " ".join(
+            shlex.quote(x) for x in [sys.executable, os.path.abspath(__file__)]
+        ),
+        _LAUNCHER_ENV: launcher,
+        _RECORDS_ENV: os.path.abspath(records_file),
+    }
+
+
+def launch_command(args, target, records_file, launcher=None):
+    """Return the command and environment that record args as target
+
+    This is for commands that aren't executed by a build runner, and so are
+    not prefixed with $(EDALIZE_LAUNCHER). The whole command is recorded as a
+    single command of target. Commands that it runs through
+    $(EDALIZE_LAUNCHER) only use launcher, so that they are not also recorded
+    on their own.
+    """
+    env = launcher_env(records_file, launcher)
+    return (
+        [sys.executable, os.path.abspath(__file__)] + args,
+        {**env, "EDALIZE_LAUNCHER": env[_LAUNCHER_ENV], "EDALIZE_TARGET": target},
+    )
+
+
+def _run(args):
+    """Run args and return the exit code and resource usage"""
+    if hasattr(os, "wait4"):
+        try:
+            pid = os.posix_spawnp(args[0], args, os.environ)
+        except FileNotFoundError:
+            print(f"{args[0]}: command not found", file=sys.stderr)
+            return (127, None)
+        (_, status, rusage) = os.wait4(pid, 0)
+        return (os.waitstatus_to_exitcode(status), rusage)
+    return (subprocess.run(args).returncode, None)
+
+
+def launch(argv):
+    args = shlex.split(os.environ.get(_LAUNCHER_ENV, "")) + argv
+    start = time.time()
+    (returncode, rusage) = _run(args)
+    record = {
+        "target": os.environ.get("EDALIZE_TARGET", ""),
+        "command": argv,
+        "start": start,
+        "wall_time": time.time() - start,
+        "user_time": rusage.ru_utime if rusage else None,
+        "system_time": rusage.ru_stime if rusage else None,
+        # ru_maxrss is in kilobytes on Linux but in bytes on macOS
+        "max_rss": (
+            rusage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+            if rusage
+            else None
+        ),
+        "returncode": returncode,
+    }
+
+    records_file = os.environ.get(_RECORDS_ENV)
+    if records_file:
+        # A single write in append mode to keep records from parallel jobs
+        # intact
+        fd = os.open(records_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, (json.dumps(record) + "\n").encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    # Report termination by a signal like a shell would
+    return returncode if returncode >= 0 else 128 - returncode
+
+
+def read_records(records_file):
+    """Return the records in records_file and remove the file"""
+    if not os.path.exists(records_file):
+        return []
+    with open(records_file) as f:
+        records = [json.loads(line) for line in f]
+    os.remove(records_file)
+    return records
+
+
+def update_summary(stats_file, records):
+    """Fold records into the per-target statistics in stats_file"""
+    if not records:
+        return
+
+    targets = {}
+    for r in records:
+        t = targets.get(r["target"])
+        if t is None:
+            t = targets[r["target"]] = {
+                "start": r["start"],
+                "wall_time": 0.0,
+                "cpu_time": None,
+                "max_rss": None,
+                "returncode": 0,
+                "commands": 0,
+            }
+        # Several commands for one target are added up
+        t["commands"] += 1
+        t["wall_time"] += r["wall_time"]
+        if r["user_time"] is not None:
+            t["cpu_time"] = (t["cpu_time"] or 0.0) + r["user_time"] + r["system_time"]
+        if r["max_rss"] is not None:
+            t["max_rss"] = max(t["max_rss"] or 0, r["max_rss"])
+        t["returncode"] = t["returncode"] or r["returncode"]
+
+    summary = {"targets": {}}
+    if os.path.exists(stats_file):
+        with open(stats_file) as f:
+            summary = json.load(f)
+    summary["targets"].update(targets)
+    with open(stats_file, "w") as f:
+        json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    sys.exit(launch(sys.argv[1:]))
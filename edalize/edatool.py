@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
 import argparse
+import copy
 from collections import OrderedDict
 from dataclasses import dataclass
 from importlib import import_module
@@ -13,7 +14,14 @@ import pkgutil
 import subprocess
 import logging
 import sys
-from jinja2 import Environment, PackageLoader
+
+from edalize.utils import (
+    OUTPUT_TAIL_LINES,
+    FileSet,
+    RotatingLog,
+    get_jinja_env,
+    run_tee,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +49,9 @@ NON_TOOL_PACKAGES = [
     "ise_reporting",
     "vivado_reporting",
     "quartus_reporting",
+    "nextpnr_reporting",
+    "yosys_reporting",
+    "openroad_reporting",
     "version",
     "edatool",
 ]
@@ -65,12 +76,11 @@ class Tool:
 
 
 def get_edatool(name: str) -> type:
-    if name not in get_edatool_map():
+    tool = _registry.get(name)
+    if tool is None:
         raise ToolResolutionError(f"Tool {name} not found in edatools.")
 
-    tool_class = get_edatool_map()[name].tool_class
-
-    return tool_class
+    return tool.tool_class
 
 
 def get_entrypoint_tool_extensions():
@@ -116,27 +126,119 @@ def get_namespace_tool_extensions():
             yield tool
 
 
-def get_edatool_map():
-    tool_map = {tool.name: tool for tool in get_namespace_tool_extensions()}
+class _EdatoolRegistry(object):
+    """Cached lookup of Tool API backends
+
+    Tool names are found by listing the modules in the edalize namespace and
+    the registered entrypoints without importing anything. A backend module is
+    only imported when its class is requested. The names are rescanned if the
+    search path of the edalize namespace changes, e.g. when a plugin directory
+    is added to sys.path, or after an explicit invalidate().
+    """
+
+    def __init__(self):
+        self.invalidate()
+
+    def invalidate(self):
+        self._path = None
+        self._sources = {}
+        self._tools = {}
+
+    def sources(self):
+        import edalize as namespace_package_to_search
+
+        path = list(namespace_package_to_search.__path__)
+        if path != self._path:
+            self._sources = self._discover(namespace_package_to_search)
+            self._tools = {}
+            self._path = path
+        return self._sources
+
+    @staticmethod
+    def _discover(namespace_package):
+        sources = {}
+        for mod in pkgutil.iter_modules(
+            namespace_package.__path__, namespace_package.__name__ + "."
+        ):
+            tool_name = mod.name.split(".")[1]
+            if tool_name not in NON_TOOL_PACKAGES:
+                sources[tool_name] = mod.name
+
+        entrypoint_tools = {}
+        for ep in entry_points(group="edalize.legacy_tool"):
+            if ep.name in entrypoint_tools:
+                # Arguably this should be fatal, but we will just log a warning
+                logger.warning(
+                    f"Tool {ep.name} is defined by multiple entrypoints. Implementation from {entrypoint_tools[ep.name].value} will be used."
+                )
+                continue
+
+            if ep.name in sources:
+                logger.warning(
+                    f"Tool {ep.name} is defined both in the edalize namespace and as an entrypoint. The entrypoint will take precedence."
+                )
+            # Track seen entrypoint tools separately to emit duplicate entry diagnostic
+            entrypoint_tools[ep.name] = ep
+
+        sources.update(entrypoint_tools)
+        return sources
+
+    def get(self, name):
+        """Return the Tool for name or None if there is no such tool"""
+        sources = self.sources()
+        if name not in sources:
+            return None
+        if name not in self._tools:
+            self._tools[name] = self._load(name, sources[name])
+        return self._tools[name]
+
+    @staticmethod
+    def _load(name, source):
+        if isinstance(source, EntryPoint):
+            try:
+                tool_class = source.load()
+            except ImportError as e:
+                raise ToolResolutionError(
+                    f"Failed to load tool '{name}' from the following registered entrypoint {source.value}"
+                ) from e
+            return Tool(name, tool_class)
 
-    entrypoint_tools = {}
-    for tool in get_entrypoint_tool_extensions():
-        if tool.name in entrypoint_tools:
-            # Arguably this should be fatal, but we will just log a warning
+        class_name = name.capitalize()
+        try:
+            tool_module = import_module(source)
+        except ImportError as e:
             logger.warning(
-                f"Tool {tool.name} is defined by multiple entrypoints. Implementation from {tool_map[tool.name].module_path} will be used."
+                f"Failed to import namespace extension module {source}, tool {name} is ignored."
             )
-            continue
+            return None
 
-        if tool.name in tool_map:
+        if not hasattr(tool_module, class_name):
             logger.warning(
-                f"Tool {tool.name} is defined both in the edalize namespace and as an entrypoint. The entrypoint will take precedence."
+                f"Module {source} found in edalize namespace, but the module does not contain a tool named {class_name}, tool is ignored."
             )
-        # Track seen entrypoint tools separately to emit duplicate entry diagnostic
-        entrypoint_tools[tool.name] = tool
+            return None
+        return Tool(name, getattr(tool_module, class_name))
+
 
-    tool_map.update(entrypoint_tools)
+_registry = _EdatoolRegistry()
 
+
+def get_edatool_names():
+    """Return the names of all available tools without importing them"""
+    return list(_registry.sources())
+
+
+def invalidate_edatool_cache():
+    """Forget all cached tools so that they are looked up again on next use"""
+    _registry.invalidate()
+
+
+def get_edatool_map():
+    tool_map = {}
+    for name in get_edatool_names():
+        tool = _registry.get(name)
+        if tool is not None:
+            tool_map[name] = tool
     return tool_map
 
 
@@ -230,6 +332,12 @@ class FileAction(argparse.Action):
 
 
 class Edatool(object):
+
+    # When set, output from tools run by _run_tool is streamed line by line to
+    # this (rotating) log file and/or passed to output_callback(stream, line)
+    log_file = None
+    output_callback = None
+
     def __init__(self, edam=None, work_root=None, eda_api=None, verbose=True):
         _tool_name = self.__class__.__name__.lower()
 
@@ -279,14 +387,13 @@ class Edatool(object):
 
         _package = import_module(self.__class__.__module__).__spec__.parent
 
-        self.jinja_env = Environment(
-            loader=PackageLoader(_package, "templates"),
-            trim_blocks=True,
-            lstrip_blocks=True,
-            keep_trailing_newline=True,
+        self.jinja_env = get_jinja_env(
+            _package,
+            {
+                "param_value_str": jinja_filter_param_value_str,
+                "generic_value_str": jinja_filter_param_value_str,
+            },
         )
-        self.jinja_env.filters["param_value_str"] = jinja_filter_param_value_str
-        self.jinja_env.filters["generic_value_str"] = jinja_filter_param_value_str
 
     @classmethod
     def get_doc(cls, api_ver):
@@ -502,32 +609,40 @@ class Edatool(object):
             return True
         return False
 
+    @property
+    def files(self):
+        return self._files
+
+    @files.setter
+    def files(self, files):
+        self._files = files
+        self._filesets = {}
+
+    def _files_changed(self):
+        """Drop the FileSets of the backend
+
+        Must be called by backends that modify self.files or the files in it
+        in place. Assigning a new list to self.files does this automatically.
+        """
+        self._filesets = {}
+
+    def _get_fileset(self, force_slash=False):
+        """Return the files of the backend as a FileSet
+
+        The FileSet is created on first use and then reused until self.files
+        is replaced or _files_changed is called
+        """
+        fileset = self._filesets.get(force_slash)
+        if fileset is None:
+            fileset = FileSet(self.files, force_slash)
+            self._filesets[force_slash] = fileset
+        return fileset
+
     def _get_fileset_files(self, force_slash=False):
-        class File:
-            def __init__(
-                self,
-                name,
-                file_type,
-                logical_name,
-                core=None,
-            ):
-                self.name = name
-                self.file_type = file_type
-                self.logical_name = logical_name
-                self.core = core
-
-        incdirs = []
-        src_files = []
-        for f in self.files:
-            if not self._add_include_dir(f, incdirs, force_slash):
-                _name = f["name"]
-                if force_slash:
-                    _name = _name.replace("\\", "/")
-                file_type = f.get("file_type", "")
-                logical_name = f.get("logical_name", "")
-                core = f.get("core", None)
-                src_files.append(File(_name, file_type, logical_name, core))
-        return (src_files, incdirs)
+        fileset = self._get_fileset(force_slash)
+        # Backends are free to edit the returned records, e.g. to set a default
+        # logical name, so they get copies of the cached ones
+        return ([copy.copy(f) for f in fileset.files], list(fileset.incdirs))
 
     def _param_value_str(self, param_value, str_quote_style="", bool_is_str=False):
         return jinja_filter_param_value_str(param_value, str_quote_style, bool_is_str)
@@ -563,23 +678,55 @@ class Edatool(object):
                     logger.debug(e.stderr)
                 raise RuntimeError(msg)
 
-    def _run_tool(self, cmd, args=[], quiet=False):
+    def _run_tool(self, cmd, args=[], quiet=False, capture=False):
+        """Run a command in the work root
+
+        Set capture for commands whose output is read by the caller. All of
+        their output is kept and returned. For other quiet commands only the
+        last OUTPUT_TAIL_LINES lines of each stream are kept, to show if the
+        command fails.
+        """
         logger.debug("Running " + cmd)
         logger.debug("args  : " + " ".join(args))
 
-        capture_output = quiet and not (self.verbose or self.stdout or self.stderr)
+        capture_output = capture or (
+            quiet and not (self.verbose or self.stdout or self.stderr)
+        )
+        # Stream the output when it should go to a log file or callback, and
+        # for quiet commands where only the tail of the output is kept
+        stream_output = not (self.stdout or self.stderr) and (
+            self.log_file or self.output_callback or (capture_output and not capture)
+        )
         abs_work_root = os.path.abspath(self.work_root)
         print(f"Entering directory '{abs_work_root}'")
         try:
-            cp = run(
-                [cmd] + args,
-                cwd=self.work_root,
-                stdin=subprocess.PIPE,
-                stdout=self.stdout,
-                stderr=self.stderr,
-                capture_output=capture_output,
-                check=True,
-            )
+            if stream_output:
+                log = RotatingLog(self.log_file) if self.log_file else None
+                try:
+                    cp = run_tee(
+                        [cmd] + args,
+                        cwd=self.work_root,
+                        check=True,
+                        log_file=log,
+                        callback=self.output_callback,
+                        echo=not capture_output,
+                        # Output read by the caller is kept in full. Otherwise
+                        # only keep enough to show if the command fails
+                        tail_lines=None if capture else OUTPUT_TAIL_LINES,
+                    )
+                finally:
+                    if log:
+                        log.close()
+            else:
+                cp = run(
+                    [cmd] + args,
+                    cwd=self.work_root,
+                    stdin=subprocess.PIPE,
+                    stdout=None if capture else self.stdout,
+                    stderr=None if capture else self.stderr,
+                    capture_output=capture,
+                    check=True,
+                )
         except FileNotFoundError:
             _s = "Command '{}' not found. Make sure it is in $PATH".format(cmd)
             raise RuntimeError(_s)
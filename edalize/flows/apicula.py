@@ -113,10 +113,7 @@ class Apicula(Edaflow):
         super().configure_tools(flow)
 
     def build(self):
-        (cmd, args) = self.build_runner.get_build_command()
-        self._run_tool(cmd, args=args, cwd=self.work_root, quiet=True)
+        self._run_build_runner(quiet=True)
 
     def run(self):
-        (cmd, args) = self.build_runner.get_build_command()
-        args += ["openfpgaloader"]
-        self._run_tool(cmd, args=args, cwd=self.work_root)
+        self._run_build_runner(["openfpgaloader"])
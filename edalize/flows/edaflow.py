@@ -1,7 +1,21 @@
+import contextlib
+import copy
+import hashlib
+import json
 import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from importlib import import_module
 
-from edalize.utils import EdaCommands
+from edalize.build_runners import stats
+from edalize.utils import (
+    OUTPUT_TAIL_LINES,
+    ChromeTrace,
+    EdaCommands,
+    RotatingLog,
+    run_tee,
+)
 
 import logging
 
@@ -9,6 +23,11 @@ logger = logging.getLogger(__name__)
 import subprocess
 import sys
 
+if sys.version_info < (3, 10):
+    from importlib_metadata import entry_points
+else:
+    from importlib.metadata import entry_points
+
 
 def subprocess_run_3_9(
     *popenargs, input=None, capture_output=False, timeout=None, check=False, **kwargs
@@ -72,37 +91,179 @@ def merge_dict(d1, d2):
     return d1
 
 
-def merge_edam(a, b):
-    """Merge two EDAM dicts coming from different flow graph dependencies.
+def _freeze(x):
+    """Convert x to a hashable value that compares like x
 
-    Dicts are merged recursively and scalar values from the second EDAM
-    win. Lists are concatenated, but entries from the second EDAM that
-    already exist in the first one are skipped, so that files, hooks etc.
-    inherited from a common ancestor node don't show up once per
-    dependency. Neither input is modified.
+    Raises TypeError if x contains values that can't be hashed
+    """
+    if isinstance(x, dict):
+        return (dict, frozenset((k, _freeze(v)) for k, v in x.items()))
+    if isinstance(x, (list, tuple)):
+        return (type(x), tuple(_freeze(v) for v in x))
+    hash(x)
+    return x
+
+
+def _merge_lists(lists):
+    merged = list(lists[0])
+    try:
+        index = {_freeze(e) for e in merged}
+    except TypeError:
+        index = None
+
+    for y in lists[1:]:
+        new = []
+        for e in y:
+            if index is not None:
+                try:
+                    if _freeze(e) in index:
+                        continue
+                except TypeError:
+                    # Fall back to comparing with every entry from now on
+                    index = None
+            if index is None and e in merged:
+                continue
+            new.append(e)
+        if index is not None:
+            index.update(_freeze(e) for e in new)
+        merged += new
+    return merged
+
+
+def _merge_dicts(dicts):
+    keys = {}
+    for d in dicts:
+        for key, value in d.items():
+            keys.setdefault(key, []).append(value)
+    return {key: _merge(values) for key, values in keys.items()}
+
+
+def _merge(values):
+    last = values[-1]
+    for kind, merge in ((dict, _merge_dicts), (list, _merge_lists)):
+        if isinstance(last, kind):
+            # Only the trailing values of the same kind get merged. Anything
+            # before that is overridden
+            run = []
+            for v in reversed(values):
+                if not isinstance(v, kind):
+                    break
+                run.append(v)
+            return run[0] if len(run) == 1 else merge(run[::-1])
+    return last
+
+
+def merge_edam(*edams):
+    """Merge EDAM dicts coming from different flow graph dependencies.
+
+    Dicts are merged recursively and scalar values from later EDAMs win.
+    Lists are concatenated, but entries that already exist in an earlier EDAM
+    are skipped, so that files, hooks etc. inherited from a common ancestor
+    node don't show up once per dependency. Entries are looked up by hash, so
+    merging is linear in the total number of entries. None of the inputs are
+    modified.
     """
+    return _merge_dicts(edams)
+
+
+@lru_cache(maxsize=None)
+def _get_entrypoint_tools():
+    return {ep.name: ep for ep in entry_points(group="edalize.tool")}
+
 
-    def _merge(x, y):
-        if isinstance(x, dict) and isinstance(y, dict):
-            merged = dict(x)
-            for key, value in y.items():
-                merged[key] = _merge(merged[key], value) if key in merged else value
-            return merged
-        if isinstance(x, list) and isinstance(y, list):
-            return x + [e for e in y if e not in x]
-        return y
+@lru_cache(maxsize=None)
+def get_tool_class(name):
+    """Return the class implementing tool name
+
+    Tools registered through the edalize.tool entrypoint take precedence over
+    the ones found in the edalize.tools namespace. Lookups are cached, so
+    every tool module is only imported once.
+    """
+    ep = _get_entrypoint_tools().get(name)
+    if ep:
+        try:
+            return ep.load()
+        except ImportError as e:
+            raise RuntimeError(
+                f"Failed to load tool '{name}' from the following registered entrypoint {ep.value}"
+            ) from e
+
+    module_name = f"edalize.tools.{name}"
+    try:
+        module = import_module(module_name)
+    except ModuleNotFoundError as e:
+        # Don't hide errors from modules that the tool itself imports
+        if e.name != module_name:
+            raise
+        raise RuntimeError(f"Could not find tool '{name}'")
+    return getattr(module, name.capitalize())
 
-    return _merge(a, b)
+
+@lru_cache(maxsize=None)
+def get_tool_option_names(name):
+    """Return the names of the tool options for tool name as a frozenset"""
+    return frozenset(get_tool_class(name).get_tool_options())
+
+
+# Saved tool state for incremental configuration
+CONFIGURE_STATE_FILE = "edalize_configure.pickle"
+CONFIGURE_STATE_VERSION = 2
+
+# Tool attributes that are not part of the saved state
+_UNSAVED_TOOL_ATTRS = ("jinja_env", "work_root")
+
+
+@lru_cache(maxsize=None)
+def _tool_code_hash(tool_class):
+    """Hash the source of tool_class and its base classes
+
+    This makes sure that the saved state of a node is not reused after the tool
+    itself has changed.
+    """
+    h = hashlib.sha256()
+    for cls in tool_class.__mro__:
+        f = getattr(sys.modules.get(cls.__module__), "__file__", None)
+        if f:
+            with open(f, "rb") as fh:
+                h.update(fh.read())
+    return h.hexdigest()
+
+
+def _node_fingerprint(node, input_edam, ignored_flow_options=()):
+    """Calculate a fingerprint for the input of a node
+
+    The fingerprint covers the input EDAM, with tool options only for the tool
+    of the node and without the flow options in ignored_flow_options, together
+    with the code of the tool. Key order is significant, since it can affect
+    the order of the generated output.
+    """
+    tool_name = node.inst.__class__.__name__.lower()
+    edam = {
+        **input_edam,
+        "tool_options": {
+            tool_name: input_edam.get("tool_options", {}).get(tool_name, {})
+        },
+    }
+    if "flow_options" in input_edam:
+        edam["flow_options"] = {
+            k: v
+            for (k, v) in input_edam["flow_options"].items()
+            if not k in ignored_flow_options
+        }
+    h = hashlib.sha256(_tool_code_hash(node.inst.__class__).encode("utf-8"))
+    h.update(json.dumps(edam, default=str).encode("utf-8"))
+    return h.hexdigest()
 
 
 class Node(object):
     def __init__(self, name, deps=[], fdto={}, tool=None):
+        self.name = name
         self.deps = deps
         self.fdto = fdto
         self.tool = tool
 
-        # Import and instantiate the tool class requested by "tool"
-        self.inst = getattr(import_module(f"edalize.tools.{tool}"), tool.capitalize())()
+        # Instantiate the tool class requested by "tool"
+        self.inst = get_tool_class(tool)()
 
 
 class FlowGraph(object):
@@ -111,32 +272,67 @@ class FlowGraph(object):
 
     @classmethod
     def fromdict(cls, d):
+        """Create a FlowGraph from a dict of node descriptions
+
+        The graph is built with Kahn's algorithm. Nodes are added in the same
+        order as repeatedly sweeping over d in dict order and adding every
+        node whose dependencies have already been added. Raises a RuntimeError
+        describing the missing node or the circular dependency if the graph
+        can't be built.
+        """
         c = FlowGraph()
-        _d = d.copy()
-        while _d:
-            # Make a copy to avoid popping from the dict that is being iterated over
-            # and to compare length afterwards. If length is same, it means no item
-            # was popped and graph is not satisifiable
-            _d2 = _d.copy()
-            for k, v in _d2.items():
-
-                # It is safe to pop the element if all dependencies of the node
-                # exist in the graph already
-                if set(v.get("deps", [])) <= set(c.get_nodes()):
-                    node = _d.pop(k)
-
-                    # node["deps"] is a list of strings.
-                    # Get the corresponding node objects for each entry
-                    deps = [c.get_node(dep) for dep in node.get("deps", [])]
-
-                    # tool name is the key by default
-                    tool = v.get("tool", k)
-
-                    c._graph[k] = Node(
-                        k, deps=deps, fdto=node.get("fdto", {}), tool=tool
+
+        index = {k: i for i, k in enumerate(d)}
+        dependents = {k: [] for k in d}
+        in_degree = {}
+        for k, v in d.items():
+            deps = v.get("deps", [])
+            for dep in deps:
+                if not dep in d:
+                    raise RuntimeError(
+                        f"Unsatisfiable graph: Node '{k}' depends on '{dep}' which is not in the graph"
                     )
-            if len(_d) == len(_d2):
-                raise RuntimeError("Unsatisfiable graph")
+                dependents[dep].append(k)
+            in_degree[k] = len(deps)
+
+        # The sweep in which each node would be added. A node is added in the
+        # same sweep as a dependency that comes before it in the dict, but one
+        # sweep after a dependency that comes after it
+        sweep = {k: 0 for k in d}
+        ready = [k for k in d if in_degree[k] == 0]
+        for k in ready:
+            for dependent in dependents[k]:
+                sweep[dependent] = max(
+                    sweep[dependent], sweep[k] + (index[k] > index[dependent])
+                )
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(ready) < len(d):
+            # Every remaining node has at least one remaining dependency, so
+            # following those from any remaining node must end up in a cycle
+            node = next(k for k in d if in_degree[k])
+            path = []
+            while not node in path:
+                path.append(node)
+                node = next(dep for dep in d[node]["deps"] if in_degree[dep])
+            cycle = path[path.index(node) :] + [node]
+            raise RuntimeError(
+                "Unsatisfiable graph: Circular dependency " + " -> ".join(cycle)
+            )
+
+        for k in sorted(ready, key=lambda k: (sweep[k], index[k])):
+            node = d[k]
+
+            # node["deps"] is a list of strings.
+            # Get the corresponding node objects for each entry
+            deps = [c.get_node(dep) for dep in node.get("deps", [])]
+
+            # tool name is the key by default
+            tool = node.get("tool", k)
+
+            c._graph[k] = Node(k, deps=deps, fdto=node.get("fdto", {}), tool=tool)
         return c
 
     def add_node(self, name, node):
@@ -151,11 +347,55 @@ class FlowGraph(object):
 
 class Edaflow(object):
 
+    # When set, output from tools run by _run_tool is streamed line by line to
+    # this (rotating) log file and/or passed to output_callback(stream, line)
+    log_file = None
+    output_callback = None
+
+    # When set, resource usage of the commands in the build graph is recorded
+    # per target in this JSON file. Set from the build_stats flow option
+    stats_file = None
+
+    # When set, configure stages and build commands are written to this file
+    # in Chrome Trace Event format. Set from the build_trace flow option
+    trace_file = None
+    trace = None
+
+    # Saved states from the last configure, with node names as keys and tuples
+    # of fingerprint and pickled tool state as values. Set from the
+    # incremental_configure flow option. Nodes with an unchanged fingerprint
+    # are restored from their saved state and not set up or configured again
+    _saved_states = None
+
     FLOW_OPTIONS = {
         "build_runner": {
             "type": "str",
             "desc": "Tool to execute the build graph (Defaults to make)",
         },
+        "build_jobs": {
+            "type": "int",
+            "desc": "Maximum number of parallel jobs for build runners that schedule the build graph themselves (Defaults to number of CPUs)",
+        },
+        "build_cache": {
+            "type": "str",
+            "desc": "Directory for caching command outputs between builds. Only used by the native build runner",
+        },
+        "build_stats": {
+            "type": "bool",
+            "desc": "Record wall time, CPU time, peak memory usage and exit code for each target to edalize_stats.json in the work root",
+        },
+        "parallel_configure": {
+            "type": "bool",
+            "desc": "Set up independent nodes in the flow graph concurrently in a thread pool",
+        },
+        "incremental_configure": {
+            "type": "bool",
+            "desc": "Only set up and write config files for nodes in the flow graph whose input has changed since the last time the flow was configured",
+        },
+        "build_trace": {
+            "type": "bool",
+            "desc": "Write configure stages and build commands to trace.json in the work root in Chrome Trace Event format",
+        },
         "frontends": {
             "type": "str",
             "desc": "Tools to run before main flow",
@@ -166,6 +406,11 @@ class Edaflow(object):
             "desc": "Additional options to pass to make when executing the flow graph",
             "list": True,
         },
+        "flow_ninja_options": {
+            "type": "str",
+            "desc": "Additional options to pass to ninja when executing the flow graph",
+            "list": True,
+        },
     }
 
     @classmethod
@@ -200,12 +445,7 @@ class Edaflow(object):
         for tool_name in tools:
 
             # Get available tool options from each tool in the list
-            try:
-                class_tool_options = getattr(
-                    import_module(f"edalize.tools.{tool_name}"), tool_name.capitalize()
-                ).get_tool_options()
-            except ModuleNotFoundError:
-                raise RuntimeError(f"Could not find tool '{tool_name}'")
+            class_tool_options = get_tool_class(tool_name).get_tool_options()
             # Add them to the dict unless they are already set by the flow
             filtered_tool_options = flow_defined_tool_options.get(tool_name, {})
             for opt_name in class_tool_options:
@@ -228,18 +468,15 @@ class Edaflow(object):
         tool_options = {}
         edam_flow_opts = self.edam.get("flow_options", {})
         for name, node in self.flow.get_nodes().items():
-            # Get the tool class
-            ToolClass = getattr(
-                import_module(f"edalize.tools.{node.tool}"), node.tool.capitalize()
-            )
+            option_names = get_tool_option_names(node.tool)
             # Inject the flow-defined tool options to the EDAM
             tool_options[node.tool] = merge_dict(
                 node.fdto, tool_options.get(node.tool, {})
             )
 
             # Assign the EDAM-defined tool options to the right tool
-            for opt_name in list(edam_flow_opts.keys()):
-                if opt_name in ToolClass.get_tool_options():
+            for opt_name in edam_flow_opts:
+                if opt_name in option_names:
                     tool_options[node.tool] = merge_dict(
                         tool_options[node.tool],
                         {opt_name: edam_flow_opts.get(opt_name)},
@@ -247,42 +484,171 @@ class Edaflow(object):
 
             self.edam["tool_options"] = tool_options
 
-    def configure_tools(self, graph):
-        # Instantiate each node and add to list of unconfigured nodes
-        unconfigured_nodes = list(graph.get_nodes().values())
-
-        # Configure each node in graph order
-        while unconfigured_nodes:
-            node = unconfigured_nodes.pop(0)
-            input_edam = {}
-
-            # Check all dependencies are fulfilled
-            all_deps_configured = True
-            for n in node.deps:
-                if n.inst.edam:
-                    input_edam = merge_edam(input_edam, n.inst.edam)
-                else:
-                    all_deps_configured = False
-
-            if all_deps_configured:
-                # No input_edam means this is an input to the flow that should
-                # receive the external EDAM.
-                if not input_edam:
-                    input_edam = self.edam
+    def _setup_node(self, node, input_edam):
+        node.inst.work_root = self.work_root
+        with self._trace(f"{node.name}.setup"):
+            if self._saved_states is None:
+                node.inst.setup(input_edam)
+                return
 
-                node.inst.work_root = self.work_root
+            # Calculate the fingerprint before setting up, since tools may
+            # modify their input EDAM
+            fingerprint = _node_fingerprint(
+                node, input_edam, self._ignored_flow_options
+            )
+            saved = self._saved_states.get(node.name)
+            if saved and saved[0] == fingerprint and self._config_files_exist(saved[2]):
+                node.inst.__dict__.update(pickle.loads(saved[1]))
+                self._refresh_restored_edam(node, input_edam)
+                self._restored_nodes.add(node.name)
+                logger.debug(f"Reusing saved state for node '{node.name}'")
+            else:
                 node.inst.setup(input_edam)
+                try:
+                    state = pickle.dumps(
+                        {
+                            k: v
+                            for (k, v) in node.inst.__dict__.items()
+                            if not k in _UNSAVED_TOOL_ATTRS
+                        }
+                    )
+                except (pickle.PicklingError, TypeError, AttributeError):
+                    # Nodes with state that can't be saved are always set up
+                    logger.debug(f"Unable to save state for node '{node.name}'")
+                    return
+                # The config files are added after writing them
+                saved = (fingerprint, state, None)
+            self._new_states[node.name] = saved
+
+    def _config_files_exist(self, config_files):
+        """Check that the config files written by a saved node are still there
+
+        Config files are only known when they are written through
+        update_config_file. Nodes that didn't record any can't be checked, so
+        they are not restored.
+        """
+        if not config_files:
+            return False
+        for f in config_files:
+            if not os.path.exists(os.path.join(self.work_root, f)):
+                logger.debug(f"Missing config file '{f}'")
+                return False
+        return True
+
+    def _refresh_restored_edam(self, node, input_edam):
+        """Update options that the fingerprint doesn't cover in a restored EDAM
+
+        Tools pass on the options for other tools and the flow options to the
+        next node. These don't affect the node itself, so the saved output
+        EDAM can have stale values that need to be replaced.
+        """
+        edam = node.inst.edam
+        if not isinstance(edam, dict):
+            return
+        tool_name = node.inst.__class__.__name__.lower()
+        if "tool_options" in edam and "tool_options" in input_edam:
+            edam["tool_options"] = {
+                **input_edam["tool_options"],
+                tool_name: edam["tool_options"].get(tool_name, {}),
+            }
+        if "flow_options" in edam and "flow_options" in input_edam:
+            # The flow options that are covered are identical
+            edam["flow_options"] = dict(input_edam["flow_options"])
+
+    def _load_saved_states(self):
+        try:
+            with open(os.path.join(self.work_root, CONFIGURE_STATE_FILE), "rb") as f:
+                saved = pickle.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring saved configure state: {e}")
+            return {}
+        if (
+            not isinstance(saved, dict)
+            or saved.get("version") != CONFIGURE_STATE_VERSION
+        ):
+            return {}
+        return saved["nodes"]
 
-                # This is an input node. Inject dependency on pre_build scripts
-                if not node.deps:
-                    # Inject pre-build scripts as an order-only dependency
-                    # before every command that the node executes during build. This is
-                    # probably safe, but might cause pre-build scripts to
-                    # be executed several times
-                    for c in node.inst.commands.commands:
-                        if not "run" in c.targets:
-                            c.order_only_deps.insert(0, "pre_build")
-                self.commands.commands += node.inst.commands.commands
+    def configure_tools(self, graph):
+        """Set up the tool in every node of the graph
+
+        Nodes are set up in waves, where each wave consists of the nodes whose
+        dependencies have all been set up. With the parallel_configure flow
+        option, the nodes within a wave are set up concurrently in a thread
+        pool. Commands are collected in graph order afterwards, so that the
+        result doesn't depend on the order in which the nodes finished.
+        """
+        nodes = list(graph.get_nodes().values())
+
+        pending_deps = {node: len(node.deps) for node in nodes}
+        dependents = {node: [] for node in nodes}
+        for node in nodes:
+            for dep in node.deps:
+                if not dep in dependents:
+                    raise RuntimeError("Unsatisfiable graph")
+                dependents[dep].append(node)
+
+        parallel = self.flow_options.get("parallel_configure")
+
+        configured = 0
+        wave = [node for node in nodes if not node.deps]
+        with contextlib.ExitStack() as stack:
+            executor = stack.enter_context(ThreadPoolExecutor()) if parallel else None
+            while wave:
+                # Tools modify the EDAM they are set up with, including the
+                # lists and dicts within it. Merged EDAMs share these with the
+                # output EDAMs of the dependencies, so nodes that are set up
+                # concurrently get their own copy. Serial setup keeps using
+                # the EDAMs directly, as copying them is expensive for large
+                # designs
+                isolate = executor is not None and len(wave) > 1
+                jobs = []
+                for node in wave:
+                    input_edam = {}
+                    if node.deps:
+                        input_edam = merge_edam(*[n.inst.edam for n in node.deps])
+
+                    # No input_edam means this is an input to the flow that should
+                    # receive the external EDAM.
+                    if not input_edam:
+                        input_edam = self.edam
+
+                    if isolate:
+                        input_edam = copy.deepcopy(input_edam)
+                    jobs.append((node, input_edam))
+
+                if isolate:
+                    for f in [executor.submit(self._setup_node, *job) for job in jobs]:
+                        f.result()
+                else:
+                    for job in jobs:
+                        self._setup_node(*job)
+                configured += len(wave)
+
+                next_wave = []
+                for node in wave:
+                    for dependent in dependents[node]:
+                        pending_deps[dependent] -= 1
+                        if pending_deps[dependent] == 0:
+                            next_wave.append(dependent)
+                wave = next_wave
+
+        if configured < len(nodes):
+            raise RuntimeError("Unsatisfiable graph")
+
+        for node in nodes:
+            # This is an input node. Inject dependency on pre_build scripts
+            if not node.deps:
+                # Inject pre-build scripts as an order-only dependency
+                # before every command that the node executes during build. This is
+                # probably safe, but might cause pre-build scripts to
+                # be executed several times
+                for c in node.inst.commands.commands:
+                    if not "run" in c.targets:
+                        c.order_only_deps.insert(0, "pre_build")
+            self.commands.commands += node.inst.commands.commands
 
     def add_scripts(self, depends, hook_name):
         last_script = depends
@@ -309,13 +675,31 @@ class Edaflow(object):
         # just a single tool
         self.flow_options = self.extract_flow_options()
 
-        self.flow = self.configure_flow(self.flow_options)
+        self.work_root = work_root
+        if self.flow_options.get("build_stats"):
+            self.stats_file = os.path.join(work_root, stats.STATS_FILE)
+        if self.flow_options.get("build_trace"):
+            self.trace_file = os.path.join(work_root, "trace.json")
+            self.trace = ChromeTrace()
+
+        with self._trace("configure_flow"):
+            self.flow = self.configure_flow(self.flow_options)
 
         # Rearrange tool_options so that each tool gets their
         # own tool_options
-        self.extract_tool_options()
-
-        self.work_root = work_root
+        with self._trace("extract_tool_options"):
+            self.extract_tool_options()
+
+        if self.flow_options.get("incremental_configure"):
+            self._saved_states = self._load_saved_states()
+            self._new_states = {}
+            self._restored_nodes = set()
+            # Tools get their tool options through tool_options and the
+            # generic flow options only affect the flow itself. Leave these
+            # out of the fingerprints to not set up unaffected nodes
+            self._ignored_flow_options = set(Edaflow.FLOW_OPTIONS).union(
+                *[get_tool_option_names(n.tool) for n in self.flow.get_nodes().values()]
+            )
 
         self.verbose = verbose
         self.stdout = None
@@ -325,7 +709,8 @@ class Edaflow(object):
         self.add_scripts("", "pre_build")
 
         # Configure the individual tools in the graph
-        self.configure_tools(self.flow)
+        with self._trace("configure_tools"):
+            self.configure_tools(self.flow)
 
         # Add post_build scripts to the end of the build chain
         self.add_scripts(self.commands.default_target, "post_build")
@@ -349,38 +734,147 @@ class Edaflow(object):
         self.commands.add([], ["run"], ["pre_run"])
 
     def configure(self):
+        state_file = os.path.join(self.work_root, CONFIGURE_STATE_FILE)
+        if self._saved_states is not None and os.path.exists(state_file):
+            # Don't leave saved states behind if configuring fails
+            os.remove(state_file)
 
         # Write tool-specific config files
-        for node in self.flow.get_nodes().values():
-            node.inst.configure()
+        for name, node in self.flow.get_nodes().items():
+            if self._saved_states is not None and name in self._restored_nodes:
+                continue
+            with self._trace(f"{name}.write_config_files"):
+                node.inst.configure()
+            if self._saved_states is not None and name in self._new_states:
+                (fingerprint, state, _) = self._new_states[name]
+                config_files = getattr(node.inst, "config_files", None)
+                self._new_states[name] = (
+                    fingerprint,
+                    state,
+                    None if config_files is None else list(config_files),
+                )
 
         # Write out execution file
-        self.build_runner.write(self.commands, self.work_root)
-
-    def _run_tool(self, cmd, args=[], cwd=None, quiet=False, env={}):
+        with self._trace("write_build_graph"):
+            self.build_runner.write(self.commands, self.work_root)
+
+        if self._saved_states is not None:
+            with open(state_file, "wb") as f:
+                pickle.dump(
+                    {"version": CONFIGURE_STATE_VERSION, "nodes": self._new_states}, f
+                )
+
+        if self.trace:
+            self.trace.write(self.trace_file)
+
+    def _trace(self, name):
+        """Return a context manager that traces a configure stage"""
+        return self.trace.span(name) if self.trace else contextlib.nullcontext()
+
+    def _stats_env(self, env={}):
+        """Return the environment for recording build command statistics"""
+        if not (self.stats_file or self.trace_file):
+            return {}
+        return stats.launcher_env(
+            os.path.join(self.work_root, stats.RECORDS_FILE),
+            env.get("EDALIZE_LAUNCHER"),
+        )
+
+    def _stats_launch(self, args, target, env={}):
+        """Return the command and environment that record args as target"""
+        return stats.launch_command(
+            args,
+            target,
+            os.path.join(self.work_root, stats.RECORDS_FILE),
+            env.get("EDALIZE_LAUNCHER"),
+        )
+
+    def _collect_stats(self):
+        """Add recorded build command statistics to the stats and trace files"""
+        if not (self.stats_file or self.trace_file):
+            return
+        records = stats.read_records(os.path.join(self.work_root, stats.RECORDS_FILE))
+        if self.stats_file:
+            stats.update_summary(self.stats_file, records)
+        if self.trace_file:
+            trace = ChromeTrace()
+            trace.add_commands(records)
+            trace.write(self.trace_file, append=True)
+
+    def _run_tool(
+        self, cmd, args=[], cwd=None, quiet=False, env={}, stats=False, capture=False
+    ):
+        """Run a command from the flow
+
+        Set stats to record the statistics of a command with the build_stats
+        and build_trace flow options. Commands that execute the build graph
+        set it to True, and the graph records its commands itself through
+        $(EDALIZE_LAUNCHER). Other commands, like the ones that run the
+        design, set it to a target name and are recorded as a whole under
+        that name. Helper commands, like the ones that query tools for
+        configuration, should leave it unset.
+
+        Set capture for commands whose output is read by the caller. All of
+        their output is kept and returned. For other quiet commands only the
+        last OUTPUT_TAIL_LINES lines of each stream are kept, to show if the
+        command fails.
+        """
         logger.debug("Running " + cmd)
         logger.debug("args  : " + " ".join(args))
 
-        capture_output = quiet and not (self.verbose or self.stdout or self.stderr)
+        capture_output = capture or (
+            quiet and not (self.verbose or self.stdout or self.stderr)
+        )
+        # Stream the output when it should go to a log file or callback, and
+        # for quiet commands where only the tail of the output is kept
+        stream_output = not (self.stdout or self.stderr) and (
+            self.log_file or self.output_callback or (capture_output and not capture)
+        )
+        command = [cmd] + args
+        if stats is True:
+            env = {**env, **self._stats_env(env)}
+        elif stats and (self.stats_file or self.trace_file):
+            (command, stats_env) = self._stats_launch(command, stats, env)
+            env = {**env, **stats_env}
         abs_cwd = os.path.abspath(cwd) if cwd else None
         if abs_cwd:
             print(f"Entering directory '{abs_cwd}'")
         try:
-            cp = run(
-                [cmd] + args,
-                cwd=cwd,
-                stdin=subprocess.PIPE,
-                stdout=self.stdout,
-                stderr=self.stderr,
-                capture_output=capture_output,
-                check=True,
-                env={**os.environ, **env},
-            )
+            if stream_output:
+                log = RotatingLog(self.log_file) if self.log_file else None
+                try:
+                    cp = run_tee(
+                        command,
+                        cwd=cwd,
+                        env={**os.environ, **env},
+                        check=True,
+                        log_file=log,
+                        callback=self.output_callback,
+                        echo=not capture_output,
+                        # Output read by the caller is kept in full. Otherwise
+                        # only keep enough to show if the command fails
+                        tail_lines=None if capture else OUTPUT_TAIL_LINES,
+                    )
+                finally:
+                    if log:
+                        log.close()
+            else:
+                cp = run(
+                    command,
+                    cwd=cwd,
+                    stdin=subprocess.PIPE,
+                    stdout=None if capture else self.stdout,
+                    stderr=None if capture else self.stderr,
+                    capture_output=capture,
+                    check=True,
+                    env={**os.environ, **env},
+                )
         except FileNotFoundError:
             _s = "Command '{}' not found. Make sure it is in $PATH".format(cmd)
             raise RuntimeError(_s)
         except subprocess.CalledProcessError as e:
-            _s = "'{}' exited with an error: {}".format(e.cmd, e.returncode)
+            # Report the command itself rather than the stats launcher
+            _s = "'{}' exited with an error: {}".format([cmd] + args, e.returncode)
             logger.debug(_s)
 
             if e.stdout:
@@ -391,13 +885,41 @@ class Edaflow(object):
                 logger.debug(e.stderr)
 
             raise RuntimeError(_s)
+        finally:
+            if stats:
+                self._collect_stats()
         if abs_cwd:
             print(f"Leaving directory '{abs_cwd}'")
         return cp.returncode, cp.stdout, cp.stderr
 
-    def build(self):
+    def _run_build_runner(self, targets=[], quiet=False):
+        """Execute targets in the build graph
+
+        Build runners with a build method execute the graph in-process.
+        Otherwise the command from the build runner is launched with the
+        targets appended to its arguments.
+        """
+        if hasattr(self.build_runner, "build"):
+            abs_cwd = os.path.abspath(self.work_root)
+            print(f"Entering directory '{abs_cwd}'")
+            try:
+                self.build_runner.build(
+                    self.work_root,
+                    targets,
+                    env=self._stats_env(),
+                    quiet=quiet and not (self.verbose or self.stdout or self.stderr),
+                )
+            finally:
+                self._collect_stats()
+            print(f"Leaving directory '{abs_cwd}'")
+            return
         (cmd, args) = self.build_runner.get_build_command()
-        self._run_tool(cmd, args=args, cwd=self.work_root)
+        self._run_tool(
+            cmd, args=args + targets, cwd=self.work_root, quiet=quiet, stats=True
+        )
+
+    def build(self):
+        self._run_build_runner()
 
     # Most flows won't have a run phase
     def run(self, args=None):
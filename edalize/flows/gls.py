@@ -109,4 +109,4 @@ class Gls(Edaflow):
 
         # Get run command from simulator
         (cmd, args, cwd) = run_tool.run()
-        self._run_tool(cmd, args=args, cwd=cwd)
+        self._run_tool(cmd, args=args, cwd=cwd, stats="run")
@@ -85,4 +85,4 @@ class Icestorm(Edaflow):
         self.commands.add([], ["stats"], [targets])
 
     def build(self):
-        self._run_tool("make", [self.goal], cwd=self.work_root)
+        self._run_build_runner([self.goal])
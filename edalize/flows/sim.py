@@ -30,7 +30,10 @@ class Sim(Generic):
             libnamepath = ""
             if tool in ["xcelium"]:
                 _, output, _ = self._run_tool(
-                    "cocotb-config", ["--lib-name-path", "vpi", tool], quiet=True
+                    "cocotb-config",
+                    ["--lib-name-path", "vpi", tool],
+                    quiet=True,
+                    capture=True,
                 )
                 libnamepath = output.decode("utf8").strip()
 
@@ -109,8 +112,12 @@ class Sim(Generic):
             # Get required cocotb env data
             prev_verbose = self.verbose
             self.verbose = False
-            _, libpy, _ = self._run_tool("cocotb-config", ["--libpython"], quiet=True)
-            _, pybin, _ = self._run_tool("cocotb-config", ["--python-bin"], quiet=True)
+            _, libpy, _ = self._run_tool(
+                "cocotb-config", ["--libpython"], quiet=True, capture=True
+            )
+            _, pybin, _ = self._run_tool(
+                "cocotb-config", ["--python-bin"], quiet=True, capture=True
+            )
             self.verbose = prev_verbose
 
             env = {
@@ -122,7 +129,7 @@ class Sim(Generic):
         else:
             env = {}
 
-        self._run_tool(cmd, args=args, cwd=cwd, env=env)
+        self._run_tool(cmd, args=args, cwd=cwd, env=env, stats="run")
 
         if cocotb_module:
             # Check for failed tests from generated JUnit XML file. Support for cocotb 1.9 and 2.0
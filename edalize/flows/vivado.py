@@ -71,14 +71,14 @@ class Vivado(Edaflow):
         return FlowGraph.fromdict(flow)
 
     def build(self):
-        (cmd, args) = self.build_runner.get_build_command()
+        targets = []
         pnr_opt = self.flow_options.get("pnr", "")
         if self.flow_options.get("gui"):
             # Invoking the GUI by user has the highest precedence over anything else
-            args.append("build-gui")
+            targets.append("build-gui")
         elif pnr_opt == "none":
-            args.append("synth")
-        self._run_tool(cmd, args=args, cwd=self.work_root)
+            targets.append("synth")
+        self._run_build_runner(targets)
 
     def run(self):
         if self.flow_options.get("gui"):
@@ -90,4 +90,4 @@ class Vivado(Edaflow):
             # Get run command from tool instance
             vivado_inst = self.flow.get_node("vivado").inst
             (cmd, args, cwd) = vivado_inst.run()
-            self._run_tool(cmd, args=args, cwd=cwd)
+            self._run_tool(cmd, args=args, cwd=cwd, stats="run")
@@ -1,31 +1,15 @@
-import logging
-from typing import Dict, Any
-
-from edalize.reporting import Reporting
+from __future__ import annotations
 
-logger = logging.getLogger(__name__)
-
-# Reporting is an optional Edalize feature and its required packages may not
-# be installed unless Edalize was installed as edalize[reporting]. There is
-# currently reduced-functionality feedback, so if the module is used without
-# being properly installed log a hopefully helpful error before throwing the
-# exception.
-import_msg = "Missing package %s. Was edalize installed with the reporting option? (pip install 'edalize[reporting]')"
+import logging
+from typing import TYPE_CHECKING, Dict, Any
 
-# This would perhaps be cleaner but more complex with importlib
+from edalize.reporting import Reporting, import_optional
 
-try:
+if TYPE_CHECKING:
+    import pandas as pd
     import pyparsing as pp
-    from pyparsing import pyparsing_common as ppc
-except ImportError as e:
-    logger.exception(import_msg, "pyparsing")
-    raise e
 
-try:
-    import pandas as pd
-except ImportError as e:
-    logger.exception(import_msg, "pandas")
-    raise e
+logger = logging.getLogger(__name__)
 
 
 class IseReporting(Reporting):
@@ -71,6 +55,9 @@ class IseReporting(Reporting):
         #  Minimum period is   1.730ns.
         # --------------------------------------------------------------------------------
 
+        pp = import_optional("pyparsing")
+        ppc = pp.pyparsing_common
+
         period = ppc.real("min period") + pp.Suppress("ns")
 
         # Build up a case-insensitive match for any of the below units
@@ -150,6 +137,9 @@ class IseReporting(Reporting):
            Minimum period:  11.343ns{1}   (Maximum frequency:  88.160MHz)
         """
 
+        pp = import_optional("pyparsing")
+        ppc = pp.pyparsing_common
+
         header = pp.Suppress(pp.SkipTo("Design statistics:", include=True))
         period = (
             pp.Suppress("Minimum period:")
@@ -174,6 +164,9 @@ class IseReporting(Reporting):
         Keys are the title of the table, values are the table body.
         """
 
+        pp = import_optional("pyparsing")
+        ppc = pp.pyparsing_common
+
         # Capture the title from section headings like:
         #
         # Section 12 - Control Set Information
@@ -258,17 +251,37 @@ class IseReporting(Reporting):
 
         return timing
 
-    @staticmethod
-    def report_summary(resources: Dict[str, pd.DataFrame], timing: Dict[str, Any]):
+    @classmethod
+    def report_summary(
+        cls, resources: Dict[str, pd.DataFrame], timing: Dict[str, Any]
+    ) -> Dict[str, Any]:
 
         util = resources["Utilization by Hierarchy"]
+        return cls._summary(util.iloc[0].to_dict(), timing)
+
+    @classmethod
+    def _summarize_reports(cls, resource_rpt: str, timing_rpt: str) -> Dict:
+        table = cls._report_to_tables(cls._parse_map_tables, resource_rpt)[
+            "Utilization by Hierarchy"
+        ]
+        util = dict(zip(table.columns, table.rows[0]))
+        return cls._summary(util, cls.report_timing(timing_rpt))
+
+    @staticmethod
+    def _summary(util: Dict[str, Any], timing: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        The values of :meth:`report_summary`.
+
+        util is the top level row of the "Utilization by Hierarchy" table and
+        timing is returned by :meth:`report_timing`.
+        """
 
         # Find a column beginning with DSP since we don't know if it's
         # DSP48A1, DSP48E2, etc.
-        dsp_col = [c for c in util.columns if c.startswith("DSP")]
+        dsp_col = [c for c in util if c.startswith("DSP")]
 
         if len(dsp_col) != 1:
-            logger.error("Expected 1 column named DSP but found", len(dsp_col))
+            logger.error("Expected 1 column named DSP but found %d", len(dsp_col))
 
         resource_buckets = {
             "lut": "LUTs",
@@ -283,9 +296,8 @@ class IseReporting(Reporting):
 
         # Resources in this table are of the form 123/456 and we want the
         # second (total) number
-        for k in resource_buckets.keys():
-            cell = util.iloc[0].at[resource_buckets[k]]
-            summary[k] = int(str(cell).split("/")[1])
+        for k, v in resource_buckets.items():
+            summary[k] = int(str(util[v]).split("/")[1])
 
         summary["constraint"] = {}
         summary["fmax"] = {}
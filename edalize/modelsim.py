@@ -108,60 +108,61 @@ class Modelsim(Edatool):
     def _write_build_rtl_tcl_file(self, tcl_main):
         tcl_build_rtl = open(os.path.join(self.work_root, "edalize_build_rtl.tcl"), "w")
 
+        fileset = self._get_fileset()
         (src_files, incdirs) = self._get_fileset_files()
         vlog_include_dirs = ["+incdir+" + d.replace("\\", "/") for d in incdirs]
 
         libs = []
 
-        vlog_files = []
-
         common_compilation = self.tool_options.get("compilation_mode") == "common"
-        for f in src_files:
-            if not f.logical_name:
-                f.logical_name = "work"
-            if not f.logical_name in libs:
-                tcl_build_rtl.write("vlib {}\n".format(f.logical_name))
-                libs.append(f.logical_name)
-            if f.file_type.startswith("verilogSource") or f.file_type.startswith(
+
+        # The compile command only depends on the file type, so it is set up
+        # once for each file type in the FileSet
+        compile_cmds = {}
+        for file_type in fileset.file_types():
+            cmd = None
+            args = []
+            if file_type.startswith("verilogSource") or file_type.startswith(
                 "systemVerilogSource"
             ):
-                vlog_files.append(f)
                 cmd = "vlog"
-                args = []
 
                 args += self.tool_options.get("vlog_options", [])
 
                 for k, v in self.vlogdefine.items():
                     args += ["+define+{}={}".format(k, self._param_value_str(v))]
 
-                if f.file_type.startswith("systemVerilogSource"):
+                if file_type.startswith("systemVerilogSource"):
                     args += ["-sv"]
                 args += vlog_include_dirs
-            elif f.file_type.startswith("vhdlSource"):
+            elif file_type.startswith("vhdlSource"):
                 cmd = "vcom"
-                if f.file_type.endswith("-87"):
+                if file_type.endswith("-87"):
                     args = ["-87"]
-                if f.file_type.endswith("-93"):
+                if file_type.endswith("-93"):
                     args = ["-93"]
-                if f.file_type.endswith("-2008"):
+                if file_type.endswith("-2008"):
                     args = ["-2008"]
                 else:
                     args = []
 
                 args += self.tool_options.get("vcom_options", [])
+            compile_cmds[file_type] = (cmd, args)
 
-            elif f.file_type == "tclSource":
-                cmd = None
+        for f in src_files:
+            logical_name = f.logical_name or "work"
+            if not logical_name in libs:
+                tcl_build_rtl.write("vlib {}\n".format(logical_name))
+                libs.append(logical_name)
+            (cmd, args) = compile_cmds[f.file_type]
+            if f.file_type == "tclSource":
                 tcl_main.write("do {}\n".format(f.name))
-            elif f.file_type == "user":
-                cmd = None
-            else:
+            elif cmd is None and f.file_type != "user":
                 _s = "{} has unknown file type '{}'"
                 logger.warning(_s.format(f.name, f.file_type))
-                cmd = None
             if cmd and ((cmd != "vlog") or not common_compilation):
-                args += ["-quiet"]
-                args += ["-work", f.logical_name]
+                args = args + ["-quiet"]
+                args += ["-work", logical_name]
                 args += [f.name.replace("\\", "/")]
                 tcl_build_rtl.write("{} {}\n".format(cmd, " ".join(args)))
         if common_compilation:
@@ -169,14 +170,12 @@ class Modelsim(Edatool):
             for k, v in self.vlogdefine.items():
                 args += ["+define+{}={}".format(k, self._param_value_str(v))]
 
-            _vlog_files = []
-            has_sv = False
-            for f in vlog_files:
-                _vlog_files.append(f.name.replace("\\", "/"))
-                if f.file_type.startswith("systemVerilogSource"):
-                    has_sv = True
+            _vlog_files = [
+                f.name.replace("\\", "/")
+                for f in fileset.by_prefix("verilogSource", "systemVerilogSource")
+            ]
 
-            if has_sv:
+            if fileset.has_prefix("systemVerilogSource"):
                 args += ["-sv"]
             args += vlog_include_dirs
             args += ["-quiet"]
@@ -0,0 +1,148 @@
+"""
+nextpnr-specific reporting routines
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Union
+
+from edalize.reporting import JsonReporting, import_optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class NextpnrReporting(JsonReporting):
+    """
+    nextpnr-specific reporting routines.
+
+    These read the JSON report written with ``nextpnr-<arch> --report
+    <name>.report.json``, which has both the utilization and the timing
+    results.
+
+    The report only has the number of used bels of each type. On iCE40 a
+    logic cell (``ICESTORM_LC``) holds a LUT, a register or both, and the
+    report doesn't say how many of them use the register. The summary
+    therefore counts the logic cells as ``lut`` and leaves ``reg`` as None
+    for iCE40 designs rather than guessing.
+    """
+
+    # Override non-default class variables
+    _resource_rpt_pattern = "*.report.json"
+    _timing_rpt_pattern = "*.report.json"
+
+    # Bel types counted for each summary resource. The bel types depend on the
+    # architecture. iCE40 logic cells may use their LUT, their register or
+    # both, and the report has no register count for them, so they are only
+    # counted as LUTs (see the class docstring)
+    _resource_buckets = {
+        "lut": ["ICESTORM_LC", "TRELLIS_COMB", "OXIDE_COMB"],
+        "reg": ["TRELLIS_FF", "OXIDE_FF"],
+        "blkmem": [
+            "ICESTORM_RAM",
+            "ICESTORM_SPRAM",
+            "DP16KD",
+            "OXIDE_EBR",
+            "LRAM_CORE",
+        ],
+        "dsp": ["ICESTORM_DSP", "MULT18X18D", "ALU54B", "MULT9_CORE"],
+    }
+
+    @classmethod
+    def _resource_tables(cls, report: Dict) -> Dict[str, pd.DataFrame]:
+        pd = import_optional("pandas")
+
+        util = report.get("utilization", {})
+        df = pd.DataFrame(
+            {
+                "used": [v["used"] for v in util.values()],
+                "available": [v["available"] for v in util.values()],
+            },
+            index=pd.Index(list(util), name="bel type"),
+        )
+        return {"utilization": df}
+
+    @classmethod
+    def _timing_tables(cls, report: Dict) -> Dict[str, pd.DataFrame]:
+        pd = import_optional("pandas")
+
+        fmax = report.get("fmax", {})
+        fmax_df = pd.DataFrame(
+            {
+                "achieved": [v["achieved"] for v in fmax.values()],
+                "constraint": [v["constraint"] for v in fmax.values()],
+            },
+            index=pd.Index(list(fmax), name="clock"),
+        )
+
+        # One row for each segment of each critical path, collected column by
+        # column
+        columns = [
+            "path",
+            "from",
+            "to",
+            "type",
+            "from_cell",
+            "from_port",
+            "to_cell",
+            "to_port",
+            "delay",
+            "net",
+        ]
+        paths = {c: [] for c in columns}  # type: Dict[str, list]
+        for (i, path) in enumerate(report.get("critical_paths", [])):
+            for segment in path["path"]:
+                paths["path"].append(i)
+                paths["from"].append(path["from"])
+                paths["to"].append(path["to"])
+                paths["type"].append(segment["type"])
+                paths["from_cell"].append(segment["from"]["cell"])
+                paths["from_port"].append(segment["from"]["port"])
+                paths["to_cell"].append(segment["to"]["cell"])
+                paths["to_port"].append(segment["to"]["port"])
+                paths["delay"].append(segment["delay"])
+                paths["net"].append(segment.get("net"))
+
+        return {
+            "fmax": fmax_df,
+            "critical_paths": pd.DataFrame(paths, columns=columns),
+        }
+
+    @classmethod
+    def report_summary(
+        cls, resources: Dict[str, pd.DataFrame], timing: Dict[str, pd.DataFrame]
+    ) -> Dict[str, Union[int, float, None, Dict[str, float]]]:
+
+        used = resources["utilization"]["used"]
+
+        summary = {}  # type: Dict[str, Union[int, float, None, Dict[str, float]]]
+
+        for k, v in cls._resource_buckets.items():
+            bels = used.index.intersection(v)
+            summary[k] = int(used[bels].sum()) if len(bels) else None
+
+        fmax = timing["fmax"]
+        summary["constraint"] = fmax["constraint"].to_dict()
+        summary["fmax"] = fmax["achieved"].to_dict()
+
+        return summary
+
+    @classmethod
+    def _summarize_json(cls, report: Dict) -> Dict:
+        util = report.get("utilization", {})
+
+        summary = {}  # type: Dict[str, Any]
+
+        # The same resources as in report_summary
+        for k, v in cls._resource_buckets.items():
+            used = [util[bel]["used"] for bel in v if bel in util]
+            summary[k] = sum(used) if used else None
+
+        fmax = report.get("fmax", {})
+        summary["constraint"] = {k: v["constraint"] for k, v in fmax.items()}
+        summary["fmax"] = {k: v["achieved"] for k, v in fmax.items()}
+
+        return summary
@@ -0,0 +1,200 @@
+"""
+OpenROAD-specific reporting routines
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+
+from edalize.reporting import JsonReporting, import_optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class OpenroadReporting(JsonReporting):
+    """
+    OpenROAD-specific reporting routines.
+
+    These read the metrics JSON written by OpenROAD-flow-scripts to
+    ``metadata.json`` in the reports directory. The metrics are named
+    ``<stage>__<category>__<metric>``, for example
+    ``finish__timing__setup__ws``, and may also be grouped by stage as in
+    older versions of the flow. Other metrics files written with ``openroad
+    -metrics`` can be passed to :meth:`report_resources` and
+    :meth:`report_timing` directly.
+    """
+
+    # Override non-default class variables
+    _resource_rpt_pattern = "metadata.json"
+    _timing_rpt_pattern = "metadata.json"
+
+    # The time unit of the clock periods and slacks, which is set by the
+    # platform. It is ns for most platforms, but ps for ASAP7
+    _time_unit = "ns"
+
+    # The flow stages in order. The summary uses the metrics of the last stage
+    # that reported them
+    _stages = [
+        "synth",
+        "floorplan",
+        "globalplace",
+        "placeopt",
+        "detailedplace",
+        "place",
+        "cts",
+        "globalroute",
+        "detailedroute",
+        "finish",
+    ]
+
+    # Metrics for each summary resource. There are no LUTs or DSPs in an
+    # ASIC, so combinational cells are reported as LUTs and macros (mostly
+    # memories) as block memories
+    _resource_metrics = {
+        "lut": ["design__instance__count__class:multi_input_combinational_cell"],
+        "reg": ["design__instance__count__class:sequential_cell"],
+        "blkmem": [
+            "design__instance__count__class:macro",
+            "design__instance__count__macros",
+        ],
+        "dsp": [],
+    }
+
+    @classmethod
+    def _metrics(cls, report: Dict) -> Dict[str, Dict[str, Any]]:
+        """
+        The metrics of each stage, with the stages in flow order.
+
+        The stage prefix is removed from the metric names. Metrics of stages
+        that aren't in the flow, like "constraints" and "run", come first.
+        """
+        stages = {}  # type: Dict[str, Dict[str, Any]]
+
+        def collect(d):
+            for (k, v) in d.items():
+                if isinstance(v, dict):
+                    collect(v)
+                elif "__" in k:
+                    (stage, metric) = k.split("__", 1)
+                    stages.setdefault(stage, {})[metric] = v
+
+        collect(report)
+
+        def rank(stage):
+            return cls._stages.index(stage) if stage in cls._stages else -1
+
+        return {s: stages[s] for s in sorted(stages, key=rank)}
+
+    @staticmethod
+    def _latest(metrics: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """The value of each metric from the last stage that reported it"""
+        latest = {}  # type: Dict[str, Any]
+        for stage_metrics in metrics.values():
+            latest.update(stage_metrics)
+        return latest
+
+    @classmethod
+    def _clocks(
+        cls, latest: Dict[str, Any]
+    ) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+        """
+        The constraint and fmax in MHz of each clock.
+
+        The clocks and their periods are found in the constraints__clocks__details
+        metric, with entries like "core_clock: 10.0000". The fmax is taken
+        from the timing__fmax__clock:<name> metric (in Hz) when OpenROAD
+        reported it. Otherwise it is calculated from the worst setup slack,
+        which is only possible for designs with a single clock.
+        """
+        periods = {}  # type: Dict[str, float]
+        for clock in latest.get("clocks__details", []):
+            (name, _, period) = clock.rpartition(":")
+            periods[name.strip()] = float(period)
+
+        clocks = {}
+        for (name, period) in periods.items():
+            constraint = cls.period_to_freq(period, cls._time_unit)
+            fmax = latest.get("timing__fmax__clock:" + name)
+            if fmax is not None:
+                fmax = fmax / 1e6
+            elif len(periods) == 1 and "timing__setup__ws" in latest:
+                fmax = cls.period_to_freq(
+                    period - latest["timing__setup__ws"], cls._time_unit
+                )
+            clocks[name] = (constraint, fmax)
+
+        return clocks
+
+    @classmethod
+    def _resource_tables(cls, report: Dict) -> Dict[str, pd.DataFrame]:
+        pd = import_optional("pandas")
+
+        # One column for each stage
+        metrics = pd.DataFrame(cls._metrics(report)).rename_axis("metric")
+        return {"metrics": metrics}
+
+    @classmethod
+    def _timing_tables(cls, report: Dict) -> Dict[str, pd.DataFrame]:
+        pd = import_optional("pandas")
+
+        metrics = cls._metrics(report)
+        clocks = cls._clocks(cls._latest(metrics))
+        df = pd.DataFrame.from_dict(
+            clocks, orient="index", columns=["constraint", "fmax"]
+        ).rename_axis("clock")
+
+        timing = {
+            s: {k: v for (k, v) in m.items() if k.startswith("timing__")}
+            for (s, m) in metrics.items()
+        }
+        timing_df = pd.DataFrame({s: m for (s, m) in timing.items() if m})
+
+        return {"clocks": df, "timing": timing_df.rename_axis("metric")}
+
+    @classmethod
+    def report_summary(
+        cls, resources: Dict[str, pd.DataFrame], timing: Dict[str, pd.DataFrame]
+    ) -> Dict[str, Union[int, None, Dict[str, float]]]:
+
+        metrics = resources["metrics"]
+
+        summary = {}  # type: Dict[str, Union[int, None, Dict[str, float]]]
+
+        for k, v in cls._resource_metrics.items():
+            summary[k] = None
+            for metric in metrics.index.intersection(v):
+                values = metrics.loc[metric].dropna()
+                if len(values):
+                    summary[k] = int(values.iloc[-1])
+                    break
+
+        # Clocks without an fmax are None as in _summarize_json
+        clocks = timing["clocks"]
+        summary["constraint"] = clocks["constraint"].to_dict()
+        summary["fmax"] = {
+            k: None if math.isnan(v) else v for k, v in clocks["fmax"].items()
+        }
+
+        return summary
+
+    @classmethod
+    def _summarize_json(cls, report: Dict) -> Dict:
+        latest = cls._latest(cls._metrics(report))
+
+        summary = {}  # type: Dict[str, Any]
+
+        # The same resources as in report_summary
+        for k, v in cls._resource_metrics.items():
+            values = [latest[metric] for metric in v if metric in latest]
+            summary[k] = int(values[0]) if values else None
+
+        clocks = cls._clocks(latest)
+        summary["constraint"] = {k: c for (k, (c, _)) in clocks.items()}
+        summary["fmax"] = {k: f for (k, (_, f)) in clocks.items()}
+
+        return summary
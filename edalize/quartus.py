@@ -11,11 +11,16 @@ import re
 import xml.etree.ElementTree as ET
 from functools import partial
 from edalize.edatool import Edatool
-from edalize.utils import get_file_type
+from edalize.utils import EdamFile, get_file_type
 
 logger = logging.getLogger(__name__)
 
 
+class _QsysFile(EdamFile):
+    # QSYS files get additional attributes for use in the templates
+    __slots__ = ("simplename", "srcdir", "dstdir")
+
+
 class Quartus(Edatool):
     argtypes = ["vlogdefine", "vlogparam", "generic"]
 
@@ -139,6 +144,14 @@ class Quartus(Edatool):
         with the build steps.
         """
         (src_files, incdirs) = self._get_fileset_files(force_slash=True)
+        # QSYS files are modified by the template filters. Use copies to
+        # leave the shared file records untouched
+        src_files = [
+            _QsysFile(f.name, f.file_type, f.logical_name, f.core)
+            if get_file_type(f) == "QSYS"
+            else f
+            for f in src_files
+        ]
         self.jinja_env.filters["src_file_filter"] = self.src_file_filter
         self.jinja_env.filters["qsys_file_filter"] = self.qsys_file_filter
 
@@ -1,30 +1,26 @@
+from __future__ import annotations
+
 import logging
 import re
-from typing import Dict, Union
+from typing import TYPE_CHECKING, Any, Dict, Tuple, Union
 
 from edalize.reporting import Reporting
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
-# Reporting is an optional Edalize feature and its required packages may not
-# be installed unless Edalize was installed as edalize[reporting]. There is
-# currently reduced-functionality feedback, so if the module is used without
-# being properly installed log a hopefully helpful error before throwing the
-# exception.
-import_msg = "Missing package %s. Was edalize installed with the reporting option? (pip install 'edalize[reporting]')"
-
-# This would perhaps be cleaner but more complex with importlib
-try:
-    import pyparsing as pp
-except ImportError as e:
-    logger.exception(import_msg, "pyparsing")
-    raise e
-
-try:
-    import pandas as pd
-except ImportError as e:
-    logger.exception(import_msg, "pandas")
-    raise e
+# The start of a table: A horizontal line, the title and another horizontal
+# line starting the table body
+_TABLE_START = re.compile(
+    rb"^\+[-+]*[ \t\r]*\n;([^;\n]*);[ \t\r]*\n(?=\+[-+]*[ \t\r]*(?:\n|\Z))", re.M
+)
+
+# Lines of a table up to the next horizontal line or blank line
+_TABLE_ROWS = re.compile(rb"(?:[ \t\r]*[^ \t\r\n+][^\n]*\n)*")
+
+_TABLE_HLINE = re.compile(rb"\+[-+]*[ \t\r]*(?:\n|\Z)")
 
 
 class QuartusReporting(Reporting):
@@ -37,90 +33,130 @@ class QuartusReporting(Reporting):
     _timing_rpt_pattern = "*.sta.rpt"
     _report_encoding = "ISO-8859-1"
 
-    @staticmethod
-    def _parse_tables(report_str: str) -> Dict[str, str]:
-        """
-        Parse the tables from a fitter report.
+    # Columns of the "Fitter Resource Utilization by Entity" table for each
+    # summary resource. The column names depend on the device family
+    _resource_buckets = {
+        "lut": ["Logic Cells", "Combinational ALUTs"],
+        "reg": ["Dedicated Logic Registers"],
+        "blkmem": ["M9Ks", "M10Ks", "M20Ks"],
+        "dsp": ["DSP Elements", "DSP Blocks"],
+    }
 
-        Keys are the title of the table, values are the table body
+    @classmethod
+    def _parse_tables(cls, report: bytes) -> Dict[str, Tuple[int, int]]:
         """
+        Find the tables in a fitter or timing report.
 
-        hline = pp.lineStart() + pp.Word("+", "+-") + pp.lineEnd()
-
-        title = (
-            pp.lineStart()
-            + ";"
-            + pp.SkipTo(";")("title").set_parse_action(pp.token_map(str.strip))
-            + ";"
-            + pp.lineEnd()
-        )
-
-        # Grab everything until the next horizontal line(s). Tables with
-        # column headings will have a horizontal line after the headings and
-        # at the end of the table. Odd tables without section headings will
-        # only have a single horizontal line.
-        data = pp.SkipTo(hline, fail_on=pp.lineEnd() * 2, include=True)
-
-        table = hline + title + pp.Combine(hline + data * (1, 2))("body")
-
-        # Make line endings significant
-        table.set_whitespace_chars(" \t")
+        The report is scanned as bytes, so that it can be a memory-mapped
+        file. Keys are the title of the table, values are the start and end
+        offsets of the table body in the report
+        """
 
-        result = {t.title: t.body for t in table.search_string(report_str)}
+        result = {}
+        pos = 0
+        while True:
+            m = _TABLE_START.search(report, pos)
+            if not m:
+                break
+            pos = m.end()
+
+            # Grab everything until the next horizontal line(s). Tables with
+            # column headings will have a horizontal line after the headings
+            # and at the end of the table. Odd tables without section headings
+            # will only have a single horizontal line. A blank line ends the
+            # table.
+            end = _TABLE_HLINE.match(report, pos).end()
+            segments = 0
+            while segments < 2:
+                rows = _TABLE_ROWS.match(report, end)
+                hline = _TABLE_HLINE.match(report, rows.end())
+                if not hline:
+                    break
+                end = hline.end()
+                segments += 1
+
+            if segments:
+                title = m.group(1).decode(cls._report_encoding).strip()
+                result[title] = (pos, end)
+                pos = end
 
         return result
 
     @classmethod
     def report_timing(cls, report_file: str) -> Dict[str, pd.DataFrame]:
-        return cls._report_to_df(cls._parse_tables, report_file)
+        return cls._report_to_df(cls._parse_tables, report_file, spans=True)
 
     @classmethod
     def report_resources(cls, report_file: str) -> Dict[str, pd.DataFrame]:
-        return cls._report_to_df(cls._parse_tables, report_file)
+        return cls._report_to_df(cls._parse_tables, report_file, spans=True)
 
-    @staticmethod
+    @classmethod
     def report_summary(
-        resources: pd.DataFrame, timing: Dict[str, pd.DataFrame]
+        cls, resources: pd.DataFrame, timing: Dict[str, pd.DataFrame]
     ) -> Dict[str, Union[int, float]]:
 
-        util = resources["Fitter Resource Utilization by Entity"].iloc[0]
+        freq = timing["Clocks"].set_index("Clock Name")["Frequency"]
+        fmax = timing[cls._slow_fmax_title(timing)]
+        fmax = fmax.set_index("Clock Name")["Restricted Fmax"]
 
-        resource_buckets = {
-            "lut": ["Logic Cells", "Combinational ALUTs"],
-            "reg": ["Dedicated Logic Registers"],
-            "blkmem": ["M9Ks", "M10Ks", "M20Ks"],
-            "dsp": ["DSP Elements", "DSP Blocks"],
-        }
+        return cls._summary(
+            resources["Fitter Resource Utilization by Entity"].iloc[0].to_dict(),
+            freq.to_dict(),
+            fmax.to_dict(),
+        )
+
+    @classmethod
+    def _summary(
+        cls, util: Dict[str, Any], freq: Dict[str, str], fmax: Dict[str, str]
+    ) -> Dict[str, Union[int, float]]:
+        """
+        The values of :meth:`report_summary`.
+
+        util is the top level row of the "Fitter Resource Utilization by
+        Entity" table. freq and fmax are the frequency and the restricted fmax
+        of each clock, including the unit.
+        """
 
         summary = {}  # type: Dict[str, Union[int, float]]
 
         # Resources in this table are mostly of the form 345.5 (123.3) and we
         # want the first (total) number
-        for k, v in resource_buckets.items():
-            key = util.index.intersection(v)[0]
-            cell = util.at[key]
-            summary[k] = int(str(cell).split()[0])
+        for k, v in cls._resource_buckets.items():
+            key = [c for c in util if c in v][0]
+            summary[k] = int(str(util[key]).split()[0])
 
         # Get a frequency like 175.0 MHz and just return the numeric part
-        freq = timing["Clocks"].set_index("Clock Name")["Frequency"]
-        summary["constraint"] = freq.str.split(expand=True)[0].astype(float).to_dict()
+        summary["constraint"] = {k: float(v.split()[0]) for k, v in freq.items()}
+        summary["fmax"] = {k: float(v.split()[0]) for k, v in fmax.items()}
 
-        # Find the Fmax summary table for the slowest corner, such as "Slow
-        # 1200mV 85C Model Fmax Summary". The voltage and temperature will
-        # depend on the device, so find the match with the highest
-        # temperature.
+        return summary
+
+    @staticmethod
+    def _slow_fmax_title(timing: Dict) -> str:
+        """
+        Find the Fmax summary table for the slowest corner, such as "Slow
+        1200mV 85C Model Fmax Summary". The voltage and temperature will
+        depend on the device, so find the match with the highest temperature.
+        """
 
         slow_fmax = re.compile(
             r"Slow (?P<voltage>\d+)mV (?P<temp>\d+)C Model Fmax Summary"
         )
         title_matches = [slow_fmax.match(title) for title in timing.keys()]
 
-        slow_title = max(
+        return max(
             [t for t in title_matches if t], key=lambda x: x.group("temp")
         ).string
 
-        fmax = timing[slow_title].set_index("Clock Name")["Restricted Fmax"]
-        series = fmax.str.split(expand=True)[0].astype(float)
-        summary["fmax"] = series.to_dict()
+    @classmethod
+    def _summarize_reports(cls, resource_rpt: str, timing_rpt: str) -> Dict:
+        resources = cls._report_to_tables(cls._parse_tables, resource_rpt, spans=True)
+        timing = cls._report_to_tables(cls._parse_tables, timing_rpt, spans=True)
+
+        table = resources["Fitter Resource Utilization by Entity"]
+        freq = cls._table_column(timing["Clocks"], "Clock Name", "Frequency")
+        fmax = cls._table_column(
+            timing[cls._slow_fmax_title(timing)], "Clock Name", "Restricted Fmax"
+        )
 
-        return summary
+        return cls._summary(dict(zip(table.columns, table.rows[0])), freq, fmax)
@@ -10,13 +10,45 @@ tools in separate modules.
 
 The tests in :mod:`tests/test_reporting.py` are the current best reference
 for use of the reporting modules.
+
+Pandas and pyparsing are only imported once a report is parsed, so importing
+the reporting modules is cheap. Callers that only need the values from
+:meth:`Reporting.report_summary` can use :meth:`Reporting.summarize`, which
+works on plain Python tables and does not need Pandas at all.
 """
 
+from __future__ import annotations
+
 import abc
+import csv
+import hashlib
+import importlib
 import io
+import json
 import logging
+import math
+import mmap
+import os
 import pathlib
-from typing import Dict, Union, Callable, Optional
+import pickle
+import tempfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Union,
+    Callable,
+    Optional,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -27,11 +59,121 @@ logger = logging.getLogger(__name__)
 # exception.
 import_msg = "Missing package %s. Was edalize installed with the reporting option? (pip install 'edalize[reporting]')"
 
-try:
-    import pandas as pd
-except ImportError as e:
-    logger.exception(import_msg, "pandas")
-    raise e
+
+def import_optional(name: str):
+    """
+    Import one of the optional packages needed for reporting.
+
+    Pandas and pyparsing take a long time to import, so they are imported by
+    the functions that need them rather than when the reporting modules are
+    imported. Modules that are already imported are looked up in sys.modules,
+    so calling this for every report is cheap.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        logger.exception(import_msg, name.split(".")[0])
+        raise
+
+
+class ReportCache(object):
+    """
+    On-disk cache of parsed reports.
+
+    Parsing large reports takes seconds, so the result of parsing a report is
+    stored in a central cache directory and reused as long as the report is
+    unchanged. Entries are keyed by a hash of the report contents together
+    with the parser and its version, so a modified report or an updated parser
+    never uses stale data.
+
+    When the cache grows beyond max_size bytes, the least recently used
+    entries are removed.
+
+    Enable the cache for all backends with::
+
+        Reporting.cache = ReportCache("/path/to/cache")
+    """
+
+    # Bump this when the format of the cache entries changes
+    VERSION = 1
+
+    def __init__(self, cache_dir: str, max_size: int = 2**30):
+        self.cache_dir = pathlib.Path(cache_dir)
+        self.max_size = max_size
+
+    @classmethod
+    def key(
+        cls, report: Union[str, bytes, mmap.mmap], parser: str, parser_version: int
+    ) -> str:
+        h = hashlib.sha256(f"{cls.VERSION}:{parser}:{parser_version}:".encode())
+        if isinstance(report, str):
+            report = report.encode("utf-8", "surrogateescape")
+        h.update(report)
+        return h.hexdigest()
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for key, or None if there is none"""
+        path = self.cache_dir / (key + ".pickle")
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning("Ignoring corrupt report cache entry {}".format(path))
+            return None
+        # Mark the entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store value for key and evict old entries if needed"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file that is renamed, so that concurrent
+        # readers and writers never see a partial entry
+        (fd, tmp) = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.cache_dir / (key + ".pickle"))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until max_size is met"""
+        entries = []
+        total = 0
+        for e in os.scandir(self.cache_dir):
+            if e.name.endswith(".pickle"):
+                try:
+                    st = e.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, e.path))
+                total += st.st_size
+
+        entries.sort()
+        for (_, size, path) in entries:
+            if total <= self.max_size:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+# A report table as plain Python data. columns is a tuple with the column
+# names, or None if the table has no header, and rows is a list of tuples with
+# the (string) cells of each row
+Table = namedtuple("Table", ["columns", "rows"])
 
 
 class Reporting(abc.ABC):
@@ -51,6 +193,13 @@ class Reporting(abc.ABC):
     # The separator used in report tables
     _table_sep = ";"  # type: str
 
+    # Version of the report parsers. Bump this in a subclass when its parsers
+    # change the tables they find, to invalidate cached results
+    _parser_version = 1  # type: int
+
+    # Optional ReportCache for parsed reports, shared by all backends
+    cache = None  # type: Optional[ReportCache]
+
     @staticmethod
     def period_to_freq(
         p: float, in_unit: str = "ns", out_unit: str = "MHz"
@@ -86,7 +235,7 @@ class Reporting(abc.ABC):
 
         # Try to handle a None or NaN period value (perhaps a missing value
         # from a report) and numbers as strings ("123.432")
-        if p and not pd.isna(float(p)):
+        if p and not math.isnan(float(p)):
             return 1 / (float(p) * period_exp * freq_exp)
         else:
             return None
@@ -207,6 +356,54 @@ class Reporting(abc.ABC):
         drop_na, but that's not ideal.
         """
 
+        (has_header, rows) = Reporting._split_table(
+            table_str, sep, hline, header_threshold
+        )
+
+        csv_lines = []
+        for row in rows:
+            # Quote the cell if it contains the new separator
+            new_line = [
+                '"{}"'.format(cell) if new_sep in cell else cell for cell in row
+            ]
+            csv_lines.append(new_sep.join(new_line))
+
+        table = "\n".join(csv_lines)
+
+        return {"header": has_header, "csv": table}
+
+    @staticmethod
+    def table_to_rows(
+        table_str: str,
+        sep: str = ";",
+        hline: str = "+",
+        header_threshold: int = 2,
+    ) -> Table:
+        """
+        Convert a report table to a :class:`Table` of plain Python data.
+
+        The table is cleaned up in the same way as by :meth:`table_to_csv`,
+        but the cells are returned as tuples of strings rather than as CSV.
+        """
+        (has_header, rows) = Reporting._split_table(
+            table_str, sep, hline, header_threshold
+        )
+        if has_header and rows:
+            return Table(tuple(rows[0]), [tuple(r) for r in rows[1:]])
+        return Table(None, [tuple(r) for r in rows])
+
+    @staticmethod
+    def _split_table(
+        table_str: str, sep: str, hline: str, header_threshold: int
+    ) -> Tuple[bool, List[List[str]]]:
+        """
+        Split a report table into rows of cells.
+
+        Returns whether the table has a header, and the rows with any multirow
+        header merged into the first row. See :meth:`table_to_csv` for the
+        details.
+        """
+
         all_lines = table_str.strip().splitlines()
         lines = [l for l in all_lines if not l.startswith(hline)]
 
@@ -223,7 +420,7 @@ class Reporting(abc.ABC):
         if hline_index == [0, len(all_lines) - 1] and len(lines) > header_threshold:
             has_header = False
 
-        csv_lines = []
+        rows = []
 
         for l in lines:
             # Remove leading and trailing whitespace and separators. Do this
@@ -233,19 +430,8 @@ class Reporting(abc.ABC):
 
             clean_line = l.strip().strip(sep)
 
-            # Split the line by the separator, clean any whitespace, and
-            # rejoin the line with the new separator. The cell will be quoted
-            # if it contains the new separator.
-
-            new_line = []
-            for cell in clean_line.split(sep):
-                clean_cell = cell.strip()
-                # Quote the cell if it contains the new separator
-                if new_sep in clean_cell:
-                    clean_cell = '"{}"'.format(clean_cell)
-                new_line.append(clean_cell)
-
-            csv_lines.append(new_sep.join(new_line))
+            # Split the line by the separator and clean any whitespace
+            rows.append([cell.strip() for cell in clean_line.split(sep)])
 
         # Identify header rows and merge them into a single row since Pandas
         # read_csv and other table tools don't seem to handle merging them.
@@ -253,27 +439,24 @@ class Reporting(abc.ABC):
         header_row_count = hline_index[1] - hline_index[0] - 1
 
         if has_header and header_row_count > 1:
-            head = [l.split(new_sep) for l in csv_lines[:header_row_count]]
+            head = rows[:header_row_count]
 
             new_head = []
 
             for c in range(len(head[0])):
                 new_col = []
                 for r in range(len(head)):
-                    new_col.append(head[r][c].strip())
+                    new_col.append(head[r][c])
                 new_head.append(" ".join(new_col).strip())
 
             # Remove the old header lines and insert the new one
-            del csv_lines[:header_row_count]
-            csv_lines.insert(0, new_sep.join(new_head))
+            rows[:header_row_count] = [new_head]
 
-        table = "\n".join(csv_lines)
-
-        return {"header": has_header, "csv": table}
+        return (has_header, rows)
 
     @classmethod
     def _report_to_df(
-        cls, parser: Callable[[str], Dict], report_file: str
+        cls, parser: Callable, report_file: str, spans: bool = False
     ) -> Dict[str, pd.DataFrame]:
         """
         Helper for reports returning a number of tables.
@@ -284,31 +467,195 @@ class Reporting(abc.ABC):
         :type parser: func
         :param report_file: Report file name
         :type report_file: str
+        :param spans: If True, parser instead finds the tables in the bytes of
+            a memory-mapped report and returns their (start, end) offsets.
+            Only the tables are then decoded, rather than the whole report
+        :type spans: bool
 
         :return: A dictionary with the table names as keys and values containing a
             Pandas DataFrame with the data from the ASCII table.
         :rtype: dict
         """
 
-        report = open(report_file, "r", encoding=cls._report_encoding).read()
+        return {
+            k: cls.table_to_df(v, sep=cls._table_sep)
+            for (k, v) in cls._read_tables(parser, report_file, spans)
+        }
+
+    @classmethod
+    def _report_to_tables(
+        cls, parser: Callable, report_file: str, spans: bool = False
+    ) -> Dict[str, Table]:
+        """
+        Pure Python version of :meth:`_report_to_df`.
+
+        :return: A dictionary with the table names as keys and :class:`Table`
+            values
+        """
+
+        return {
+            k: cls.table_to_rows(v, sep=cls._table_sep)
+            for (k, v) in cls._read_tables(parser, report_file, spans)
+        }
+
+    @classmethod
+    def _read_tables(
+        cls, parser: Callable, report_file: str, spans: bool
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Parse a report file and yield the title and text of each table.
+
+        See :meth:`_report_to_df` for the arguments.
+        """
+
+        if not spans:
+            report = open(report_file, "r", encoding=cls._report_encoding).read()
+            yield from cls._parse_report(parser, report).items()
+            return
 
-        tables = {}
-        for k, v in parser(report).items():
-            table = cls.table_to_csv(v, sep=cls._table_sep)
+        with open(report_file, "rb") as f:
+            # Empty files can't be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                for (k, (start, end)) in cls._parse_report(parser, buf).items():
+                    yield (k, buf[start:end].decode(cls._report_encoding or "utf-8"))
 
-            header = "infer" if table["header"] else None
+    @staticmethod
+    def table_to_df(
+        table_str: str,
+        sep: str = ";",
+        hline: str = "+",
+        header_threshold: int = 2,
+    ) -> pd.DataFrame:
+        """
+        Convert a report table to a DataFrame.
 
-            # Mypy wants some assurance we're passing a string and not a bool
-            # to StringIO. We need the new TypedDict here or just to use a
-            # string instead of a bool for the header
-            assert isinstance(table["csv"], str)
+        The table is cleaned up in the same way as by :meth:`table_to_csv`,
+        and the rows are then passed to the C parser of ``pandas.read_csv``,
+        which types all columns in one pass. The columns are named and typed
+        as if the CSV table had been read with ``pandas.read_csv``.
+        """
+
+        pd = import_optional("pandas")
+
+        (has_header, rows) = Reporting._split_table(
+            table_str, sep, hline, header_threshold
+        )
+
+        # Name the columns like read_csv does when it reads the header itself
+        names = None
+        if has_header and rows:
+            names = []
+            for (i, name) in enumerate(rows.pop(0)):
+                if not name:
+                    name = "Unnamed: {}".format(i)
+                (base, n) = (name, 0)
+                while name in names:
+                    n += 1
+                    name = "{}.{}".format(base, n)
+                names.append(name)
+
+            if not rows:
+                return pd.DataFrame(columns=names)
+
+        return pd.read_csv(
+            io.StringIO("\n".join(sep.join(row) for row in rows)),
+            sep=sep,
+            header=None,
+            names=names,
+            quoting=csv.QUOTE_NONE,
+        )
+
+    @staticmethod
+    def _to_numeric(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert the columns of a DataFrame to numbers where possible.
 
-            df = pd.read_csv(io.StringIO(table["csv"]), header=header)
+        All cells are converted in a single ``pandas.to_numeric`` call. A
+        column is converted if any of its cells is a number, and its other
+        cells become NaN. Columns of whole numbers without missing cells
+        become ints.
+        """
 
-            tables[k] = df
+        pd = import_optional("pandas")
+
+        if df.empty:
+            return df
+
+        values = df.to_numpy(dtype=object)
+        (nrows, ncols) = values.shape
+
+        # Column-major, so that the cells of each column are contiguous
+        cells = pd.Series(values.ravel(order="F"), dtype=object)
+        numbers = pd.to_numeric(cells, errors="coerce").to_numpy(dtype=float)
+        numbers = numbers.reshape(ncols, nrows)
+        is_int = (
+            cells.astype(str)
+            .str.fullmatch(r"[+-]?[0-9]+")
+            .to_numpy(dtype=bool)
+            .reshape(ncols, nrows)
+        )
+
+        result = df.copy()
+        for i in range(ncols):
+            column = numbers[i]
+            if pd.isna(column).all():
+                continue
+            if is_int[i].all():
+                result.isetitem(i, column.astype("int64"))
+            else:
+                result.isetitem(i, column)
+        return result
 
+    @classmethod
+    def _parse_report(cls, parser: Callable, report: Union[str, mmap.mmap]) -> Dict:
+        """
+        Parse a report, using the report cache if one is set up.
+        """
+        if cls.cache is None:
+            return parser(report)
+
+        key = cls.cache.key(
+            report, f"{parser.__module__}.{parser.__qualname__}", cls._parser_version
+        )
+        tables = cls.cache.get(key)
+        if tables is None:
+            tables = parser(report)
+            cls.cache.put(key, tables)
         return tables
 
+    @staticmethod
+    def _to_number(s: str) -> Union[int, float, str, None]:
+        """
+        Convert a table cell to an int or float if possible.
+
+        Empty cells are converted to None and other cells are returned as is.
+        """
+        if s == "":
+            return None
+        try:
+            return int(s)
+        except ValueError:
+            pass
+        try:
+            return float(s)
+        except ValueError:
+            return s
+
+    @staticmethod
+    def _table_column(table: Table, key: str, value: str) -> Dict[str, str]:
+        """
+        Map the cells in the key column of a :class:`Table` to the cells in
+        the value column of the same row.
+        """
+        k = table.columns.index(key)
+        v = table.columns.index(value)
+        column = {}  # type: Dict[str, str]
+        for row in table.rows:
+            column.setdefault(row[k], row[v])
+        return column
+
     @classmethod
     @abc.abstractmethod
     def report_summary(cls, resources, timing):
@@ -405,6 +752,141 @@ class Reporting(abc.ABC):
 
         result = {"summary": None, "resources": None, "timing": None}
 
+        reports = cls._find_reports(dir)
+        if not reports:
+            return result
+
+        resources = cls.report_resources(reports[0])
+        timing = cls.report_timing(reports[1])
+        summary = cls.report_summary(resources, timing)
+        result = {"summary": summary, "resources": resources, "timing": timing}
+        return result
+
+    @classmethod
+    def report_many(
+        cls,
+        dirs: Iterable[str],
+        workers: Optional[int] = None,
+        table: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Report on many build directories in parallel.
+
+        The reports in each directory are parsed in a pool of worker
+        processes, and the results are concatenated into a single DataFrame.
+        Directories where the reports are missing or can't be parsed are
+        logged and left out.
+
+        :param dirs: The directories containing the resource and timing
+            reports, e.g. one for each run of a parameter sweep
+        :type dirs: list(str)
+        :param workers: The number of worker processes. Defaults to the number
+            of CPUs. With a single worker the reports are parsed in this
+            process
+        :type workers: int
+        :param table: Name of a resource or timing table to concatenate
+            instead of the summaries
+        :type table: str
+
+        :return: Without table, a DataFrame with the :meth:`report_summary`
+            values indexed by run and clock, with one row for each clock in a
+            run. With table, the named table from each run, indexed by run and
+            the row number in the table. The run is the absolute path of the
+            directory, so runs in directories with the same name don't
+            collide.
+        :rtype: pandas.DataFrame
+        """
+
+        pd = import_optional("pandas")
+
+        dirs = [os.path.abspath(d) for d in dirs]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, min(workers, len(dirs)))
+
+        if workers == 1:
+            results = [_report_run(cls, d, table) for d in dirs]
+        else:
+            with ProcessPoolExecutor(workers) as executor:
+                chunksize = max(1, len(dirs) // (workers * 4))
+                results = list(
+                    executor.map(
+                        _report_run,
+                        [cls] * len(dirs),
+                        dirs,
+                        [table] * len(dirs),
+                        chunksize=chunksize,
+                    )
+                )
+
+        runs = [(d, r) for (d, r) in zip(dirs, results) if r is not None]
+
+        if table:
+            if not runs:
+                return pd.DataFrame()
+            return pd.concat(
+                [r for (_, r) in runs], keys=[d for (d, _) in runs], names=["run"]
+            )
+
+        rows = [row for (d, r) in runs for row in _summary_rows(d, r)]
+        return pd.DataFrame(
+            rows,
+            columns=[
+                "run",
+                "clock",
+                "lut",
+                "reg",
+                "blkmem",
+                "dsp",
+                "constraint",
+                "fmax",
+            ],
+        ).set_index(["run", "clock"])
+
+    @classmethod
+    def summarize(cls, dir: str) -> Optional[Dict]:
+        """
+        Report only the common summary format, as plain Python data.
+
+        This returns the same values as the "summary" key of :meth:`report`,
+        but backends that support it parse the reports into plain Python
+        tables rather than DataFrames, which avoids importing Pandas.
+
+        :param dir: The directory containing the resource and timing reports
+        :type dir: str
+
+        :return: The summary dictionary, see :meth:`report_summary`, or None
+            if the reports weren't found
+        :rtype: dict
+        """
+
+        reports = cls._find_reports(dir)
+        if not reports:
+            return None
+
+        return cls._summarize_reports(*reports)
+
+    @classmethod
+    def _summarize_reports(cls, resource_rpt: str, timing_rpt: str) -> Dict:
+        """
+        Summarise a resource and a timing report.
+
+        Backends override this to summarise the reports without Pandas. The
+        default falls back to the full reports.
+        """
+        resources = cls.report_resources(resource_rpt)
+        timing = cls.report_timing(timing_rpt)
+        return cls.report_summary(resources, timing)
+
+    @classmethod
+    def _find_reports(cls, dir: str) -> Optional[Tuple[str, str]]:
+        """
+        Find the resource and timing report in a directory.
+
+        :return: The resource and timing report file names, or None if there
+            isn't exactly one of each
+        """
+
         report_dir = pathlib.Path(dir)
         resource_rpt = list(report_dir.glob(cls._resource_rpt_pattern))
         timing_rpt = list(report_dir.glob(cls._timing_rpt_pattern))
@@ -417,10 +899,115 @@ class Reporting(abc.ABC):
                     len(resource_rpt), len(timing_rpt), dir
                 )
             )
+            return None
+
+        return (str(resource_rpt[0]), str(timing_rpt[0]))
+
+
+def _report_run(cls, dir: str, table: Optional[str]) -> Any:
+    """
+    Parse the reports in one directory for :meth:`Reporting.report_many`.
+
+    This runs in the worker processes, so it needs to be a module-level
+    function. Only the summary, or the requested table, is sent back to the
+    main process.
+    """
+    try:
+        if not table:
+            return cls.summarize(dir)
+
+        reports = cls._find_reports(dir)
+        if not reports:
+            return None
+        for tables in (cls.report_resources(reports[0]), cls.report_timing(reports[1])):
+            if table in tables:
+                return tables[table]
+        logger.error("Found no table {} in directory {}".format(table, dir))
+    except Exception as e:
+        logger.error("Failed to parse reports in directory {}: {}".format(dir, e))
+    return None
+
+
+def _summary_rows(run: str, summary: Dict) -> List[Dict]:
+    """
+    Flatten a summary to one row for each clock.
+    """
+    constraint = summary.get("constraint", {})
+    fmax = summary.get("fmax", {})
+    resources = {k: v for k, v in summary.items() if not k in ["constraint", "fmax"]}
+
+    clocks = list(constraint) + [c for c in fmax if not c in constraint]
+    if not clocks:
+        return [{"run": run, "clock": None, **resources}]
+
+    return [
+        {
+            "run": run,
+            "clock": c,
+            **resources,
+            "constraint": constraint.get(c),
+            "fmax": fmax.get(c),
+        }
+        for c in clocks
+    ]
+
+
+class JsonReporting(Reporting):
+    """
+    Base class for tools that write their results to a single JSON report.
+
+    The same file is used as the resource and the timing report, and it is
+    only decoded once for :meth:`report` and :meth:`summarize`. Subclasses
+    implement :meth:`_resource_tables`, :meth:`_timing_tables` and
+    :meth:`_summarize_json` on the decoded report, as well as
+    :meth:`report_summary`.
+    """
+
+    @staticmethod
+    def _load_report(report_file: str) -> Any:
+        """
+        Decode a JSON report with the C decoder of the json module.
+        """
+        with open(report_file, "rb") as f:
+            return json.load(f)
+
+    @classmethod
+    def _resource_tables(cls, report: Any) -> Dict[str, pd.DataFrame]:
+        """Resource tables from a decoded report"""
+        raise NotImplementedError
+
+    @classmethod
+    def _timing_tables(cls, report: Any) -> Dict[str, pd.DataFrame]:
+        """Timing tables from a decoded report"""
+        raise NotImplementedError
+
+    @classmethod
+    def _summarize_json(cls, report: Any) -> Dict:
+        """The values of :meth:`report_summary` from a decoded report"""
+        raise NotImplementedError
+
+    @classmethod
+    def report_resources(cls, report_file: str) -> Dict[str, pd.DataFrame]:
+        return cls._resource_tables(cls._load_report(report_file))
+
+    @classmethod
+    def report_timing(cls, report_file: str) -> Dict[str, pd.DataFrame]:
+        return cls._timing_tables(cls._load_report(report_file))
+
+    @classmethod
+    def report(cls, dir: str) -> Dict[str, pd.DataFrame]:
+        result = {"summary": None, "resources": None, "timing": None}
+
+        reports = cls._find_reports(dir)
+        if not reports:
             return result
 
-        resources = cls.report_resources(str(resource_rpt[0]))
-        timing = cls.report_timing(str(timing_rpt[0]))
+        report = cls._load_report(reports[0])
+        resources = cls._resource_tables(report)
+        timing = cls._timing_tables(report)
         summary = cls.report_summary(resources, timing)
-        result = {"summary": summary, "resources": resources, "timing": timing}
-        return result
+        return {"summary": summary, "resources": resources, "timing": timing}
+
+    @classmethod
+    def _summarize_reports(cls, resource_rpt: str, timing_rpt: str) -> Dict:
+        return cls._summarize_json(cls._load_report(resource_rpt))
@@ -3,8 +3,7 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
 import os
-from jinja2 import Environment, PackageLoader
-from edalize.utils import EdaCommands
+from edalize.utils import EdaCommands, get_jinja_env, write_if_changed
 
 # Jinja2 tests and filters, available in all templates
 def jinja_filter_param_value_str(value, str_quote_style="", bool_is_str=False):
@@ -40,14 +39,15 @@ class Edatool(object):
     def __init__(self):
         self.edam = None
         self.prev_nodes = set()
-        self.jinja_env = Environment(
-            loader=PackageLoader(__package__, "templates"),
-            trim_blocks=True,
-            lstrip_blocks=True,
-            keep_trailing_newline=True,
+        # Files in work_root written by update_config_file
+        self.config_files = []
+        self.jinja_env = get_jinja_env(
+            __package__,
+            {
+                "param_value_str": jinja_filter_param_value_str,
+                "generic_value_str": jinja_filter_param_value_str,
+            },
         )
-        self.jinja_env.filters["param_value_str"] = jinja_filter_param_value_str
-        self.jinja_env.filters["generic_value_str"] = jinja_filter_param_value_str
 
     def _require_tool_option(self, option_name):
         option = self.tool_options.get(option_name)
@@ -99,14 +99,9 @@ class Edatool(object):
         If these differ or file_name doesn't exist,
         write contents to file_name
         """
-        f = os.path.join(self.work_root, file_name)
-        if os.path.exists(f):
-            old_file = open(f, "r").read()
-        else:
-            old_file = None
-        if old_file != contents:
-            with open(f, "w") as _f:
-                _f.write(contents)
+        write_if_changed(os.path.join(self.work_root, file_name), contents)
+        if not file_name in self.config_files:
+            self.config_files.append(file_name)
 
     def set_default_target(self, target):
         self.default_target = target
@@ -4,7 +4,7 @@
 
 import logging
 from edalize.tools.edatool import Edatool
-from edalize.utils import EdaCommands
+from edalize.utils import EdaCommands, classify_file
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +47,22 @@ class Ghdl(Edatool):
                 analyze_options.remove(o)
                 break
 
+        # Classify every file once. VHDL files of the standards that ghdl
+        # supports are analyzed and the other files are passed on
+        _vhdlstandards = ("", "87", "93", "2008")
+
+        vhdl_files = []
+        unused_files = []
+        standards = set()
+        for f in self.files:
+            (language, vhdl_standard, _) = classify_file(f)
+            if language == "vhdl":
+                standards.add(vhdl_standard)
+                if vhdl_standard in _vhdlstandards:
+                    vhdl_files.append(f)
+                    continue
+            unused_files.append(f)
+
         if m:
             logger.warning(
                 "Analyze option "
@@ -59,15 +75,9 @@ class Ghdl(Edatool):
             # specifying 93c as std should allow 87 syntax
             # 2008 can't be combined so try to parse everthing with 08 std
 
-            has87 = has93 = has08 = False
-            for f in self.files:
-                file_type = f.get("file_type", "")
-                if file_type == "vhdlSource-87":
-                    has87 = True
-                elif file_type == "vhdlSource-93":
-                    has93 = True
-                elif file_type == "vhdlSource-2008":
-                    has08 = True
+            has87 = "87" in standards
+            has93 = "93" in standards
+            has08 = "2008" in standards
             stdarg = []
             if has08:
                 if has87 or has93:
@@ -89,8 +99,6 @@ class Ghdl(Edatool):
 
         analyze_options = " ".join(analyze_options)
 
-        _vhdltypes = ("vhdlSource", "vhdlSource-87", "vhdlSource-93", "vhdlSource-2008")
-
         libraries = {}
         library_options = "--work={lib} --workdir=./{lib}"
 
@@ -113,15 +121,11 @@ class Ghdl(Edatool):
 
         top_unit = top[-1]
 
-        unused_files = []
-        for f in self.files:
-            if f.get("file_type") in _vhdltypes:
-                # Files without a specified library will by added to
-                # libraries[self.default_library]
-                logical_name = f.get("logical_name", self.DEFAULT_LIBRARY)
-                libraries[logical_name] = libraries.get(logical_name, []) + [f["name"]]
-            else:
-                unused_files.append(f)
+        for f in vhdl_files:
+            # Files without a specified library will by added to
+            # libraries[self.default_library]
+            logical_name = f.get("logical_name", self.DEFAULT_LIBRARY)
+            libraries.setdefault(logical_name, []).append(f["name"])
 
         self.edam = edam.copy()
         self.edam["files"] = unused_files
@@ -3,7 +3,6 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
 from io import StringIO
-import os
 
 from edalize.tools.edatool import Edatool
 from edalize.utils import EdaCommands
@@ -60,8 +59,9 @@ class Icarus(Edatool):
 
             timescale = self.tool_options.get("timescale")
             if timescale:
-                with open(os.path.join(self.work_root, "timescale.v"), "w") as tsfile:
-                    tsfile.write("`timescale {}\n".format(timescale))
+                self.update_config_file(
+                    "timescale.v", "`timescale {}\n".format(timescale)
+                )
                 scr_file.write("timescale.v\n")
 
             for f in self.files:
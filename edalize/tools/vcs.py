@@ -6,7 +6,7 @@ import logging
 from pathlib import Path
 
 from edalize.tools.edatool import Edatool
-from edalize.utils import EdaCommands
+from edalize.utils import EdaCommands, parse_file_type
 
 logger = logging.getLogger(__name__)
 
@@ -68,30 +68,39 @@ class Vcs(Edatool):
         self.target_files = []
         self.user_files = []
 
+        # Classify every file once. The language is used here and in the
+        # two-stage or three-stage setup
+        languages = {
+            id(f): parse_file_type(f.get("file_type", "")).language for f in self.files
+        }
+
         incdirs = []
         include_files = []
-        unused_files = self.files.copy()
+        used_files = set()
         self.sim_setup_files = []
         # Get all include dirs. Move include files to a separate list
         for f in self.files:
             if not "simulation" in f.get("tags", ["simulation"]):
                 continue
             file_type = f.get("file_type", "")
-            if file_type.startswith("verilogSource") or file_type.startswith(
-                "systemVerilogSource"
-            ):
+            if languages[id(f)] in ("verilog", "systemVerilog"):
                 if self._add_include_dir(f, incdirs, force_slash=True):
                     include_files.append(f["name"])
-                    unused_files.remove(f)
+                    used_files.add(id(f))
             elif file_type == "synopsys_sim_setup":
                 self.sim_setup_files.append(f["name"])
-                unused_files.remove(f)
+                used_files.add(id(f))
+        unused_files = [f for f in self.files if not id(f) in used_files]
 
         full64 = [] if self.tool_options.get("32bit") else ["-full64"]
         if self.tool_options.get("2_stage_flow"):
-            self._twostage_setup(edam, incdirs, include_files, unused_files, full64)
+            self._twostage_setup(
+                edam, incdirs, include_files, unused_files, full64, languages
+            )
         else:
-            self._threestage_setup(edam, incdirs, include_files, unused_files, full64)
+            self._threestage_setup(
+                edam, incdirs, include_files, unused_files, full64, languages
+            )
 
         self.edam = edam.copy()
         self.edam["files"] = unused_files
@@ -124,29 +133,31 @@ class Vcs(Edatool):
         )
         self.commands.set_default_target(binary_name)
 
-    def _twostage_setup(self, edam, incdirs, include_files, unused_files, full64):
+    def _twostage_setup(
+        self, edam, incdirs, include_files, unused_files, full64, languages
+    ):
 
         user_files = []
 
         vlog_files = []
+        used_files = set()
         has_sv = False
-        for f in unused_files.copy():
+        for f in unused_files:
             if not "simulation" in f.get("tags", ["simulation"]):
                 continue
 
             fname = f.get("name")
 
             file_type = f.get("file_type", "")
-            if file_type.startswith("verilogSource") or file_type.startswith(
-                "systemVerilogSource"
-            ):
+            language = languages[id(f)]
+            if language in ("verilog", "systemVerilog"):
 
-                if file_type.startswith("systemVerilogSource"):
+                if language == "systemVerilog":
                     has_sv = True
 
                 vlog_files.append(fname)
-                unused_files.remove(f)
-            elif file_type.startswith("vhdlSource"):
+                used_files.add(id(f))
+            elif language == "vhdl":
                 logger.warning(
                     f"Only (system)Verilog supported in two-stage mode. Ignoring VHDL file {fname}"
                 )
@@ -157,6 +168,7 @@ class Vcs(Edatool):
                 logger.warning(
                     f"File-specific defines not supported in two-stage mode. Ignoring {fname}"
                 )
+        unused_files[:] = [f for f in unused_files if not id(f) in used_files]
 
         _args = []
         for k, v in self.vlogdefine.items():
@@ -180,16 +192,18 @@ class Vcs(Edatool):
         self.target_files = include_files + vlog_files
         self.vcs_files = vlog_files
 
-    def _threestage_setup(self, edam, incdirs, include_files, unused_files, full64):
+    def _threestage_setup(
+        self, edam, incdirs, include_files, unused_files, full64, languages
+    ):
         filegroups = []
         prev_fileopts = ("", "", "")  # file_type, logical_name, defines
-        for f in unused_files.copy():
+        used_files = set()
+        for f in unused_files:
             lib = f.get("logical_name", "work")
 
             file_type = f.get("file_type", "")
-            if file_type.startswith("verilogSource") or file_type.startswith(
-                "systemVerilogSource"
-            ):
+            language = languages[id(f)]
+            if language in ("verilog", "systemVerilog"):
 
                 vlog_defines = self.vlogdefine.copy()
                 vlog_defines.update(f.get("define", {}))
@@ -203,7 +217,7 @@ class Vcs(Edatool):
                     )
                 defines = " ".join(_args)
                 cmd = "vlogan"
-            elif file_type.startswith("vhdlSource"):
+            elif language == "vhdl":
                 cmd = "vhdlan"
             elif file_type == "user":
                 self.user_files.append(f["name"])
@@ -222,8 +236,9 @@ class Vcs(Edatool):
                 if fileopts != prev_fileopts:
                     filegroups.append((fileopts, []))
                 filegroups[-1][1].append(f["name"])
-                unused_files.remove(f)
+                used_files.add(id(f))
                 prev_fileopts = fileopts
+        unused_files[:] = [f for f in unused_files if not id(f) in used_files]
 
         cmds = []
         depfiles = []
@@ -234,7 +249,7 @@ class Vcs(Edatool):
                 depfiles += fg[1]
                 options = self.tool_options.get("analysis_options", []).copy()
                 if cmd == "vlogan":
-                    if file_type.startswith("systemVerilogSource"):
+                    if parse_file_type(file_type).language == "systemVerilog":
                         options.append("-sverilog")
                     options += self.tool_options.get("vlogan_options", [])
                     options += [defines]
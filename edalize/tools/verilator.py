@@ -3,9 +3,10 @@
 # SPDX-License-Identifier: BSD-2-Clause
 
 import os
+from functools import lru_cache
 
 from edalize.tools.edatool import Edatool
-from edalize.utils import EdaCommands
+from edalize.utils import EdaCommands, parse_file_type
 from edalize.verilator import Verilator as EdalizeVerilator
 
 
@@ -50,6 +51,20 @@ class Verilator(Edatool):
         },
     }
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _file_kind(file_type):
+        """How files of file_type are passed to Verilator: "vlog", "c", "vlt",
+        "uhdm" or None for unused files. Each file type is only classified
+        once."""
+        if parse_file_type(file_type).language in ("systemVerilog", "verilog"):
+            return "vlog"
+        elif file_type in ["cppSource", "systemCSource", "cSource"]:
+            return "c"
+        elif file_type in ["vlt", "uhdm"]:
+            return file_type
+        return None
+
     def setup(self, edam):
         super().setup(edam)
 
@@ -79,20 +94,18 @@ class Verilator(Edatool):
         unused_files = []
         depfiles = [verilator_file]
         for f in self.files:
-            file_type = f.get("file_type", "")
+            kind = self._file_kind(f.get("file_type", ""))
             depfile = True
-            if file_type.startswith("systemVerilogSource") or file_type.startswith(
-                "verilogSource"
-            ):
+            if kind == "vlog":
                 if not self._add_include_dir(f, incdirs):
                     vlog_files.append(f["name"])
-            elif file_type in ["cppSource", "systemCSource", "cSource"]:
+            elif kind == "c":
                 depfile = False
                 if not self._add_include_dir(f, incdirs):
                     opt_c_files.append(f["name"])
-            elif file_type == "vlt":
+            elif kind == "vlt":
                 vlt_files.append(f["name"])
-            elif file_type == "uhdm":
+            elif kind == "uhdm":
                 uhdm_files.append(f["name"])
             else:
                 unused_files.append(f)
@@ -7,10 +7,11 @@ import os.path
 import platform
 import re
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 from edalize.tools.edatool import Edatool
-from edalize.utils import EdaCommands
+from edalize.utils import EdaCommands, parse_file_type
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +90,30 @@ class Vivado(Edatool):
 
         return version
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _read_command(file_type):
+        """The command that reads files of file_type, or "" for files that
+        Vivado doesn't read. Each file type is only classified once."""
+        language = parse_file_type(file_type).language
+        if language == "verilog":
+            return "read_verilog"
+        elif language == "systemVerilog":
+            return "read_verilog -sv"
+        elif language == "vhdl":
+            if file_type == "vhdlSource-2008":
+                return "read_vhdl -vhdl2008"
+            return "read_vhdl"
+        return {
+            "tclSource": "source",
+            "edif": "read_edif",
+            "xci": "read_ip",
+            "xdc": "read_xdc",
+            "SDC": "read_xdc -unmanaged",
+            "mem": "read_mem",
+            "bd": "read_bd",
+        }.get(file_type, "")
+
     def setup(self, edam):
         """
         Configuration is the first phase of the build.
@@ -111,37 +136,19 @@ class Vivado(Edatool):
         dep_files = []
         for f in self.files:
             f["name"] = Path(f["name"]).as_posix()
-            file_type = f.get("file_type", "")
-            cmd = ""
-            if file_type.startswith("verilogSource"):
-                cmd = "read_verilog"
-            elif file_type.startswith("systemVerilogSource"):
-                cmd = "read_verilog -sv"
-            elif file_type == "tclSource":
-                cmd = "source"
-            elif file_type == "edif":
-                cmd = "read_edif"
+            cmd = self._read_command(f.get("file_type", ""))
+            if cmd == "read_edif":
                 edif_files.append(f["name"])
                 if not "no_link_design" in f.get("tags", []):
                     netlist_flow = True
-            elif file_type.startswith("vhdlSource"):
-                cmd = "read_vhdl"
-                if file_type == "vhdlSource-2008":
+            elif cmd.startswith("read_vhdl"):
+                if cmd.endswith("-vhdl2008"):
                     has_vhdl2008 = True
-                    cmd += " -vhdl2008"
                 if f.get("logical_name"):
                     cmd += " -library " + f["logical_name"]
-            elif file_type == "xci":
-                cmd = "read_ip"
+            elif cmd == "read_ip":
                 has_xci = True
-            elif file_type == "xdc":
-                cmd = "read_xdc"
-            elif file_type == "SDC":
-                cmd = "read_xdc -unmanaged"
-            elif file_type == "mem":
-                cmd = "read_mem"
-            elif file_type == "bd":
-                cmd = "read_bd"
+            elif cmd == "read_bd":
                 bd_files.append(f["name"])
 
             if cmd:
@@ -4,9 +4,10 @@
 
 import logging
 import os.path
+from functools import lru_cache
 
 from edalize.tools.edatool import Edatool
-from edalize.utils import EdaCommands
+from edalize.utils import EdaCommands, parse_file_type
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,22 @@ class Yosys(Edatool):
         },
     }
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _read_command(file_type):
+        """The command that reads files of file_type, or "" for files that
+        yosys doesn't read. Each file type is only classified once."""
+        language = parse_file_type(file_type).language
+        if language == "verilog":
+            return "read_verilog"
+        elif language == "systemVerilog":
+            return "read_verilog -sv"
+        elif file_type == "uhdm":
+            return "read_uhdm"
+        elif file_type == "tclSource":
+            return "source"
+        return ""
+
     def setup(self, edam):
         super().setup(edam)
 
@@ -51,17 +68,9 @@ class Yosys(Edatool):
         depfiles = []
         has_uhdm = False
         for f in self.files:
-            file_type = f.get("file_type", "")
-            cmd = ""
-            if file_type.startswith("verilogSource"):
-                cmd = "read_verilog"
-            elif file_type.startswith("systemVerilogSource"):
-                cmd = "read_verilog -sv"
-            elif file_type == "uhdm":
-                cmd = "read_uhdm"
+            cmd = self._read_command(f.get("file_type", ""))
+            if cmd == "read_uhdm":
                 has_uhdm = True
-            elif file_type == "tclSource":
-                cmd = "source"
 
             if "simulation" in f.get("tags", []):
                 cmd = ""
@@ -1,3 +1,17 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from collections import deque, namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
+
+from jinja2 import Environment, PackageLoader, TemplateRuntimeError, pass_context
+
+
 class EdaCommands(object):
     class Command(object):
         def __init__(
@@ -43,49 +57,610 @@ class EdaCommands(object):
     def set_default_target(self, target):
         self.default_target = target
 
+    def shell_commands(self, c):
+        """Return the commands of c as POSIX shell command strings
+
+        This is used by build runners that execute the commands without make.
+        Variables for the whole graph are exported in front of every command.
+        """
+        export_prefix = ""
+        for v in self.variables:
+            var = parse_make_variable(v)
+            if var:
+                export_prefix += f'export {var[0]}="{make_to_shell(var[1])}"; '
+
+        env_prefix = ""
+        if c.variables:
+            env_prefix += "env "
+            for key, value in c.variables.items():
+                env_prefix += f"{key}={value} "
+
+        return [
+            export_prefix
+            + make_to_shell(
+                f"$(EDALIZE_LAUNCHER) {env_prefix}{' '.join([str(x) for x in command])}"
+            )
+            for command in c.commands
+            if command
+        ]
+
+    def makefile(self, variables=None):
+        """Return the contents of a Makefile for the commands
+
+        variables replaces the variables of the graph if given. The Makefile is
+        built as a list of strings that is joined once at the end, so that the
+        time stays linear in the number of commands.
+        """
+        if variables is None:
+            variables = self.variables
+        if not self.default_target:
+            raise RuntimeError("Internal Edalize error. Missing default target")
+
+        out = [self.header]
+        out += [v + "\n" for v in variables]
+        if variables:
+            out.append("\n\n")
+        out.append(f"all: {self.default_target}\n")
+
+        for c in self.commands:
+            out.append(f"\n{' '.join(c.targets)}:")
+            out += [" " + d for d in c.depends]
+            if c.order_only_deps:
+                out.append(" |")
+                out += [" " + d for d in c.order_only_deps]
+            out.append("\n")
+
+            prefix = "\t$(EDALIZE_LAUNCHER) "
+            if c.variables:
+                prefix += "env " + "".join(
+                    f"{key}={value} " for key, value in c.variables.items()
+                )
+
+            for command in c.commands:
+                if command:
+                    out += [prefix, " ".join([str(x) for x in command]), "\n"]
+
+        return "".join(out)
+
     def write(self, outfile):
-        with open(outfile, "w") as f:
-            f.write(self.header)
-            for v in self.variables:
-                f.write(v + "\n")
-            if self.variables:
-                f.write("\n\n")
-            if not self.default_target:
-                raise RuntimeError("Internal Edalize error. Missing default target")
-
-            f.write(f"all: {self.default_target}\n")
-
-            for c in self.commands:
-                f.write(f"\n{' '.join(c.targets)}:")
-                for d in c.depends:
-                    f.write(" " + d)
-                if c.order_only_deps:
-                    f.write(" |")
-                    for d in c.order_only_deps:
-                        f.write(" " + d)
-
-                f.write("\n")
-
-                env_prefix = ""
-                if c.variables:
-                    env_prefix += "env "
-                    for key, value in c.variables.items():
-                        env_prefix += f"{key}={value} "
-
-                for command in c.commands:
-                    if command:
-                        f.write(
-                            f"\t$(EDALIZE_LAUNCHER) {env_prefix}{' '.join([str(x) for x in command])}\n"
-                        )
+        write_if_changed(outfile, self.makefile())
+
+
+class EdamFile(object):
+    """Compact record for a file in an EDAM
+
+    File types, logical names and core names are shared by many files and are
+    interned to only be stored once.
+    """
+
+    __slots__ = ("name", "file_type", "logical_name", "core")
+
+    def __init__(self, name, file_type, logical_name, core=None):
+        self.name = name
+        self.file_type = sys.intern(file_type)
+        self.logical_name = sys.intern(logical_name)
+        self.core = sys.intern(core) if isinstance(core, str) else core
+
+    def __repr__(self):
+        return f"EdamFile({self.name!r}, {self.file_type!r})"
+
+
+class FileSet(object):
+    """The files of an EDAM, split into source files and include directories
+
+    Include files are not kept as source files, but their directories are
+    added to incdirs. Source files are indexed by file type when the FileSet is
+    created, so that files of a certain type can be found without scanning all
+    files.
+    """
+
+    def __init__(self, files, force_slash=False):
+        self.files = []
+        self.incdirs = []
+        self._index = {}
+
+        for f in files:
+            if f.get("is_include_file"):
+                _incdir = f.get("include_path") or os.path.dirname(f["name"]) or "."
+                if force_slash:
+                    _incdir = _incdir.replace("\\", "/")
+                if not _incdir in self.incdirs:
+                    self.incdirs.append(_incdir)
+                continue
+            _name = f["name"]
+            if force_slash:
+                _name = _name.replace("\\", "/")
+            edam_file = EdamFile(
+                _name,
+                f.get("file_type", ""),
+                f.get("logical_name", ""),
+                f.get("core", None),
+            )
+            self._index.setdefault(edam_file.file_type, []).append(len(self.files))
+            self.files.append(edam_file)
+
+    def file_types(self):
+        """Return the file types of the source files in order of appearance"""
+        return list(self._index)
+
+    def _select(self, file_types):
+        indices = [self._index[t] for t in file_types if t in self._index]
+        if len(indices) == 1:
+            return [self.files[i] for i in indices[0]]
+        # Keep the original order when files of several types are selected
+        return [self.files[i] for i in sorted(i for l in indices for i in l)]
+
+    def by_type(self, *file_types):
+        """Return the source files with any of file_types, in EDAM order"""
+        return self._select(file_types)
+
+    def by_prefix(self, *prefixes):
+        """Return the source files where the file type starts with any of
+        prefixes, in EDAM order
+        """
+        return self._select([t for t in self._index if t.startswith(prefixes)])
+
+    def by_language(self, *languages):
+        """Return the source files of any of languages, in EDAM order
+
+        See FILE_TYPE_LANGUAGES for the language names
+        """
+        return self._select(
+            [t for t in self._index if parse_file_type(t).language in languages]
+        )
+
+    def has_type(self, file_type):
+        return file_type in self._index
+
+    def has_prefix(self, *prefixes):
+        return any(t.startswith(prefixes) for t in self._index)
+
+
+def write_if_changed(file_name, contents):
+    """Write contents to file_name unless the file already has these contents
+
+    Leaving an unchanged file alone keeps its modification time, so that make
+    doesn't consider targets that depend on it to be out of date. Returns True
+    if the file was written.
+    """
+    try:
+        with open(file_name, "r") as f:
+            if f.read() == contents:
+                return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+    with open(file_name, "w") as f:
+        f.write(contents)
+    return True
+
+
+# Language of the source file types that tools handle by language rather than
+# by exact file type. All versions of a file type, e.g. vhdlSource-93 and
+# vhdlSource-2008, are of the same language
+FILE_TYPE_LANGUAGES = {
+    "verilogSource": "verilog",
+    "systemVerilogSource": "systemVerilog",
+    "vhdlSource": "vhdl",
+    "cSource": "c",
+    "cppSource": "cpp",
+    "systemCSource": "systemC",
+}
+
+FileType = namedtuple("FileType", ["base", "language", "standard"])
+
+
+@lru_cache(maxsize=None)
+def parse_file_type(file_type):
+    """Split an EDAM file_type into a FileType
+
+    base is the file type without version, language is one of the values in
+    FILE_TYPE_LANGUAGES (or None for other file types) and standard is the
+    version suffix (or "" if there is none). vhdlSource-2008 is parsed into
+    FileType("vhdlSource", "vhdl", "2008").
+
+    There are only a handful of distinct file types in an EDAM, so each of them
+    is only parsed once, no matter how many files there are.
+    """
+    (base, _, standard) = file_type.partition("-")
+    return FileType(base, FILE_TYPE_LANGUAGES.get(base), standard)
+
+
+def classify_file(f):
+    """Return (language, standard, is_include) for an EDAM file
+
+    f is either a file dict from an EDAM or a file record with a file_type
+    attribute
+    """
+    if isinstance(f, dict):
+        ft = parse_file_type(f.get("file_type", ""))
+        return (ft.language, ft.standard, bool(f.get("is_include_file")))
+    ft = parse_file_type(f.file_type)
+    return (ft.language, ft.standard, False)
+
+
+def group_files(files):
+    """Group EDAM files by language in a single pass
+
+    Returns a dict from language to the files of that language, in EDAM order.
+    Files of other file types are grouped by their base file type. Include
+    files are kept in their groups. Use classify_file to tell them apart.
+    """
+    groups = {}
+    for f in files:
+        ft = parse_file_type(f.get("file_type", ""))
+        groups.setdefault(ft.language or ft.base, []).append(f)
+    return groups
 
 
 # Helper function to strip potential version from the end of a file_type (for example, converting
 # vhdlSource-2008 -> vhdlSource)
 def get_file_type(file_obj):
-    file_type = file_obj.file_type
+    return parse_file_type(file_obj.file_type).base
+
+
+# Matches the subset of make syntax that Edalize puts in generated commands:
+# escaped dollar signs, $(shell ...) function calls and $(VARIABLE) references
+_MAKE_SYNTAX = re.compile(r"\$\$|\$\(shell\s+|\$\((\w+)\)")
+
+# Matches "export FOO=bar", "set FOO=bar", "FOO = bar" and "FOO := bar"
+_MAKE_VARIABLE = re.compile(r"^\s*(?:export\s+|set\s+)?(\w+)\s*:?=\s*(.*)$")
+
+
+def make_to_shell(s):
+    """Translate make syntax in a command string to POSIX shell syntax
+
+    Build runners that don't go through make use this to execute the commands
+    in an EdaCommands object. $(shell cmd) becomes a command substitution,
+    $(VAR) becomes a shell variable expansion and $$ becomes a literal $.
+    """
+
+    def _replace(m):
+        if m.group(0) == "$$":
+            return "$"
+        if m.group(1):
+            return "${" + m.group(1) + "}"
+        return "$("
+
+    return _MAKE_SYNTAX.sub(_replace, s)
+
+
+def parse_make_variable(line):
+    """Split a variable definition from EdaCommands.variables
+
+    Returns a (name, value) tuple or None if the line is not a variable
+    definition
+    """
+    m = _MAKE_VARIABLE.match(line)
+    if not m:
+        return None
+    return (m.group(1), m.group(2).strip())
+
+
+# Name of the render context variable with the filters of a TemplateEnv
+_TEMPLATE_FILTERS = "__edalize_filters__"
+
+_jinja_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _get_package_jinja_env(package):
+    return Environment(
+        loader=PackageLoader(package, "templates"),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+    )
+
+
+def _context_filter(name, default):
+    """Return a filter that calls the filter called name from the render context
+
+    default is called for templates rendered without such a filter.
+    """
+
+    @pass_context
+    def dispatch(context, *args, **kwargs):
+        f = context.get(_TEMPLATE_FILTERS, {}).get(name, default)
+        if f is None:
+            raise TemplateRuntimeError(f"No filter named '{name}' found.")
+        return f(*args, **kwargs)
+
+    dispatch.context_filter = name
+    return dispatch
+
+
+class _TemplateFilters(dict):
+    """Filters of a TemplateEnv
+
+    Adding a filter makes sure that the shared environment has a filter with
+    that name that calls it from the render context.
+    """
+
+    def __init__(self, env, filters):
+        super().__init__()
+        self.env = env
+        self.update(filters)
+
+    def __setitem__(self, name, f):
+        super().__setitem__(name, f)
+        env_filter = self.env.filters.get(name)
+        if getattr(env_filter, "context_filter", None) == name:
+            return
+        with _jinja_lock:
+            env_filter = self.env.filters.get(name)
+            if getattr(env_filter, "context_filter", None) != name:
+                self.env.filters[name] = _context_filter(name, env_filter)
+                # Templates compiled before this call the old filter directly
+                self.env.cache.clear()
+
+    def update(self, filters):
+        for (name, f) in filters.items():
+            self[name] = f
+
+
+class _Template(object):
+    def __init__(self, template, filters):
+        self.template = template
+        self.filters = filters
+
+    def render(self, *args, **kwargs):
+        return self.template.render(
+            *args, **kwargs, **{_TEMPLATE_FILTERS: self.filters}
+        )
+
+
+class TemplateEnv(object):
+    """The templates of a package with filters of their own
+
+    All TemplateEnvs of a package use the same Jinja2 environment, so each
+    template is only loaded and compiled once. Filters added to the filters
+    dict are only used for templates rendered through this TemplateEnv.
+    """
+
+    def __init__(self, package, filters={}):
+        self.env = _get_package_jinja_env(package)
+        self.filters = _TemplateFilters(self.env, filters)
+
+    def get_template(self, name):
+        return _Template(self.env.get_template(name), self.filters)
+
+    def from_string(self, source):
+        return _Template(self.env.from_string(source), self.filters)
+
+
+def get_jinja_env(package, filters={}):
+    """Return a TemplateEnv for the templates directory in package"""
+    return TemplateEnv(package, filters)
+
+
+class RotatingLog(object):
+    """Binary log file that is rotated when it grows beyond max_bytes
+
+    When rotating, log_file is renamed to log_file.1, log_file.1 to
+    log_file.2 and so on. At most backup_count old files are kept.
+    """
+
+    def __init__(self, log_file, max_bytes=64 * 1024 * 1024, backup_count=3):
+        self.log_file = str(log_file)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._f = open(self.log_file, "ab")
+
+    def _rotate(self):
+        self._f.close()
+        for i in range(self.backup_count - 1, 0, -1):
+            src = f"{self.log_file}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.log_file}.{i + 1}")
+        if self.backup_count > 0:
+            os.replace(self.log_file, self.log_file + ".1")
+        self._f = open(self.log_file, "wb")
+
+    def write(self, data):
+        if self.max_bytes and self._f.tell() + len(data) > self.max_bytes:
+            self._rotate()
+        self._f.write(data)
+        self._f.flush()
+
+    def close(self):
+        self._f.close()
+
+
+# Number of lines of output to keep from commands that are run with run_tee
+# when the output is only needed to show why they failed
+OUTPUT_TAIL_LINES = 100
+
+
+def run_tee(
+    args,
+    cwd=None,
+    env=None,
+    check=False,
+    log_file=None,
+    callback=None,
+    echo=False,
+    tail_lines=None,
+):
+    """Run a command and stream its output line by line
+
+    Every line from stdout and stderr is passed on as soon as it is produced
+    to an optional RotatingLog (log_file), to callback(stream, line) where
+    stream is "stdout" or "stderr" and, if echo is set, to sys.stdout or
+    sys.stderr. If tail_lines is set, only the last tail_lines lines of each
+    stream are kept in memory.
+
+    Works like subprocess.run, with the output of the command in the stdout
+    and stderr attributes of the returned CompletedProcess, or the raised
+    CalledProcessError if check is set. With tail_lines, these only contain
+    the kept tail of the output.
+    """
+    lock = threading.Lock()
+    tails = {"stdout": deque(maxlen=tail_lines), "stderr": deque(maxlen=tail_lines)}
+
+    def _pump(name, stream, echo_to):
+        # Limit the line length to keep memory bounded even for output
+        # without newlines
+        for line in iter(lambda: stream.readline(1 << 20), b""):
+            tails[name].append(line)
+            with lock:
+                if log_file:
+                    log_file.write(line)
+                if callback:
+                    callback(name, line.decode(errors="replace"))
+                if echo_to:
+                    echo_to.write(line.decode(errors="replace"))
+                    echo_to.flush()
+
+    with subprocess.Popen(
+        args,
+        cwd=cwd,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    ) as process:
+        threads = [
+            threading.Thread(
+                target=_pump,
+                args=(name, stream, echo_to if echo else None),
+                daemon=True,
+            )
+            for (name, stream, echo_to) in [
+                ("stdout", process.stdout, sys.stdout),
+                ("stderr", process.stderr, sys.stderr),
+            ]
+        ]
+        try:
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            retcode = process.wait()
+        except:  # Including KeyboardInterrupt
+            process.kill()
+            raise
+
+    stdout = b"".join(tails["stdout"])
+    stderr = b"".join(tails["stderr"])
+    if check and retcode:
+        raise subprocess.CalledProcessError(
+            retcode, process.args, output=stdout, stderr=stderr
+        )
+    return subprocess.CompletedProcess(process.args, retcode, stdout, stderr)
+
+
+class ChromeTrace(object):
+    """Collect events in the Chrome Trace Event format
+
+    The resulting file can be opened in Perfetto (https://ui.perfetto.dev) or
+    chrome://tracing. Configure stages are placed in one process with a track
+    per thread, and build commands in another process with a track per
+    parallel job slot.
+    """
+
+    CONFIGURE_PID = 1
+    BUILD_PID = 2
+
+    def __init__(self):
+        self.events = []
+        self._threads = {}
+        self._lock = threading.Lock()
+
+    def _metadata(self, name, pid, tid, value):
+        self.events.append(
+            {"name": name, "ph": "M", "pid": pid, "tid": tid, "args": {"name": value}}
+        )
+
+    def _complete(self, name, cat, pid, tid, start, duration, args={}):
+        self.events.append(
+            {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "pid": pid,
+                "tid": tid,
+                "ts": round(start * 1e6),
+                "dur": round(duration * 1e6),
+                "args": args,
+            }
+        )
+
+    @contextmanager
+    def span(self, name, cat="configure", **args):
+        """Record the code executed inside the with block as a trace event"""
+        start = time.time()
+        try:
+            yield
+        finally:
+            duration = time.time() - start
+            with self._lock:
+                ident = threading.get_ident()
+                tid = self._threads.get(ident)
+                if tid is None:
+                    tid = self._threads[ident] = len(self._threads) + 1
+                    if tid == 1:
+                        self._metadata(
+                            "process_name", self.CONFIGURE_PID, 0, "configure"
+                        )
+                    self._metadata(
+                        "thread_name", self.CONFIGURE_PID, tid, f"thread {tid}"
+                    )
+                self._complete(
+                    name, cat, self.CONFIGURE_PID, tid, start, duration, args
+                )
+
+    def add_commands(self, records):
+        """Add build commands recorded by edalize.build_runners.stats
+
+        Commands are assigned to the first job slot that is free when they
+        start, which recreates the slots used by the build runner.
+        """
+        slots = []
+        for r in sorted(records, key=lambda r: r["start"]):
+            end = r["start"] + r["wall_time"]
+            for slot, slot_end in enumerate(slots):
+                if slot_end <= r["start"]:
+                    slots[slot] = end
+                    break
+            else:
+                slot = len(slots)
+                slots.append(end)
+            args = {"command": " ".join(r["command"]), "returncode": r["returncode"]}
+            if r["max_rss"] is not None:
+                args["max_rss"] = r["max_rss"]
+            self._complete(
+                r["target"],
+                "build",
+                self.BUILD_PID,
+                slot + 1,
+                r["start"],
+                r["wall_time"],
+                args,
+            )
+        if slots:
+            self._metadata("process_name", self.BUILD_PID, 0, "build")
+            for slot in range(len(slots)):
+                self._metadata(
+                    "thread_name", self.BUILD_PID, slot + 1, f"job {slot + 1}"
+                )
 
-    for i, c in enumerate(file_type):
-        if c == "-":
-            return file_type[0:i]
+    def write(self, trace_file, append=False):
+        """Write the events to trace_file
 
-    return file_type
+        With append set, the events are added to those already in trace_file
+        """
+        events = []
+        if append and os.path.exists(trace_file):
+            with open(trace_file) as f:
+                events = json.load(f)["traceEvents"]
+        # Track names from earlier writes are only kept once
+        seen = {(e["name"], e["pid"], e["tid"]) for e in events if e["ph"] == "M"}
+        for e in self.events:
+            if e["ph"] == "M":
+                key = (e["name"], e["pid"], e["tid"])
+                if key in seen:
+                    continue
+                seen.add(key)
+            events.append(e)
+        with open(trace_file, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
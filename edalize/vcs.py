@@ -39,14 +39,6 @@ Example snippet of a CAPI2 description file for VCS:
 
     argtypes = ["plusarg", "vlogdefine", "vlogparam"]
 
-    def _filelist_has_filetype(self, file_list, string, match_type="prefix"):
-        for f in file_list:
-            if match_type == "prefix" and f.file_type.startswith(string):
-                return True
-            elif match_type == "exact" and f.file_type == string:
-                return True
-        return False
-
     def configure_main(self):
         logger.warning(
             "This backend is deprecated and will eventually be removed. Please migrate to the flow API instead.  See https://edalize.readthedocs.io/en/latest/ref/migrations.html#migrating-from-the-tool-api-to-the-flow-api for more details."
@@ -81,11 +73,11 @@ Example snippet of a CAPI2 description file for VCS:
 
         vcs_options = self.tool_options.get("vcs_options", [])
 
-        (src_files, incdirs) = self._get_fileset_files(force_slash=True)
-        if self._filelist_has_filetype(src_files, "systemVerilog", match_type="prefix"):
+        fileset = self._get_fileset(force_slash=True)
+        if fileset.has_prefix("systemVerilog"):
             vcs_options.append("-sverilog")
 
-        if self._filelist_has_filetype(src_files, "verilog2001", match_type="exact"):
+        if fileset.has_type("verilog2001"):
             vcs_options.append("+v2k")
 
         template_vars = {
@@ -2,34 +2,115 @@
 Vivado-specific reporting routines
 """
 
-import io
-import logging
-from typing import Dict, Union, Optional
+from __future__ import annotations
 
-from edalize.reporting import Reporting
+import logging
+import re
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+)
+
+from edalize.reporting import Reporting, Table, import_optional
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
-# Reporting is an optional Edalize feature and its required packages may not
-# be installed unless Edalize was installed as edalize[reporting]. There is
-# currently reduced-functionality feedback, so if the module is used without
-# being properly installed log a hopefully helpful error before throwing the
-# exception.
-import_msg = "Missing package %s. Was edalize installed with the reporting option? (pip install 'edalize[reporting]')"
-
-# This would perhaps be cleaner but more complex with importlib
-
-try:
-    import pyparsing as pp
-except ImportError as e:
-    logger.exception(import_msg, "pyparsing")
-    raise e
-
-try:
-    import pandas as pd
-except ImportError as e:
-    logger.exception(import_msg, "pandas")
-    raise e
+# Whitespace that may surround the elements of the reports
+_REPORT_WS = " \t\r"
+_TIMING_WS = " \t"
+
+# Utilization report section headings, their underline and table lines
+_UTIL_TITLE = re.compile(r"[0-9.]+[ \t\r]*(.*)")
+_UTIL_RULE = re.compile(r"-+[ \t\r]*$")
+_UTIL_HLINE = re.compile(r"\+[-+]*[ \t\r]*$")
+
+# Timing summary section heading lines and the line under table headings
+_TIMING_RULE = re.compile(r"-+[ \t]*$")
+_TIMING_TITLE_ULINE = re.compile(r"\|[ \t]*-+[ \t]*$")
+_TIMING_HLINE = re.compile(r"[ \t]*-+(?:[ \t]+-+)+[ \t]*$")
+
+
+# Timing path records in the "Timing Details" section of a timing summary
+_PATH_CLOCKS = re.compile(r"\s*(From|To) Clock:\s+(\S+)")
+_PATH_SLACK = re.compile(r"Slack(?: \((\w+)\))?\s*:\s*(\S+)")
+_PATH_FIELD = re.compile(r"  (\w[\w ]*?):\s+(.*)")
+_NS = re.compile(r"\s*(-?(?:[0-9.]+|inf))(?:ns)?")
+
+# Columns of the DataFrame returned by report_timing_paths and the fields of
+# the path records they are taken from
+TIMING_PATH_COLUMNS = [
+    "from_clock",
+    "to_clock",
+    "path_group",
+    "delay_type",
+    "status",
+    "slack",
+    "startpoint",
+    "endpoint",
+    "path_type",
+    "requirement",
+    "data_path_delay",
+    "logic_levels",
+    "clock_path_skew",
+]
+
+_PATH_FIELDS = {
+    "Source": "startpoint",
+    "Destination": "endpoint",
+    "Path Group": "path_group",
+    "Path Type": "path_type",
+    "Requirement": "requirement",
+    "Data Path Delay": "data_path_delay",
+    "Logic Levels": "logic_levels",
+    "Clock Path Skew": "clock_path_skew",
+}
+
+
+def _ns(value: str) -> Optional[float]:
+    m = _NS.match(value)
+    return float(m.group(1)) if m else None
+
+
+def _is_blank(line: str, ws: str) -> bool:
+    return not line.strip(ws)
+
+
+def _skip_blank(lines, i: int, ws: str) -> int:
+    """Return the index of the first non-blank line from i"""
+    while i < len(lines) and _is_blank(lines[i], ws):
+        i += 1
+    return i
+
+
+def _util_table_rows(lines, start: int):
+    """
+    Find the rows of a utilization report table up to the next horizontal line.
+
+    Returns the rows, including the horizontal line, and the index of the
+    horizontal line, or None if there is a blank line between the rows.
+    """
+    i = _skip_blank(lines, start, _REPORT_WS)
+    first = i
+    while i < len(lines):
+        if _UTIL_HLINE.match(lines[i]):
+            rows = [l + "\n" for l in lines[first:i]]
+            if rows:
+                rows[0] = rows[0].lstrip(_REPORT_WS)
+            return (rows + [lines[i].rstrip(_REPORT_WS) + "\n"], i)
+        if i + 1 < len(lines) and _is_blank(lines[i + 1], _REPORT_WS):
+            return None
+        i += 1
+    return None
 
 
 class VivadoReporting(Reporting):
@@ -45,43 +126,65 @@ class VivadoReporting(Reporting):
         Find all of the section titles and tables in a Vivado utilization report.
 
         These are returned as a dict with the section titles as keys and the table as the value.
-        """
 
-        # Find section headings, discarding the number and following horizontal
-        # line. For example:
-        #
-        # 1.1 Summary of Registers by Type
-        # --------------------------------
+        The report is scanned line by line in a single pass. Sections look
+        like the following, with the section heading starting with a number,
+        an underline and a table following after one or more blank lines:
 
-        sec_num = pp.Suppress(pp.lineStart() + pp.Word(pp.nums + "."))
-        sec_title = sec_num + pp.SkipTo(pp.lineEnd())("title") + pp.lineEnd().suppress()
+        1.1 Summary of Registers by Type
+        --------------------------------
 
-        # -------------------------------
-        sec_hline = pp.Suppress(pp.lineStart() + pp.Word("-") + pp.lineEnd())
-        sec_head = sec_title + sec_hline + pp.lineEnd().suppress()
+        +-------+--------------+-------------+--------------+
+        | Total | Clock Enable | Synchronous | Asynchronous |
+        +-------+--------------+-------------+--------------+
+        | 0     |            _ |           - |            - |
+        +-------+--------------+-------------+--------------+
 
-        # Tables use horizontal lines with like the following to mark column
-        # headings and the end of the table:
-        #
-        # +------+------+-------+
-
-        table_hline = pp.lineStart() + pp.Word("+", "-+") + pp.lineEnd()
-
-        # Tables may just be a header with no data rows, or a full header and
-        # data rows, so there will be one or two more horizontal lines.
-
-        data = pp.SkipTo(table_hline, fail_on=pp.lineEnd() * 2, include=True)
-
-        table = pp.Combine(table_hline + data * (1, 2))
-
-        section = sec_head + table("table")
-
-        # Make line endings significant
-        section.set_whitespace_chars(" \t")
-
-        table_dict = {x["title"]: x["table"] for x in section.search_string(util_str)}
+        Tables may just be a header with no data rows, or a full header and
+        data rows, so there will be two or three horizontal lines.
+        """
 
-        return table_dict
+        lines = util_str.split("\n")
+        n = len(lines)
+        tables = {}
+
+        i = 0
+        while i < n:
+            m = _UTIL_TITLE.match(lines[i])
+            if not m:
+                i += 1
+                continue
+
+            # The underline may be preceded by blank lines and must be
+            # followed by at least one
+            j = _skip_blank(lines, i + 1, _REPORT_WS)
+            if not (j + 1 < n and _UTIL_RULE.match(lines[j])):
+                i += 1
+                continue
+            if not _is_blank(lines[j + 1], _REPORT_WS):
+                i += 1
+                continue
+            j = _skip_blank(lines, j + 2, _REPORT_WS)
+            if not (j < n and _UTIL_HLINE.match(lines[j])):
+                i += 1
+                continue
+
+            table = [lines[j].rstrip(_REPORT_WS) + "\n"]
+            end = j
+            for _ in range(2):
+                group = _util_table_rows(lines, end + 1)
+                if not group:
+                    break
+                (rows, end) = group
+                table += rows
+            if end == j:
+                i += 1
+                continue
+
+            tables[m.group(1)] = "".join(table)
+            i = end + 1
+
+        return tables
 
     @staticmethod
     def _parse_timing_summary_tables(time_rpt: str):
@@ -91,11 +194,11 @@ class VivadoReporting(Reporting):
         This currently only handles basic tables such as "Design Timing
         Summary" and "Clock Summary". The more complex data in "Timing Details"
         such as worst paths, etc. isn't parsed.
-        """
 
-        # Make newlines widely significant but be careful not to effect others
-        saved_whitespace = pp.ParserElement.DEFAULT_WHITE_CHARS
-        pp.ParserElement.set_default_whitespace_chars(" \t")
+        The report is scanned line by line in a single pass, so unlike a
+        grammar with global parser settings it's safe to call from several
+        threads at once.
+        """
 
         # Extract table title ("Clock Summary") from a section heading like:
         #
@@ -103,135 +206,310 @@ class VivadoReporting(Reporting):
         # | Clock Summary
         # | -------------
         # --------------------------------------------------------------
-        sec_hline = pp.lineStart() + pp.Word("-") + pp.lineEnd()
-        sec_row_start = pp.lineStart() + pp.Literal("|").suppress()
-        sec_title = (
-            sec_row_start + pp.SkipTo(pp.lineEnd())("title") + pp.lineEnd().suppress()
-        )
-        sec_title_uline = sec_row_start + pp.Suppress(pp.Word("-") + pp.lineEnd())
-
-        section_head = sec_hline + sec_title + sec_title_uline + sec_hline
-
-        blank_line = pp.Suppress(pp.lineEnd() * 2)
-
-        # Tables are headings followed by lines and then data.
+        #
+        # Tables follow after one blank line. They are headings followed by
+        # lines and then data up to the next blank line.
         #
         # Clock  Waveform(ns)         Period(ns)      Frequency(MHz)
         # -----  ------------         ----------      --------------
         # clk    {0.000 2.500}        5.000           200.000
+        #
+        # The line under the headings has two or more groups of dashes, to
+        # avoid matching long single horizontal lines used elsewhere. It may
+        # be indented, as in "Design Timing Summary".
+
+        lines = time_rpt.split("\n")
+        n = len(lines)
+        tables = {}
+
+        i = 0
+        while i + 4 < n:
+            if not (
+                _TIMING_RULE.match(lines[i])
+                and lines[i + 1].startswith("|")
+                and _TIMING_TITLE_ULINE.match(lines[i + 2])
+                and _TIMING_RULE.match(lines[i + 3])
+                and _is_blank(lines[i + 4], _TIMING_WS)
+            ):
+                i += 1
+                continue
+
+            title = lines[i + 1][1:].lstrip(_TIMING_WS)
+
+            # Find the line under the headings. Give up on this section if
+            # there is a blank line before it
+            head = i + 5
+            hline = head
+            while hline < n and not _TIMING_HLINE.match(lines[hline]):
+                if hline + 1 < n and _is_blank(lines[hline + 1], _TIMING_WS):
+                    hline = n
+                hline += 1
+            if hline >= n:
+                i += 1
+                continue
+
+            # Data rows run until the next blank line
+            end = hline + 1
+            while end + 1 < n and not _is_blank(lines[end + 1], _TIMING_WS):
+                end += 1
+            if not (end < n and end + 1 < n):
+                i += 1
+                continue
+
+            table = []
+            if hline > head:
+                table.append(
+                    "\n".join(
+                        [lines[head].lstrip(_TIMING_WS)] + lines[head + 1 : hline]
+                    )
+                    + "\n"
+                )
+            table.append(lines[hline].lstrip(_TIMING_WS) + "\n")
+            table.append(
+                "\n".join(
+                    [lines[hline + 1].lstrip(_TIMING_WS)] + lines[hline + 2 : end + 1]
+                )
+            )
 
-        # Match two or more groups of dashes to avoid matching long single
-        # horizontal lines used elsewhere. Normally the spaces between the
-        # groups of dashes would be consumed, so get them back with
-        # original_text_for(). It would be safer to anchor this to the start of
-        # the line, but "Design Timing Summary" and perhaps others indent the
-        # table for some reason
-
-        table_hline = pp.original_text_for(pp.Word("-") * (2,) + pp.lineEnd())
+            tables[title] = "".join(table)
+            i = end + 1
 
-        # Get any header rows above the horizontal lines
-        table_head = pp.SkipTo(table_hline, fail_on=blank_line)
+        return tables
 
-        # Get everything from the horizontal lines to an empty line
-        table_body = pp.SkipTo(blank_line)
+    @classmethod
+    def report_resources(cls, report_file: str) -> Dict[str, pd.DataFrame]:
 
-        # The adjacent argument shouldn't be required but it doesn't match
-        # anything without it. It seems like the newline at the end of the
-        # heading row may not be getting included somehow.
+        return cls._report_to_df(cls._parse_utilization_tables, report_file)
 
-        table = pp.Combine(table_head + table_hline + table_body, adjacent=False)(
-            "table"
-        )
+    @staticmethod
+    def _split_timing_table(table_str: str) -> Table:
+        """
+        Split a table from a timing summary into its columns.
+
+        These tables don't have delimiters other than two or more spaces, and
+        cells like the clock waveforms contain single spaces. The column
+        positions are instead taken from the groups of dashes below the
+        header. Each cell is put in the column whose dashes it overlaps the
+        most, or the closest column if it doesn't overlap any of them. Empty
+        cells are empty strings.
+        """
 
-        section = section_head + pp.lineEnd().suppress() + table
+        lines = table_str.splitlines()
+        for i, l in enumerate(lines):
+            if l.strip() and not l.strip(" -"):
+                break
+        else:
+            return Table(None, [])
+
+        spans = [m.span() for m in re.finditer(r"-+", lines[i])]
+
+        def split(line):
+            cells = [""] * len(spans)
+            for m in re.finditer(r"\S+(?: \S+)*", line):
+                (start, end) = m.span()
+                col = max(
+                    range(len(spans)),
+                    key=lambda c: (
+                        min(end, spans[c][1]) - max(start, spans[c][0]),
+                        -abs(start - spans[c][0]),
+                    ),
+                )
+                cells[col] = (cells[col] + " " + m.group()).strip()
+            return tuple(cells)
+
+        head = [split(l) for l in lines[:i] if l.strip()]
+        columns = tuple(" ".join(h[c] for h in head).strip() for c in range(len(spans)))
+        return Table(columns, [split(l) for l in lines[i + 1 :] if l.strip()])
 
-        # Restore whitespace characters
-        pp.ParserElement.set_default_whitespace_chars(saved_whitespace)
+    @staticmethod
+    def _iter_timing_paths(lines: Iterable[str]) -> Iterator[Dict]:
+        """
+        Extract the path records from the lines of a timing summary report.
 
-        table_dict = {x["title"]: x["table"] for x in section.search_string(time_rpt)}
+        Each path in "Timing Details" starts with a slack line, followed by a
+        few fields and a blank line before the detailed path. For example:
 
-        return table_dict
+        Slack (VIOLATED) :        -3.463ns  (required time - arrival time)
+          Source:                 dout_shr_reg[306]/C
+                                    (rising edge-triggered cell FDRE clocked by clk ...)
+          Destination:            do
+          ...
+          Logic Levels:           1  (OBUF=1)
 
-    @classmethod
-    def report_resources(cls, report_file: str) -> Dict[str, pd.DataFrame]:
+        The paths are grouped by "From Clock:" and "To Clock:" headings and by
+        "Max Delay Paths" and "Min Delay Paths" subheadings. This yields a
+        dict with the keys in TIMING_PATH_COLUMNS for each path, one at a time.
+        """
 
-        return cls._report_to_df(cls._parse_utilization_tables, report_file)
+        clocks = {"From": None, "To": None}
+        delay_type = None
+        path = None
+
+        for line in lines:
+            line = line.rstrip("\r\n")
+
+            if path is not None:
+                if not line.strip():
+                    yield path
+                    path = None
+                    continue
+                m = _PATH_FIELD.match(line)
+                if m and m.group(1) in _PATH_FIELDS:
+                    path[_PATH_FIELDS[m.group(1)]] = m.group(2).strip()
+                continue
+
+            m = _PATH_SLACK.match(line)
+            if m:
+                path = dict.fromkeys(TIMING_PATH_COLUMNS)
+                path.update(
+                    from_clock=clocks["From"],
+                    to_clock=clocks["To"],
+                    delay_type=delay_type,
+                    status=m.group(1),
+                    slack=_ns(m.group(2)),
+                )
+                continue
+
+            if line.startswith("Max Delay Paths"):
+                delay_type = "max"
+            elif line.startswith("Min Delay Paths"):
+                delay_type = "min"
+            else:
+                m = _PATH_CLOCKS.match(line)
+                if m:
+                    clocks[m.group(1)] = m.group(2)
+                    delay_type = None
+
+        if path is not None:
+            yield path
 
     @classmethod
-    def report_timing(cls, report_file: str) -> Dict[str, pd.DataFrame]:
-
-        report = open(report_file, "r").read()
+    def report_timing_paths(cls, report_file: str) -> pd.DataFrame:
+        """
+        Timing paths from the "Timing Details" of a timing summary report.
 
-        timing = cls._parse_timing_summary_tables(report)
+        The report is read one line at a time, so that very large reports
+        don't need to fit in memory, and the paths are collected column by
+        column.
 
-        # Convert the list of tables into a dictionary keyed with the title
-        # and the value as a DataFrame.
-        #
-        # These tables don't have delimiters other than two or more spaces,
-        # but read_fwf seems to find the columns correctly. We'd like to
-        # eliminate the dashes that separate headings from data. The comment
-        # argument can do this, but that seems to prevent read_fwf from
-        # correctly guessing the column widths. Instead we'll just let them
-        # show up and then drop this row. It's row 0 in known examples, but
-        # this more carefully drops rows where all the column values are
-        # dashes.
-        #
-        # Currently read_fwf doesn't seem to be inferring data types
-        # correctly, leaving everything as objects and causing errors during
-        # arithmetic. The infer_objects() function doesn't seem to change
-        # anything, and convert_dtypes() just results in strings. Currently
-        # applying to_numeric to every column gives the best results.
+        :param report_file: The file name of the timing summary report
+        :type report_file: str
 
-        df_dict = {}
+        :return: A DataFrame with one row for each path and the columns in
+            TIMING_PATH_COLUMNS. The times are in ns.
+        :rtype: pandas.DataFrame
+        """
 
-        for k, v in timing.items():
-            df = pd.read_fwf(io.StringIO(v))
+        pd = import_optional("pandas")
 
-            # Drop the dashes separating the headers from data
-            #
-            # Find rows where all columns are dashes and get their indicies as
-            # a list
-            dash_row = df.apply(lambda s: s.str.match(r"^-+$", na=False)).all(
-                axis="columns"
-            )
-            dash_row_idx = dash_row[dash_row].index
+        columns = {c: [] for c in TIMING_PATH_COLUMNS}  # type: Dict[str, list]
+        with open(report_file, "r") as f:
+            for path in cls._iter_timing_paths(f):
+                for c in ("requirement", "data_path_delay", "clock_path_skew"):
+                    if path[c] is not None:
+                        path[c] = _ns(path[c])
+                if path["logic_levels"] is not None:
+                    path["logic_levels"] = int(path["logic_levels"].split()[0])
+                for k, v in path.items():
+                    columns[k].append(v)
 
-            # Drop the dashed rows and reset the index so that the separator
-            # rows don't leave holes in the index making indexing more
-            # difficult
-            df = df.drop(dash_row_idx).reset_index(drop=True)
+        df = pd.DataFrame(columns, columns=TIMING_PATH_COLUMNS)
+        return df.astype({"slack": float, "logic_levels": "Int64"})
 
-            # Convert numeric values that read_fwf doesn't seem to be
-            # handling, perhaps due to the dashes.
+    @classmethod
+    def report_timing(cls, report_file: str) -> Dict[str, pd.DataFrame]:
 
-            def try_to_numbers(s: pd.Series) -> pd.Series:
-                v = pd.to_numeric(s, errors="coerce")
-                if v.isnull().all():
-                    return s
-                else:
-                    return v
+        pd = import_optional("pandas")
 
-            df = df.apply(try_to_numbers)
+        df_dict = {}
 
+        for k, table in cls._timing_tables(report_file).items():
+            # Empty cells are missing values. Columns of empty tables are
+            # strings, as if read with read_csv
+            rows = [[c if c else None for c in row] for row in table.rows]
+            if rows:
+                df = cls._to_numeric(pd.DataFrame(rows, columns=table.columns))
+            else:
+                df = pd.DataFrame(columns=table.columns, dtype="str")
             df_dict[k] = df
 
         return df_dict
 
-    @staticmethod
+    @classmethod
+    def _timing_tables(cls, report_file: str) -> Dict[str, Table]:
+        """The tables of a timing summary, split into columns"""
+
+        report = open(report_file, "r").read()
+
+        timing = cls._parse_report(cls._parse_timing_summary_tables, report)
+        return {k: cls._split_timing_table(v) for k, v in timing.items()}
+
+    @classmethod
     def report_summary(
-        resources: Dict[str, pd.DataFrame], timing: Dict[str, pd.DataFrame]
+        cls, resources: Dict[str, pd.DataFrame], timing: Dict[str, pd.DataFrame]
+    ) -> Dict[str, Union[int, float, Dict[str, Optional[float]]]]:
+        def column(df, key, value):
+            # The first row for each key, with missing values as None
+            df = df.drop_duplicates(key).set_index(key)[value]
+            return df.astype(object).where(df.notna(), None).to_dict()
+
+        clocks = timing["Clock Summary"]
+        return cls._summary(
+            lambda table: column(resources[table], "Site Type", "Used"),
+            resources.keys(),
+            column(clocks, "Clock", "Frequency(MHz)"),
+            column(clocks, "Clock", "Period(ns)"),
+            column(timing["Intra Clock Table"], "Clock", "WNS(ns)"),
+        )
+
+    @classmethod
+    def _summarize_reports(cls, resource_rpt: str, timing_rpt: str) -> Dict:
+        resources = cls._report_to_tables(cls._parse_utilization_tables, resource_rpt)
+        timing = cls._timing_tables(timing_rpt)
+
+        def column(table, key, value):
+            return {
+                k: cls._to_number(v)
+                for k, v in cls._table_column(table, key, value).items()
+            }
+
+        clocks = timing["Clock Summary"]
+        return cls._summary(
+            lambda table: column(resources[table], "Site Type", "Used"),
+            resources.keys(),
+            column(clocks, "Clock", "Frequency(MHz)"),
+            column(clocks, "Clock", "Period(ns)"),
+            column(timing["Intra Clock Table"], "Clock", "WNS(ns)"),
+        )
+
+    @staticmethod
+    def _summary(
+        used: Callable[[str], Dict[str, Any]],
+        tables: Collection[str],
+        freq: Dict[str, Optional[float]],
+        period: Dict[str, Optional[float]],
+        wns: Dict[str, Optional[float]],
     ) -> Dict[str, Union[int, float, Dict[str, Optional[float]]]]:
+        """
+        The values of :meth:`report_summary`.
+
+        used(table) returns the used resources of each site type in a
+        utilization table, and tables are the titles of the utilization
+        tables. freq and period are the frequencies and periods of each clock
+        and wns the worst negative slack within each clock domain. Missing
+        values are None.
+        """
 
         summary = {}  # type: Dict[str, Union[int, float, Dict[str, Optional[float]]]]
 
         # Vivado uses different tables and row values for different families.
         # This at least works with the Artix 7 and Kintex Ultrascale+
 
-        if "Slice Logic" in resources:
+        if "Slice Logic" in tables:
             table = "Slice Logic"
             lut = "Slice LUTs"
             reg = "Slice Registers"
-        elif "CLB Logic" in resources:
+        elif "CLB Logic" in tables:
             table = "CLB Logic"
             lut = "CLB LUTs"
             reg = "CLB Registers"
@@ -239,48 +517,40 @@ class VivadoReporting(Reporting):
             logger.error("Can't find a table with LUT information")
             return summary
 
-        df = resources[table].set_index("Site Type")
-        summary["lut"] = df.loc[lut, "Used"].item()
-        summary["reg"] = df.loc[reg, "Used"].item()
+        logic = used(table)
+        summary["lut"] = logic[lut]
+        summary["reg"] = logic[reg]
 
-        if "Memory" in resources:
+        if "Memory" in tables:
             table = "Memory"
-        elif "BLOCKRAM" in resources:
+        elif "BLOCKRAM" in tables:
             table = "BLOCKRAM"
         else:
             logger.error("Can't find a table with memory information")
             return summary
 
-        df = resources[table].set_index("Site Type")
-        summary["blkmem"] = df.loc["Block RAM Tile", "Used"].item()
+        summary["blkmem"] = used(table)["Block RAM Tile"]
 
-        if "DSP" in resources:
+        if "DSP" in tables:
             table = "DSP"
-        elif "ARITHMETIC" in resources:
+        elif "ARITHMETIC" in tables:
             table = "ARITHMETIC"
         else:
-            logger.error("Can't find a table with memory information")
+            logger.error("Can't find a table with DSP information")
             return summary
 
-        df = resources[table].set_index("Site Type")
-        summary["dsp"] = df.loc["DSPs", "Used"].item()
+        summary["dsp"] = used(table)["DSPs"]
 
         # Return a dict indexed by the clock name
-        df = timing["Clock Summary"].set_index("Clock")
-
-        summary["constraint"] = df["Frequency(MHz)"].to_dict()
-
-        # Loadless clocks won't have a WNS entry which maps to NaN. This will
-        # be mapped to None by period_to_df which feels more appropriate.
-        # Pandas.Series.transform or apply feel like the most appropriate
-        # functions to use, but seem to interpret the returned None as a
-        # no-op, so the mapping is done when the returned dictionary is
-        # created.
-        period = timing["Clock Summary"].set_index("Clock")["Period(ns)"]
-        wns = timing["Intra Clock Table"].set_index("Clock")["WNS(ns)"]
-
-        summary["fmax"] = {
-            k: Reporting.period_to_freq(v) for k, v in (period - wns).to_dict().items()
-        }
+        summary["constraint"] = freq
+
+        # Loadless clocks don't have a WNS entry, and get an fmax of None
+        summary["fmax"] = {}
+        for k in list(period) + [k for k in wns if not k in period]:
+            p = period.get(k)
+            w = wns.get(k)
+            summary["fmax"][k] = (
+                None if p is None or w is None else Reporting.period_to_freq(p - w)
+            )
 
         return summary
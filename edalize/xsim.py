@@ -82,24 +82,32 @@ XSIM_OPTIONS  = {xsim_options}
     def _write_config_files(self):
         mfc = self.tool_options.get("compilation_mode") == "common"
         with open(os.path.join(self.work_root, self.name + ".prj"), "w") as f:
-            mfcu = []
+            fileset = self._get_fileset()
             (src_files, self.incdirs) = self._get_fileset_files()
-            for src_file in src_files:
+
+            # The prj command only depends on the file type, so it is looked up
+            # once for each file type in the FileSet
+            cmds = {}
+            for file_type in fileset.file_types():
                 cmd = ""
-                if src_file.file_type.startswith("verilogSource"):
+                if file_type.startswith("verilogSource"):
                     cmd = "verilog"
-                elif src_file.file_type == "vhdlSource-2008":
+                elif file_type == "vhdlSource-2008":
                     cmd = "vhdl2008"
-                elif src_file.file_type.startswith("vhdlSource"):
+                elif file_type.startswith("vhdlSource"):
                     cmd = "vhdl"
-                elif src_file.file_type.startswith("systemVerilogSource"):
-                    if mfc:
-                        mfcu.append(src_file.name)
-                    else:
+                elif file_type.startswith("systemVerilogSource"):
+                    if not mfc:
                         cmd = "sv"
-                elif src_file.file_type in ["user"]:
+                elif file_type in ["user"]:
                     pass
                 else:
+                    cmd = None
+                cmds[file_type] = cmd
+
+            for src_file in src_files:
+                cmd = cmds[src_file.file_type]
+                if cmd is None:
                     _s = "{} has unknown file type '{}'"
                     logger.warning(_s.format(src_file.name, src_file.file_type))
                 if cmd:
@@ -108,6 +116,9 @@ XSIM_OPTIONS  = {xsim_options}
                     else:
                         lib = "work"
                     f.write("{} {} {}\n".format(cmd, lib, src_file.name))
+            mfcu = [
+                src_file.name for src_file in fileset.by_prefix("systemVerilogSource")
+            ]
             if mfc:
                 f.write("sv work " + " ".join(mfcu))
 
@@ -0,0 +1,150 @@
+"""
+Yosys-specific reporting routines
+"""
+
+from __future__ import annotations
+
+import logging
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING, Any, Dict, Union
+
+from edalize.reporting import JsonReporting, import_optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class YosysReporting(JsonReporting):
+    """
+    Yosys-specific reporting routines.
+
+    These read the cell statistics written with ``tee -q -o <name>.stat.json
+    stat -json``. Yosys has no timing information, so the timing tables and
+    the clocks in the summary are empty.
+    """
+
+    # Override non-default class variables
+    _resource_rpt_pattern = "*.stat.json"
+    _timing_rpt_pattern = "*.stat.json"
+
+    # Patterns for the cell types counted for each summary resource, covering
+    # the generic cells and the cells of the common FPGA architectures
+    _resource_buckets = {
+        "lut": ["$lut", "SB_LUT4", "LUT[1-6]", "LUT6_2"],
+        "reg": ["$*dff*", "$_*DFF*", "SB_DFF*", "TRELLIS_FF", "FD[CPRS]E", "DFF*"],
+        "blkmem": ["$mem", "$mem_v2", "SB_RAM40_4K*", "SB_SPRAM256KA", "DP16KD"]
+        + ["PDPW16KD", "RAMB18E[12]", "RAMB36E[12]"],
+        "dsp": ["SB_MAC16", "MULT18X18D", "ALU54B", "DSP48E[12]"],
+    }
+
+    # Columns of the statistics table, in the order Yosys prints them
+    _statistics = [
+        "num_wires",
+        "num_wire_bits",
+        "num_pub_wires",
+        "num_pub_wire_bits",
+        "num_memories",
+        "num_memory_bits",
+        "num_processes",
+        "num_cells",
+        "area",
+    ]
+
+    @staticmethod
+    def _modules(report: Dict) -> Dict[str, Dict]:
+        """
+        The statistics of each module, without the backslash that Yosys puts
+        in front of public names, followed by the design totals if Yosys
+        printed them.
+        """
+        modules = {k.lstrip("\\"): v for k, v in report.get("modules", {}).items()}
+        if "design" in report:
+            modules["design"] = report["design"]
+        return modules
+
+    @classmethod
+    def _resource_tables(cls, report: Dict) -> Dict[str, pd.DataFrame]:
+        pd = import_optional("pandas")
+
+        modules = cls._modules(report)
+
+        cells = pd.DataFrame(
+            {k: v.get("num_cells_by_type", {}) for k, v in modules.items()},
+            columns=list(modules),
+        )
+        cells = cells.fillna(0).astype(int).rename_axis("cell type")
+
+        statistics = pd.DataFrame.from_dict(
+            {
+                k: {s: v[s] for s in cls._statistics if s in v}
+                for k, v in modules.items()
+            },
+            orient="index",
+        ).rename_axis("module")
+
+        return {"cells": cells, "statistics": statistics}
+
+    @classmethod
+    def _timing_tables(cls, report: Dict) -> Dict[str, pd.DataFrame]:
+        return {}
+
+    @classmethod
+    def _count_cells(cls, cells: Dict[str, int]) -> Dict[str, Union[int, None]]:
+        """
+        Add up the cells in each summary resource.
+
+        Resources without any matching cell types are None.
+        """
+        summary = {}  # type: Dict[str, Union[int, None]]
+        for k, patterns in cls._resource_buckets.items():
+            counts = [
+                n
+                for (t, n) in cells.items()
+                if any(fnmatchcase(t, p) for p in patterns)
+            ]
+            summary[k] = sum(counts) if counts else None
+        return summary
+
+    @classmethod
+    def report_summary(
+        cls, resources: Dict[str, pd.DataFrame], timing: Dict[str, pd.DataFrame]
+    ) -> Dict[str, Union[int, None, Dict[str, float]]]:
+
+        # Use the design totals if they are there. Otherwise add up the cells
+        # of all modules, which is right for a flattened design
+        cells = resources["cells"]
+        if "design" in cells.columns:
+            counts = cells["design"]
+        else:
+            counts = cells.sum(axis="columns")
+        counts = counts[counts > 0]
+
+        summary = {}  # type: Dict[str, Union[int, None, Dict[str, float]]]
+        summary.update(cls._count_cells({k: int(v) for k, v in counts.items()}))
+        summary["constraint"] = {}
+        summary["fmax"] = {}
+
+        return summary
+
+    @classmethod
+    def _summarize_json(cls, report: Dict) -> Dict:
+        modules = cls._modules(report)
+
+        # The same cells as in report_summary
+        if "design" in modules:
+            cells = dict(modules["design"].get("num_cells_by_type", {}))
+        else:
+            cells = {}  # type: Dict[str, int]
+            for m in modules.values():
+                for (t, n) in m.get("num_cells_by_type", {}).items():
+                    cells[t] = cells.get(t, 0) + n
+        cells = {t: n for (t, n) in cells.items() if n > 0}
+
+        summary = {}  # type: Dict[str, Any]
+        summary.update(cls._count_cells(cells))
+        summary["constraint"] = {}
+        summary["fmax"] = {}
+
+        return summary
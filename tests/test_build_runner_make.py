@@ -0,0 +1,46 @@
+import os
+
+from edalize.build_runners.make import Make
+
+from .test_build_runner_ninja import get_commands
+
+
+def test_make_write(tmp_path):
+    Make({}).write(get_commands(), tmp_path)
+
+    assert (tmp_path / "Makefile").read_text() == (
+        "#Auto generated by Edalize\n\n"
+        "export GREETING=hello\n"
+        "\n\n"
+        "all: post_build\n"
+        "\n"
+        "pre_build: \n"
+        "\n"
+        "a.txt: src.txt | pre_build\n"
+        "\t$(EDALIZE_LAUNCHER) sh -c 'echo $$GREETING > a.txt'\n"
+        "\n"
+        "b.txt: a.txt\n"
+        "\t$(EDALIZE_LAUNCHER) env NAME=world sh -c 'cat a.txt > b.txt'\n"
+        "\n"
+        "post_build: b.txt\n"
+    )
+    # The flow and the legacy API generate the same Makefile
+    get_commands().write(tmp_path / "Makefile.legacy")
+    assert (tmp_path / "Makefile.legacy").read_text() == (
+        tmp_path / "Makefile"
+    ).read_text()
+
+
+def test_make_unchanged(tmp_path):
+    runner = Make({})
+    runner.write(get_commands(), tmp_path)
+    os.utime(tmp_path / "Makefile", (0, 0))
+
+    runner.write(get_commands(), tmp_path)
+    assert os.stat(tmp_path / "Makefile").st_mtime == 0
+
+    commands = get_commands()
+    commands.add([], ["extra"], [])
+    runner.write(commands, tmp_path)
+    assert os.stat(tmp_path / "Makefile").st_mtime != 0
+    assert (tmp_path / "Makefile").read_text().endswith("\nextra:\n")
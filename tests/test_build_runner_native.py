@@ -0,0 +1,136 @@
+import os
+
+import pytest
+
+from edalize.build_runners.native import Native
+from edalize.utils import EdaCommands
+
+
+def get_commands():
+    commands = EdaCommands()
+    commands.add_env_var("GREETING", "hello")
+    commands.add([], ["pre_build"], [""])
+    commands.add(
+        ["sh", "-c", "'echo $$GREETING > a.txt'"],
+        ["a.txt"],
+        ["src.txt"],
+        order_only_deps=["pre_build"],
+    )
+    commands.add(
+        ["sh", "-c", "'echo $(NAME) > b.txt'"],
+        ["b.txt"],
+        ["src.txt"],
+        variables={"NAME": "world"},
+    )
+    commands.add(
+        ["sh", "-c", "'cat a.txt b.txt > c.txt'"], ["c.txt"], ["a.txt", "b.txt"]
+    )
+    commands.add([], ["post_build"], ["c.txt"])
+    commands.set_default_target("post_build")
+    return commands
+
+
+def test_native_build(tmp_path):
+    (tmp_path / "src.txt").write_text("src")
+    runner = Native({"build_jobs": 2})
+    runner.write(get_commands(), tmp_path)
+
+    results = runner.build(tmp_path)
+
+    assert (tmp_path / "c.txt").read_text() == "hello\nworld\n"
+    assert sorted(results) == ["a.txt", "b.txt", "c.txt"]
+    assert all(r["returncode"] == 0 for r in results.values())
+
+
+def test_native_up_to_date(tmp_path):
+    (tmp_path / "src.txt").write_text("src")
+    runner = Native({})
+    runner.write(get_commands(), tmp_path)
+    runner.build(tmp_path)
+
+    # Nothing changed. Nothing should be rebuilt
+    assert runner.build(tmp_path) == {}
+
+    # Only the command depending on b.txt should rerun
+    os.utime(tmp_path / "b.txt", (0, os.stat(tmp_path / "c.txt").st_mtime + 10))
+    assert list(runner.build(tmp_path, ["c.txt"])) == ["c.txt"]
+
+
+def test_native_missing_source(tmp_path):
+    runner = Native({})
+    runner.write(get_commands(), tmp_path)
+
+    with pytest.raises(RuntimeError, match="No rule to make target 'src.txt'"):
+        runner.build(tmp_path)
+
+
+def test_native_failing_command(tmp_path):
+    commands = EdaCommands()
+    commands.add(["false"], ["fail"], [])
+    commands.set_default_target("fail")
+    runner = Native({})
+    runner.write(commands, tmp_path)
+
+    with pytest.raises(RuntimeError, match="exited with an error: 1"):
+        runner.build(tmp_path)
+    assert runner.results["fail"]["returncode"] == 1
+
+
+def test_native_cycle(tmp_path):
+    commands = EdaCommands()
+    commands.add(["true"], ["a"], ["b"])
+    commands.add(["true"], ["b"], ["a"])
+    commands.set_default_target("a")
+    runner = Native({})
+    runner.write(commands, tmp_path)
+
+    with pytest.raises(RuntimeError, match="a -> b -> a"):
+        runner.build(tmp_path)
+
+
+def test_native_cache(tmp_path):
+    cache_dir = tmp_path / "cache"
+    flow_options = {"build_cache": str(cache_dir)}
+    for d in ["w1", "w2", "w3"]:
+        (tmp_path / d).mkdir()
+    (tmp_path / "w1" / "src.txt").write_text("src")
+    (tmp_path / "w2" / "src.txt").write_text("src")
+    (tmp_path / "w3" / "src.txt").write_text("changed")
+
+    runner = Native(flow_options)
+    runner.write(get_commands(), tmp_path / "w1")
+    results = runner.build(tmp_path / "w1")
+    assert not any(r["cached"] for r in results.values())
+
+    # Identical command lines and dependency contents are restored from cache
+    runner.write(get_commands(), tmp_path / "w2")
+    results = runner.build(tmp_path / "w2")
+    assert all(r["cached"] for r in results.values())
+    assert (tmp_path / "w2" / "c.txt").read_text() == "hello\nworld\n"
+
+    # a.txt and b.txt depend on src.txt and must be rerun. c.txt only depends
+    # on their unchanged contents
+    runner.write(get_commands(), tmp_path / "w3")
+    results = runner.build(tmp_path / "w3")
+    assert {k: r["cached"] for k, r in results.items()} == {
+        "a.txt": False,
+        "b.txt": False,
+        "c.txt": True,
+    }
+
+
+def test_native_quiet(tmp_path, capfd, caplog):
+    commands = EdaCommands()
+    commands.add(["echo", "hidden"], ["ok"], [])
+    commands.add(["sh", "-c", "'echo oops >&2; false'"], ["fail"], ["ok"])
+    commands.set_default_target("fail")
+    runner = Native({})
+    runner.write(commands, tmp_path)
+
+    with pytest.raises(RuntimeError, match="exited with an error: 1"):
+        runner.build(tmp_path, quiet=True)
+
+    # Output is only logged for the failing command
+    (out, err) = capfd.readouterr()
+    assert "hidden" not in out and "oops" not in err
+    assert "oops" in caplog.text and "hidden" not in caplog.text
@@ -0,0 +1,79 @@
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from edalize.build_runners.ninja import Ninja
+from edalize.utils import EdaCommands
+
+
+def get_commands():
+    commands = EdaCommands()
+    commands.add_env_var("GREETING", "hello")
+    commands.add([], ["pre_build"], [""])
+    commands.add(
+        ["sh", "-c", "'echo $$GREETING > a.txt'"],
+        ["a.txt"],
+        ["src.txt"],
+        order_only_deps=["pre_build"],
+    )
+    commands.add(
+        ["sh", "-c", "'cat a.txt > b.txt'"],
+        ["b.txt"],
+        ["a.txt"],
+        variables={"NAME": "world"},
+    )
+    commands.add([], ["post_build"], ["b.txt"])
+    commands.set_default_target("post_build")
+    return commands
+
+
+def test_ninja_write(tmp_path):
+    Ninja({}).write(get_commands(), tmp_path)
+
+    lines = (tmp_path / "build.ninja").read_text().splitlines()
+
+    assert "  restat = 1" in lines
+    assert "build pre_build: phony" in lines
+    assert "build a.txt: edalize src.txt || pre_build" in lines
+    assert (
+        "  cmd = export GREETING=\"hello\"; $${EDALIZE_LAUNCHER} sh -c 'echo $$GREETING > a.txt'"
+        in lines
+    )
+    assert (
+        "  cmd = export GREETING=\"hello\"; $${EDALIZE_LAUNCHER} env NAME=world sh -c 'cat a.txt > b.txt'"
+        in lines
+    )
+    assert "build post_build: phony b.txt" in lines
+    assert "build all: phony post_build" in lines
+    assert "default all" in lines
+
+
+def test_ninja_unchanged(tmp_path):
+    runner = Ninja({})
+    runner.write(get_commands(), tmp_path)
+    os.utime(tmp_path / "build.ninja", (0, 0))
+
+    runner.write(get_commands(), tmp_path)
+
+    assert os.stat(tmp_path / "build.ninja").st_mtime == 0
+
+
+def test_ninja_build_command():
+    assert Ninja({}).get_build_command() == ("ninja", [])
+    assert Ninja(
+        {"build_jobs": 4, "flow_ninja_options": ["-v"]}
+    ).get_build_command() == ("ninja", ["-j", "4", "-v"])
+
+
+@pytest.mark.skipif(not shutil.which("ninja"), reason="ninja not installed")
+def test_ninja_build(tmp_path):
+    (tmp_path / "src.txt").write_text("src")
+    runner = Ninja({})
+    runner.write(get_commands(), tmp_path)
+    (cmd, args) = runner.get_build_command()
+
+    subprocess.run([cmd] + args, cwd=tmp_path, check=True)
+
+    assert (tmp_path / "b.txt").read_text() == "hello\n"
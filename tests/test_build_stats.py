@@ -0,0 +1,126 @@
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from edalize.build_runners import stats
+from edalize.build_runners.make import Make
+from edalize.build_runners.native import Native
+from edalize.utils import EdaCommands
+
+
+def get_commands():
+    commands = EdaCommands()
+    commands.add(["sh", "-c", "'echo a > a.txt'"], ["a.txt"], [])
+    commands.add(
+        [["sh", "-c", "'echo b > b.txt'"], ["sh", "-c", "'echo c > c.txt'"]],
+        ["b.txt"],
+        ["a.txt"],
+    )
+    commands.add([], ["all_done"], ["b.txt"])
+    commands.set_default_target("all_done")
+    return commands
+
+
+def check_summary(stats_file):
+    summary = json.loads(stats_file.read_text())["targets"]
+    assert sorted(summary) == ["a.txt", "b.txt"]
+    assert summary["a.txt"]["commands"] == 1
+    assert summary["b.txt"]["commands"] == 2
+    for t in summary.values():
+        assert t["returncode"] == 0
+        assert t["wall_time"] >= 0
+        assert t["cpu_time"] >= 0
+        assert t["max_rss"] > 0
+    return summary
+
+
+def test_stats_native(tmp_path):
+    stats_file = tmp_path / stats.STATS_FILE
+    records_file = str(tmp_path / stats.RECORDS_FILE)
+    runner = Native({})
+    runner.write(get_commands(), tmp_path)
+    runner.build(tmp_path, env=stats.launcher_env(records_file))
+    stats.update_summary(stats_file, stats.read_records(records_file))
+
+    first = check_summary(stats_file)
+    assert not os.path.exists(records_file)
+
+    # Only the rebuilt target gets new statistics
+    (tmp_path / "b.txt").unlink()
+    runner.build(tmp_path, env=stats.launcher_env(records_file))
+    stats.update_summary(stats_file, stats.read_records(records_file))
+    second = check_summary(stats_file)
+    assert second["a.txt"] == first["a.txt"]
+    assert second["b.txt"]["start"] > first["b.txt"]["start"]
+
+
+@pytest.mark.skipif(not shutil.which("make"), reason="make not found")
+def test_stats_make(tmp_path):
+    stats_file = tmp_path / stats.STATS_FILE
+    records_file = str(tmp_path / stats.RECORDS_FILE)
+    Make({"build_stats": True}).write(get_commands(), tmp_path)
+    assert "export EDALIZE_TARGET = $@\n" in (tmp_path / "Makefile").read_text()
+
+    subprocess.run(
+        ["make"],
+        cwd=tmp_path,
+        env={**os.environ, **stats.launcher_env(records_file)},
+        check=True,
+    )
+    stats.update_summary(stats_file, stats.read_records(records_file))
+    check_summary(stats_file)
+
+
+def test_stats_failing_command(tmp_path, monkeypatch):
+    stats_file = tmp_path / stats.STATS_FILE
+    records_file = str(tmp_path / stats.RECORDS_FILE)
+    for k, v in stats.launcher_env(records_file).items():
+        monkeypatch.setenv(k, v)
+    monkeypatch.setenv("EDALIZE_TARGET", "fail")
+
+    assert stats.launch(["sh", "-c", "exit 3"]) == 3
+    assert stats.launch(["no_such_command_hopefully"]) == 127
+    stats.update_summary(stats_file, stats.read_records(records_file))
+
+    summary = json.loads(stats_file.read_text())["targets"]
+    assert summary["fail"]["returncode"] == 3
+    assert summary["fail"]["commands"] == 2
+
+
+def test_stats_only_for_build_commands(tmp_path):
+    import sys
+
+    from edalize.flows.edaflow import Edaflow
+
+    flow = object.__new__(Edaflow)
+    flow.verbose = False
+    flow.stdout = None
+    flow.stderr = None
+    flow.work_root = str(tmp_path)
+    flow.stats_file = str(tmp_path / stats.STATS_FILE)
+
+    script = "import os; print(os.environ.get('EDALIZE_LAUNCHER', ''))"
+
+    # Helper commands are not recorded
+    (_, stdout, _) = flow._run_tool(sys.executable, ["-c", script], quiet=True)
+    assert stdout.strip() == b""
+    assert not (tmp_path / stats.STATS_FILE).exists()
+
+    # Build commands are run through the launcher
+    flow._run_tool("sh", ["-c", "EDALIZE_TARGET=t $EDALIZE_LAUNCHER true"], stats=True)
+    summary = json.loads((tmp_path / stats.STATS_FILE).read_text())["targets"]
+    assert summary["t"]["returncode"] == 0
+
+    # Run commands are recorded as a whole, and the commands they start
+    # through the launcher are not recorded again
+    with pytest.raises(RuntimeError, match=r"\['sh', '-c', .*error: 2"):
+        flow._run_tool(
+            "sh", ["-c", "EDALIZE_TARGET=u $EDALIZE_LAUNCHER true; exit 2"], stats="run"
+        )
+    summary = json.loads((tmp_path / stats.STATS_FILE).read_text())["targets"]
+    assert sorted(summary) == ["run", "t"]
+    assert summary["run"]["commands"] == 1
+    assert summary["run"]["returncode"] == 2
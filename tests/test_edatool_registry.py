@@ -0,0 +1,43 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def test_edatool_names_lazy():
+    # Listing tools and resolving one must only import that backend
+    script = (
+        "import sys\n"
+        "from edalize.edatool import get_edatool, get_edatool_names\n"
+        "assert 'icarus' in get_edatool_names()\n"
+        "assert 'vivado' in get_edatool_names()\n"
+        "assert not 'reporting' in get_edatool_names()\n"
+        "assert not 'nextpnr_reporting' in get_edatool_names()\n"
+        "assert get_edatool('icarus').__name__ == 'Icarus'\n"
+        "assert 'edalize.icarus' in sys.modules\n"
+        "assert not 'edalize.vivado' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_edatool_cache():
+    from edalize.edatool import (
+        ToolResolutionError,
+        get_edatool,
+        get_edatool_map,
+        get_edatool_names,
+        invalidate_edatool_cache,
+    )
+
+    # All listed names are tools
+    assert set(get_edatool_map()) == set(get_edatool_names())
+
+    icarus = get_edatool("icarus")
+    assert get_edatool("icarus") is icarus
+    assert get_edatool_map()["icarus"].tool_class is icarus
+
+    invalidate_edatool_cache()
+    assert get_edatool("icarus") is icarus
+
+    with pytest.raises(ToolResolutionError):
+        get_edatool("nosuchtool")
@@ -0,0 +1,114 @@
+import pytest
+
+from edalize.utils import (
+    EdamFile,
+    FileSet,
+    FileType,
+    classify_file,
+    get_file_type,
+    group_files,
+    parse_file_type,
+)
+
+from .edalize_common import FILES, make_edalize_test
+
+
+def test_fileset():
+    fileset = FileSet(
+        [
+            {"name": "a.sv", "file_type": "systemVerilogSource"},
+            {
+                "name": "inc/b.vh",
+                "file_type": "verilogSource",
+                "is_include_file": True,
+            },
+            {"name": "c.vhd", "file_type": "vhdlSource-2008", "logical_name": "lib"},
+            {"name": "d.v", "file_type": "verilogSource"},
+            {"name": "e.sv", "file_type": "systemVerilogSource-2017"},
+            {"name": "f.xdc", "file_type": "xdc"},
+        ],
+        force_slash=True,
+    )
+
+    assert fileset.incdirs == ["inc"]
+    assert [f.name for f in fileset.files] == ["a.sv", "c.vhd", "d.v", "e.sv", "f.xdc"]
+    assert [f.name for f in fileset.by_type("systemVerilogSource")] == ["a.sv"]
+    # Files of several types are returned in their original order
+    assert [f.name for f in fileset.by_type("xdc", "verilogSource")] == ["d.v", "f.xdc"]
+    assert [f.name for f in fileset.by_prefix("systemVerilogSource", "vhdl")] == [
+        "a.sv",
+        "c.vhd",
+        "e.sv",
+    ]
+    assert [f.name for f in fileset.by_language("verilog", "vhdl")] == ["c.vhd", "d.v"]
+    assert fileset.by_type("user") == []
+    assert fileset.has_type("xdc") and not fileset.has_type("verilog2001")
+    assert fileset.has_prefix("vhdlSource") and not fileset.has_prefix("cSource")
+    assert fileset.file_types()[:2] == ["systemVerilogSource", "vhdlSource-2008"]
+
+    # Records have no per-instance dict and share interned strings
+    f = fileset.files[1]
+    assert f.logical_name == "lib" and f.core is None
+    with pytest.raises(AttributeError):
+        f.extra = True
+    g = EdamFile("x.vhd", "".join(["vhdlSource", "-2008"]), "lib")
+    assert g.file_type is f.file_type
+
+
+def test_get_fileset_files_cached(make_edalize_test):
+    tf = make_edalize_test("icarus")
+    backend = tf.backend
+
+    (src_files, incdirs) = backend._get_fileset_files()
+    assert len(src_files) + 3 == len(FILES)
+    assert incdirs == ["."]
+
+    # The FileSet is reused until the file list changes
+    assert backend._get_fileset() is backend._get_fileset()
+    assert backend._get_fileset(force_slash=True) is not backend._get_fileset()
+    fileset = backend._get_fileset()
+    backend.files = backend.files + [{"name": "new.v", "file_type": "verilogSource"}]
+    assert backend._get_fileset() is not fileset
+    assert backend._get_fileset_files()[0][-1].name == "new.v"
+
+    # Changes in place need an explicit invalidation
+    fileset = backend._get_fileset()
+    backend.files[-1]["name"] = "renamed.v"
+    assert backend._get_fileset() is fileset
+    backend._files_changed()
+    assert backend._get_fileset_files()[0][-1].name == "renamed.v"
+
+    # Edits to the returned records don't leak into the cached FileSet
+    backend._get_fileset_files()[0][-1].logical_name = "work"
+    assert backend._get_fileset_files()[0][-1].logical_name == ""
+
+
+def test_parse_file_type():
+    assert parse_file_type("vhdlSource-2008") == FileType("vhdlSource", "vhdl", "2008")
+    assert parse_file_type("systemVerilogSource") == FileType(
+        "systemVerilogSource", "systemVerilog", ""
+    )
+    assert parse_file_type("xdc") == FileType("xdc", None, "")
+    assert parse_file_type("") == FileType("", None, "")
+    # Each file type is only parsed once
+    assert parse_file_type("cppSource-11") is parse_file_type("cppSource-11")
+    assert get_file_type(EdamFile("a.vhd", "vhdlSource-93", "")) == "vhdlSource"
+
+
+def test_classify_and_group_files():
+    files = [
+        {"name": "a.vhd", "file_type": "vhdlSource-93"},
+        {"name": "b.vh", "file_type": "verilogSource", "is_include_file": True},
+        {"name": "c.xdc", "file_type": "xdc"},
+        {"name": "d.v", "file_type": "verilogSource-2005"},
+        {"name": "e.vhd", "file_type": "vhdlSource"},
+    ]
+    assert classify_file(files[0]) == ("vhdl", "93", False)
+    assert classify_file(files[1]) == ("verilog", "", True)
+    assert classify_file(files[2]) == (None, "", False)
+    assert classify_file(EdamFile("f.c", "cSource", "")) == ("c", "", False)
+
+    groups = group_files(files)
+    assert list(groups) == ["vhdl", "verilog", "xdc"]
+    assert [f["name"] for f in groups["vhdl"]] == ["a.vhd", "e.vhd"]
+    assert [f["name"] for f in groups["verilog"]] == ["b.vh", "d.v"]
@@ -0,0 +1,107 @@
+import pytest
+
+from edalize.flows.edaflow import Edaflow, FlowGraph
+from edalize.utils import EdaCommands
+
+
+def test_flow_graph_order():
+    # Nodes are added in sweeps over the dict, adding every node whose
+    # dependencies are already in the graph
+    graph = FlowGraph.fromdict(
+        {
+            "b": {"deps": ["a"], "tool": "icepack"},
+            "a": {"tool": "yosys"},
+            "c": {"deps": ["b"], "tool": "icetime"},
+            "d": {"deps": ["a"], "tool": "nextpnr"},
+        }
+    )
+
+    assert list(graph.get_nodes()) == ["a", "d", "b", "c"]
+    assert graph.get_node("c").deps == [graph.get_node("b")]
+    assert graph.get_node("c").tool == "icetime"
+
+
+def test_flow_graph_default_tool():
+    graph = FlowGraph.fromdict({"yosys": {}, "nextpnr": {"deps": ["yosys"]}})
+
+    assert graph.get_node("nextpnr").tool == "nextpnr"
+    assert graph.get_node("nextpnr").deps == [graph.get_node("yosys")]
+
+
+def test_flow_graph_missing_dep():
+    with pytest.raises(RuntimeError, match="'b' depends on 'x'"):
+        FlowGraph.fromdict({"a": {"tool": "yosys"}, "b": {"deps": ["x"]}})
+
+
+def test_flow_graph_cycle():
+    with pytest.raises(RuntimeError, match="Circular dependency b -> c -> b"):
+        FlowGraph.fromdict(
+            {
+                "a": {"tool": "yosys"},
+                "b": {"deps": ["a", "c"], "tool": "icepack"},
+                "c": {"deps": ["b"], "tool": "icetime"},
+            }
+        )
+
+
+class StubTool:
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+        self.edam = None
+
+    def setup(self, edam):
+        self.log.append(self.name)
+        # Like several real tools, modify the input EDAM in place
+        edam["files"].append({"name": self.name})
+        self.edam = edam
+        self.commands = EdaCommands()
+        self.commands.add([self.name], [self.name], [])
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_configure_tools_waves(tmp_path, parallel):
+    graph = FlowGraph.fromdict(
+        {
+            "a": {"tool": "yosys"},
+            "b": {"deps": ["a"], "tool": "yosys"},
+            "c": {"deps": ["a"], "tool": "yosys"},
+            "d": {"deps": ["b", "c"], "tool": "yosys"},
+        }
+    )
+    log = []
+    for name, node in graph.get_nodes().items():
+        node.inst = StubTool(name, log)
+
+    flow = Edaflow.__new__(Edaflow)
+    flow.edam = {"name": "design", "files": []}
+    flow.flow_options = {"parallel_configure": parallel}
+    flow.work_root = tmp_path
+    flow.commands = EdaCommands()
+    flow.configure_tools(graph)
+
+    # b and c may be set up in any order, but always after a and before d
+    assert log[0] == "a" and sorted(log[1:3]) == ["b", "c"] and log[3] == "d"
+    if not parallel:
+        assert log == ["a", "b", "c", "d"]
+    # Commands are collected in graph order
+    assert [c.targets for c in flow.commands.commands] == [["a"], ["b"], ["c"], ["d"]]
+    assert flow.commands.commands[0].order_only_deps == ["pre_build"]
+    # d sees the merged EDAMs from both branches
+    assert [f["name"] for f in graph.get_node("d").inst.edam["files"]] == [
+        "a",
+        "b",
+        "c",
+        "d",
+    ]
+    if parallel:
+        # Nodes that are set up concurrently get their own copy of the input
+        # EDAM
+        assert [f["name"] for f in graph.get_node("b").inst.edam["files"]] == [
+            "a",
+            "b",
+        ]
+        assert [f["name"] for f in graph.get_node("c").inst.edam["files"]] == [
+            "a",
+            "c",
+        ]
@@ -0,0 +1,80 @@
+import os
+import pickle
+
+from edalize.flows.edaflow import CONFIGURE_STATE_FILE
+
+from .edalize_common import compare_files
+from .edalize_flow_common import get_edam, get_flow
+
+CONFIG_FILES = [
+    "design.tcl",
+    "edalize_yosys_procs.tcl",
+    "edalize_yosys_template.tcl",
+    "Makefile",
+]
+
+REF_DIR = os.path.join(os.path.dirname(__file__), "flows", "vivado", "yosys")
+
+
+def configure(work_root, **flow_options):
+    edam = get_edam(
+        flow_options={
+            "part": "xc7a35tcsg324-1",
+            "synth": "yosys",
+            "incremental_configure": True,
+            **flow_options,
+        }
+    )
+    flow = get_flow("vivado")(edam, work_root)
+    flow.configure()
+    return flow
+
+
+def test_incremental_configure(tmp_path):
+    flow = configure(tmp_path)
+    assert flow._restored_nodes == set()
+    assert os.path.exists(tmp_path / CONFIGURE_STATE_FILE)
+    compare_files(REF_DIR, tmp_path, CONFIG_FILES)
+
+    # Nothing changed. All nodes are restored and config files are left alone
+    flow = configure(tmp_path)
+    assert flow._restored_nodes == {"yosys", "vivado"}
+    assert flow.flow.get_node("vivado").inst.edam["toplevel"] == "top_module"
+    compare_files(REF_DIR, tmp_path, CONFIG_FILES)
+
+    # A node with missing config files writes them again
+    os.remove(tmp_path / "design.tcl")
+    flow = configure(tmp_path)
+    assert flow._restored_nodes == {"yosys"}
+    compare_files(REF_DIR, tmp_path, CONFIG_FILES)
+
+    # Only the vivado node is affected by a vivado tool option
+    flow = configure(tmp_path, jobs=4)
+    assert flow._restored_nodes == {"yosys"}
+    assert os.path.exists(tmp_path / "design.tcl")
+
+    # Restored commands get the same pre_build dependencies as new ones
+    flow = configure(tmp_path)
+    assert flow._restored_nodes == {"yosys"}
+    compare_files(REF_DIR, tmp_path, CONFIG_FILES)
+
+
+def test_incremental_configure_corrupt_state(tmp_path):
+    (tmp_path / CONFIGURE_STATE_FILE).write_text("garbage")
+    flow = configure(tmp_path)
+    assert flow._restored_nodes == set()
+    compare_files(REF_DIR, tmp_path, CONFIG_FILES)
+
+
+def test_incremental_configure_no_config_files(tmp_path):
+    configure(tmp_path)
+
+    # Nodes that didn't record any config files are set up again, since
+    # there is no way to tell if their outputs are still there
+    state_file = tmp_path / CONFIGURE_STATE_FILE
+    saved = pickle.loads(state_file.read_bytes())
+    saved["nodes"]["yosys"] = saved["nodes"]["yosys"][:2] + ([],)
+    state_file.write_bytes(pickle.dumps(saved))
+
+    flow = configure(tmp_path)
+    assert flow._restored_nodes == {"vivado"}
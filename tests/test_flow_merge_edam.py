@@ -43,3 +43,23 @@ def test_merge_edam_scalar_conflict():
 def test_merge_edam_empty():
     edam = {"name": "design", "files": [{"name": "a.v"}]}
     assert merge_edam({}, edam) == edam
+
+
+def test_merge_edam_many():
+    common = [{"name": "common.v", "file_type": "verilogSource"}]
+    edams = [
+        {"files": common + [{"name": f"{x}.v", "file_type": "verilogSource"}]}
+        for x in "abc"
+    ]
+
+    merged = merge_edam(*edams)
+
+    assert [f["name"] for f in merged["files"]] == ["common.v", "a.v", "b.v", "c.v"]
+
+
+def test_merge_edam_unhashable():
+    # Entries that can't be hashed are still deduplicated
+    a = {"files": [{"name": "a.v", "tags": {"x"}}]}
+    b = {"files": [{"name": "a.v", "tags": {"x"}}, {"name": "b.v", "tags": {"y"}}]}
+
+    assert [f["name"] for f in merge_edam(a, b)["files"]] == ["a.v", "b.v"]
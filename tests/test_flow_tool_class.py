@@ -0,0 +1,29 @@
+import pytest
+
+from edalize.flows.edaflow import (
+    Edaflow,
+    get_tool_class,
+    get_tool_option_names,
+)
+
+
+def test_get_tool_class():
+    from edalize.tools.yosys import Yosys
+
+    assert get_tool_class("yosys") is Yosys
+    assert get_tool_option_names("yosys") == frozenset(Yosys.get_tool_options())
+
+
+def test_get_tool_class_missing():
+    with pytest.raises(RuntimeError, match="Could not find tool 'nosuchtool'"):
+        get_tool_class("nosuchtool")
+
+    with pytest.raises(RuntimeError, match="Could not find tool 'nosuchtool'"):
+        Edaflow.get_filtered_tool_options(["nosuchtool"], {})
+
+
+def test_get_filtered_tool_options():
+    opts = Edaflow.get_filtered_tool_options(["yosys"], {"yosys": {"arch": "ice40"}})
+
+    assert not "arch" in opts
+    assert opts["yosys_synth_options"]["tool"] == "yosys"
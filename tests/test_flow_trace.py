@@ -0,0 +1,76 @@
+import json
+
+from edalize.utils import ChromeTrace
+
+from .edalize_flow_common import flow_fixture
+
+
+def record(target, start, wall_time):
+    return {
+        "target": target,
+        "command": [target],
+        "start": start,
+        "wall_time": wall_time,
+        "max_rss": None,
+        "returncode": 0,
+    }
+
+
+def test_trace_configure(flow_fixture):
+    ff = flow_fixture("lint", flow_options={"tool": "verilator", "build_trace": True})
+    ff.flow.configure()
+
+    with open(ff.flow.trace_file) as f:
+        events = json.load(f)["traceEvents"]
+    names = [e["name"] for e in events if e["ph"] == "X"]
+    for stage in [
+        "configure_flow",
+        "extract_tool_options",
+        "configure_tools",
+        "verilator.setup",
+        "verilator.write_config_files",
+        "write_build_graph",
+    ]:
+        assert stage in names
+    assert all(e["dur"] >= 0 for e in events if e["ph"] == "X")
+
+    # The build runner needs to tell the launcher about the current target
+    with open(ff.flow.work_root / "Makefile") as f:
+        assert "export EDALIZE_TARGET = $@\n" in f.read()
+
+
+def test_trace_job_slots(tmp_path):
+    trace_file = tmp_path / "trace.json"
+    trace = ChromeTrace()
+    with trace.span("configure_flow"):
+        pass
+    trace.write(trace_file)
+
+    trace = ChromeTrace()
+    trace.add_commands(
+        [
+            record("c", 2.0, 1.0),
+            record("a", 0.0, 2.0),
+            record("b", 1.0, 3.0),
+            record("d", 4.0, 1.0),
+        ]
+    )
+    trace.write(trace_file, append=True)
+
+    with open(trace_file) as f:
+        events = json.load(f)["traceEvents"]
+    slots = {
+        e["name"]: e["tid"]
+        for e in events
+        if e["ph"] == "X" and e["pid"] == ChromeTrace.BUILD_PID
+    }
+    # c starts when a finishes and d when b finishes, reusing their slots
+    assert slots == {"a": 1, "b": 2, "c": 1, "d": 1}
+    assert [e["ts"] for e in events if e["name"] == "b"] == [1000000]
+    assert "configure_flow" in [e["name"] for e in events]
+    tracks = [
+        e["args"]["name"]
+        for e in events
+        if e["ph"] == "M" and e["name"] == "thread_name"
+    ]
+    assert tracks == ["thread 1", "job 1", "job 2"]
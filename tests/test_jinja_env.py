@@ -0,0 +1,34 @@
+from edalize.utils import get_jinja_env
+
+
+def test_jinja_env_shared_templates():
+    env1 = get_jinja_env("edalize.tools", {"f": str.upper})
+    env2 = get_jinja_env("edalize.tools", {"f": str.lower})
+
+    # Filters added by one user must not leak into the other environment
+    assert env1.filters["f"] is str.upper
+    assert env2.filters["f"] is str.lower
+    assert env1.from_string("{{ 'Ab' | f }}").render() == "AB"
+    assert env2.from_string("{{ 'Ab' | f }}").render() == "ab"
+
+    # Both use the same Jinja2 environment
+    assert env1.env is env2.env
+
+
+def test_jinja_env_template_filters():
+    # Templates are loaded once and rendered with the filters of the
+    # environment they are requested from
+    env1 = get_jinja_env("edalize.tools", {"param_value_str": lambda v: "one"})
+    env2 = get_jinja_env("edalize.tools", {"param_value_str": lambda v: "two"})
+    t1 = env1.get_template("vivado/vivado-project.tcl.j2")
+    t2 = env2.get_template("vivado/vivado-project.tcl.j2")
+
+    assert t1.template is t2.template
+
+    env1.filters["g"] = str.upper
+    t = env1.from_string("{{ 'a' | g }}{{ 'b' | upper }}")
+    assert t.render() == "AB"
+    # Built-in filters are still used without a filter of the same name
+    env2.filters["upper"] = str.title
+    assert env2.from_string("{{ 'ab' | upper }}").render() == "Ab"
+    assert t.render() == "AB"
@@ -1,3 +1,6 @@
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -78,6 +81,313 @@ def test_extra_reports(tmp_path):
     assert rpt == {"summary": None, "resources": None, "timing": None}
 
 
+def test_lazy_import():
+    """Importing the reporting modules doesn't import Pandas or pyparsing"""
+
+    code = (
+        "import sys\n"
+        "import edalize.vivado_reporting, edalize.quartus_reporting, edalize.ise_reporting\n"
+        "assert not 'pandas' in sys.modules\n"
+        "assert not 'pyparsing' in sys.modules\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.join(tests_dir, os.pardir),
+        check=True,
+    )
+
+
+@pytest.mark.parametrize(
+    "backend, data_dir",
+    [
+        ("quartus", "picorv32/quartus-cyclone4"),
+        ("quartus", "picorv32/quartus-cyclone10"),
+        ("quartus", "linux-on-litex-vexriscv/de10nano"),
+        ("ise", "picorv32/ise-spartan6"),
+        ("ise", "linux-on-litex-vexriscv/pipistrello"),
+        ("vivado", "picorv32/vivado-artix7/impl"),
+        ("vivado", "picorv32/vivado-kintex_usp/impl"),
+        ("nextpnr", "picorv32/nextpnr-ice40"),
+        ("nextpnr", "picorv32/nextpnr-ecp5"),
+        ("yosys", "picorv32/yosys-ice40"),
+        ("openroad", "picorv32/openroad-nangate45"),
+    ],
+)
+def test_summarize(backend, data_dir):
+    """The pure Python summary matches the summary from the DataFrames"""
+    import importlib
+
+    module = importlib.import_module(f"edalize.{backend}_reporting")
+    cls = getattr(module, backend.capitalize() + "Reporting")
+    data_dir = tests_dir + "/test_reporting/data/" + data_dir
+
+    summary = cls.summarize(data_dir)
+
+    check_types(summary, allowed=[int, float, str, type(None)])
+    assert round_fmax(summary, 4) == round_fmax(cls.report(data_dir)["summary"], 4)
+
+
+def test_summarize_missing_reports(tmp_path):
+    from edalize.reporting import Reporting
+
+    assert Reporting.summarize(str(tmp_path)) is None
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_report_many(workers, tmp_path):
+    from edalize.quartus_reporting import QuartusReporting
+
+    data_dir = tests_dir + "/test_reporting/data/picorv32/"
+    dirs = [
+        data_dir + "quartus-cyclone4",
+        str(tmp_path),
+        data_dir + "quartus-cyclone10",
+    ]
+
+    df = QuartusReporting.report_many(dirs, workers=workers)
+
+    # Runs without reports are left out
+    assert list(df.index) == [(dirs[0], "clk"), (dirs[2], "clk")]
+    assert list(df.loc[(dirs[0], "clk")]) == [1632, 649, 2, 0, 175.0, 159.95]
+    assert df.loc[(dirs[2], "clk"), "fmax"] == 131.58
+
+    if workers == 1:
+        df = QuartusReporting.report_many(dirs, workers=workers, table="Clocks")
+        assert df.index.names == ["run", None]
+        assert list(df.index.levels[0]) == [dirs[0], dirs[2]]
+        assert df.loc[dirs[2]].set_index("Clock Name").loc["clk", "Period"] == 5.714
+
+
+def test_report_cache(tmp_path, monkeypatch):
+    from edalize.reporting import Reporting, ReportCache
+    from edalize.quartus_reporting import QuartusReporting
+
+    calls = []
+
+    def parse_tables(report):
+        calls.append(report[:])
+        return {"Table": (0, len(report))}
+
+    monkeypatch.setattr(Reporting, "cache", ReportCache(tmp_path / "cache"))
+    monkeypatch.setattr(QuartusReporting, "_parse_tables", parse_tables)
+
+    rpt = tmp_path / "top.fit.rpt"
+    rpt.write_text("+---+\n; A ;\n+---+\n; 1 ;\n+---+\n")
+    assert QuartusReporting.report_resources(str(rpt))["Table"]["A"][0] == 1
+    assert QuartusReporting.report_resources(str(rpt))["Table"]["A"][0] == 1
+    assert len(calls) == 1
+
+    # A changed report or parser version invalidates the cache
+    rpt.write_text("+---+\n; A ;\n+---+\n; 2 ;\n+---+\n")
+    assert QuartusReporting.report_resources(str(rpt))["Table"]["A"][0] == 2
+    monkeypatch.setattr(QuartusReporting, "_parser_version", 2)
+    QuartusReporting.report_resources(str(rpt))
+    assert len(calls) == 3
+
+    # Corrupt entries are reparsed
+    for f in (tmp_path / "cache").iterdir():
+        f.write_text("garbage")
+    QuartusReporting.report_resources(str(rpt))
+    assert len(calls) == 4
+
+
+def test_report_cache_evict(tmp_path):
+    import os
+    from edalize.reporting import ReportCache
+
+    cache = ReportCache(tmp_path, max_size=3500)
+    for i in range(3):
+        cache.put(str(i), "x" * 1000)
+        os.utime(tmp_path / f"{i}.pickle", (i, i))
+
+    # Using an entry makes it the most recently used one
+    assert cache.get("0") == "x" * 1000
+    cache.put("3", "x" * 1000)
+
+    assert sorted(f.name for f in tmp_path.iterdir()) == [
+        "0.pickle",
+        "2.pickle",
+        "3.pickle",
+    ]
+    assert cache.get("1") is None
+
+
+def test_vivado_parse_threads():
+    """The Vivado report parsers can run concurrently"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from edalize.vivado_reporting import VivadoReporting
+
+    data_dir = Path(tests_dir + "/test_reporting/data/linux-on-litex-vexriscv/arty_a7")
+    util = (data_dir / "top_utilization_place.rpt").read_text()
+    timing = (data_dir / "top_timing.rpt").read_text()
+
+    def parse(i):
+        if i % 2:
+            return VivadoReporting._parse_utilization_tables(util)
+        return VivadoReporting._parse_timing_summary_tables(timing)
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(parse, range(32)))
+
+    assert all(r == results[0] for r in results[::2])
+    assert all(r == results[1] for r in results[1::2])
+    assert list(results[0]) == [
+        "Design Timing Summary",
+        "Clock Summary",
+        "Intra Clock Table",
+        "Inter Clock Table",
+        "Other Path Groups Table",
+    ]
+    assert results[1]["Slice Logic"].startswith("+----")
+
+
+def test_vivado_parse_utilization_sections():
+    from edalize.vivado_reporting import VivadoReporting
+
+    report = """Table of Contents
+-----------------
+1. Header Only
+2. Full
+3. No Table
+
+1. Header Only
+--------------
+
++----------+------+
+| Ref Name | Used |
++----------+------+
+
+
+2. Full
+-------
+
+
++------+
+| Name |
++------+
+| a    |
++------+
+
+3. No Table
+-----------
+
+Some text
+"""
+    assert VivadoReporting._parse_utilization_tables(report) == {
+        "Header Only": "+----------+------+\n| Ref Name | Used |\n+----------+------+\n",
+        "Full": "+------+\n| Name |\n+------+\n| a    |\n+------+\n",
+    }
+
+
+def test_quartus_parse_tables(tmp_path):
+    from edalize.quartus_reporting import QuartusReporting
+
+    report = (
+        b"+-----------+\n"
+        b"; Summary   ;\n"
+        b"+-------+---+\n"
+        b"; Fmax  ; 1 ;\n"
+        b"; Pins  ; 2 ;\n"
+        b"; Regs  ; 3 ;\n"
+        b"+-------+---+\n"
+        b"\n"
+        b"+-----------+\n"
+        b"; Table     ;\n"
+        b"+-------+---+\n"
+        b"; Name  ; B ;\n"
+        b"+-------+---+\n"
+        b"; x     ; ;\n"
+        b"; N/A   ; 1 ;\n"
+        b"+-------+---+\n"
+        b"\n"
+        b"+-----------+\n"
+        b"; Broken    ;\n"
+        b"+-------+---+\n"
+        b"; Name  ; C ;\n"
+        b"\n"
+        b"+-------+---+\n"
+    )
+    spans = QuartusReporting._parse_tables(report)
+    assert list(spans) == ["Summary", "Table"]
+    assert report[slice(*spans["Summary"])].startswith(b"+-------+---+\n; Fmax")
+    assert report[slice(*spans["Table"])].endswith(b"; 1 ;\n+-------+---+\n")
+
+    rpt = tmp_path / "top.fit.rpt"
+    rpt.write_bytes(report)
+    tables = QuartusReporting.report_resources(str(rpt))
+    assert list(tables["Summary"][1]) == [1, 2, 3]
+    assert list(tables["Table"].columns) == ["Name", "B"]
+    assert tables["Table"]["Name"].isna().tolist() == [False, True]
+    assert tables["Table"]["B"].isna().tolist() == [True, False]
+
+    # Empty reports can't be memory-mapped
+    rpt.write_bytes(b"")
+    assert QuartusReporting.report_resources(str(rpt)) == {}
+
+
+def test_table_to_rows():
+    from edalize.reporting import Reporting, Table
+
+    table = """
++----------+------+-----------+
+| Ref Name | Used | Functional|
+|          |      | Category  |
++----------+------+-----------+
+| FDRE     |  920 | Register  |
+| LUT6     |  401 | CLB       |
++----------+------+-----------+
+"""
+    assert Reporting.table_to_rows(table, sep="|") == Table(
+        ("Ref Name", "Used", "Functional Category"),
+        [("FDRE", "920", "Register"), ("LUT6", "401", "CLB")],
+    )
+
+
+def test_table_to_df():
+    from edalize.reporting import Reporting
+
+    table = """
++----------+------+------+-----------+------+
+| Ref Name | Used | Used |           | Util |
+|          |      |      |           | %    |
++----------+------+------+-----------+------+
+| FDRE     |  920 |    1 | "Quoted"  | 0.5  |
+| LUT6     |  401 |      | N/A       | 12   |
++----------+------+------+-----------+------+
+"""
+    df = Reporting.table_to_df(table, sep="|")
+    assert list(df.columns) == ["Ref Name", "Used", "Used.1", "Unnamed: 3", "Util %"]
+    assert df["Used"].tolist() == [920, 401] and df["Used"].dtype == "int64"
+    assert df["Used.1"].dtype == "float64" and pd.isna(df["Used.1"][1])
+    assert df["Unnamed: 3"][0] == '"Quoted"' and pd.isna(df["Unnamed: 3"][1])
+    assert df["Util %"].tolist() == [0.5, 12.0]
+
+    # Tables without a header or without rows
+    df = Reporting.table_to_df("+--+\n; a ; 1 ;\n; b ; 2 ;\n; c ; 3 ;\n+--+")
+    assert list(df.columns) == [0, 1] and df[1].tolist() == [1, 2, 3]
+    df = Reporting.table_to_df("+--+\n| A | B |\n+--+", sep="|")
+    assert list(df.columns) == ["A", "B"] and df.empty
+
+
+def test_to_numeric():
+    from edalize.reporting import Reporting
+
+    df = pd.DataFrame(
+        {
+            "int": ["1", "-2"],
+            "float": ["1.5", "-"],
+            "text": ["clk", "-"],
+            "typed": [0.5, 1.0],
+        }
+    )
+    df = Reporting._to_numeric(df)
+    assert df["int"].tolist() == [1, -2] and df["int"].dtype == "int64"
+    assert df["float"][0] == 1.5 and pd.isna(df["float"][1])
+    assert df["text"].tolist() == ["clk", "-"]
+    assert df["typed"].tolist() == [0.5, 1.0]
+
+
 def test_period_to_freq():
     from edalize.reporting import Reporting
 
@@ -393,6 +703,37 @@ def test_picorv32_artix7_timing(picorv32_artix7_data):
     assert [cols[i] for i in [0, -1]] == ["Path Group", "THS Total Endpoints"]
 
 
+def test_picorv32_artix7_timing_paths():
+    """Check the path records from the timing details"""
+    from edalize.vivado_reporting import VivadoReporting
+
+    rpt = tests_dir + "/test_reporting/data/picorv32/vivado-artix7/impl"
+    paths = VivadoReporting.report_timing_paths(rpt + "/top_timing_summary_routed.rpt")
+
+    assert paths.shape == (20, 13)
+    assert (paths["delay_type"] == "max").sum() == 10
+    assert (paths["status"] == "VIOLATED").sum() == 10
+    assert paths["slack"].min() == -3.463
+
+    assert paths.iloc[0].to_dict() == {
+        "from_clock": "clk",
+        "to_clock": "clk",
+        "path_group": "clk",
+        "delay_type": "max",
+        "status": "VIOLATED",
+        "slack": -3.463,
+        "startpoint": "dout_shr_reg[306]/C",
+        "endpoint": "do",
+        "path_type": "Max at Slow Process Corner",
+        "requirement": 5.0,
+        "data_path_delay": 4.024,
+        "logic_levels": 1,
+        "clock_path_skew": -4.403,
+    }
+    assert paths.iloc[10]["delay_type"] == "min"
+    assert paths.iloc[10]["slack"] == 0.097
+
+
 @pytest.fixture(scope="module")
 def picorv32_kusp_data():
     from edalize.vivado_reporting import VivadoReporting
@@ -457,6 +798,115 @@ def test_picorv32_kusp_timing(picorv32_kusp_data):
     assert [cols[i] for i in [0, -2]] == ["From Clock", "THS Failing Endpoints"]
 
 
+def test_picorv32_nextpnr_ice40():
+    from edalize.nextpnr_reporting import NextpnrReporting
+
+    data_dir = tests_dir + "/test_reporting/data/picorv32/nextpnr-ice40"
+    rpt = NextpnrReporting.report(data_dir)
+
+    summary = rpt["summary"]
+    check_types(summary, allowed=[int, float, type(None)])
+    assert round_fmax(summary, 4) == {
+        "lut": 2861,
+        "reg": None,
+        "blkmem": 4,
+        "dsp": 0,
+        "constraint": {"clk$SB_IO_IN_$glb_clk": 12.0},
+        "fmax": {"clk$SB_IO_IN_$glb_clk": 48.7368},
+    }
+
+    df = rpt["resources"]["utilization"]
+    assert df.loc["SB_IO", "used"] == 142
+    assert df.loc["ICESTORM_LC", "available"] == 7680
+
+    paths = rpt["timing"]["critical_paths"]
+    assert paths.shape == (7, 10)
+    assert list(paths["path"]) == [0, 0, 0, 0, 0, 1, 1]
+    assert paths.loc[1, "net"] == "cpu.reg_op1[22]"
+    assert paths.loc[6, "to"] == "<async>"
+    assert paths["delay"].sum() == pytest.approx(8.414)
+
+
+def test_picorv32_nextpnr_ecp5_summary():
+    from edalize.nextpnr_reporting import NextpnrReporting
+
+    data_dir = tests_dir + "/test_reporting/data/picorv32/nextpnr-ecp5"
+    summary = NextpnrReporting.summarize(data_dir)
+
+    assert round_fmax(summary, 4) == {
+        "lut": 3184,
+        "reg": 1172,
+        "blkmem": 4,
+        "dsp": 4,
+        "constraint": {"$glbnet$clk$TRELLIS_IO_IN": 25.0},
+        "fmax": {"$glbnet$clk$TRELLIS_IO_IN": 71.2251},
+    }
+
+
+def test_picorv32_yosys_ice40():
+    from edalize.yosys_reporting import YosysReporting
+
+    data_dir = tests_dir + "/test_reporting/data/picorv32/yosys-ice40"
+    rpt = YosysReporting.report(data_dir)
+
+    summary = rpt["summary"]
+    check_types(summary, allowed=[int, float, type(None)])
+    assert summary == {
+        "lut": 1792,
+        "reg": 1114,
+        "blkmem": 4,
+        "dsp": None,
+        "constraint": {},
+        "fmax": {},
+    }
+
+    cells = rpt["resources"]["cells"]
+    assert list(cells.columns) == ["picorv32", "top", "design"]
+    assert cells.loc["SB_IO", "top"] == 142
+    assert cells.loc["SB_IO", "picorv32"] == 0
+
+    statistics = rpt["resources"]["statistics"]
+    assert statistics.loc["design", "num_cells"] == 3454
+    assert rpt["timing"] == {}
+
+
+def test_picorv32_openroad_nangate45():
+    from edalize.openroad_reporting import OpenroadReporting
+
+    data_dir = tests_dir + "/test_reporting/data/picorv32/openroad-nangate45"
+    rpt = OpenroadReporting.report(data_dir)
+
+    summary = rpt["summary"]
+    check_types(summary, allowed=[int, float, type(None)])
+    assert round_fmax(summary, 4) == {
+        "lut": 9238,
+        "reg": 1597,
+        "blkmem": 0,
+        "dsp": None,
+        "constraint": {"core_clock": 250.0},
+        "fmax": {"core_clock": 209.1175},
+    }
+
+    metrics = rpt["resources"]["metrics"]
+    assert list(metrics.columns) == [
+        "constraints",
+        "synth",
+        "floorplan",
+        "globalplace",
+        "detailedplace",
+        "cts",
+        "globalroute",
+        "detailedroute",
+        "finish",
+    ]
+    assert metrics.loc["design__instance__count", "cts"] == 14377
+    assert pd.isna(metrics.loc["design__instance__count", "synth"])
+
+    timing = rpt["timing"]["timing"]
+    assert timing.loc["timing__setup__ws", "globalplace"] == -0.905
+    assert rpt["timing"]["clocks"].loc["core_clock", "constraint"] == 250.0
+
+
 @pytest.fixture(scope="module")
 def linux_on_litex_vexriscv_arty_a7_data():
     from edalize.vivado_reporting import VivadoReporting
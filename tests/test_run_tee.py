@@ -0,0 +1,94 @@
+import subprocess
+import sys
+
+import pytest
+
+from edalize.utils import OUTPUT_TAIL_LINES, RotatingLog, run_tee
+
+SCRIPT = (
+    "import sys\n"
+    "for i in range(1000):\n"
+    "    print(f'out{i}')\n"
+    "    print(f'err{i}', file=sys.stderr)\n"
+    "sys.exit(int(sys.argv[1]))\n"
+)
+
+
+def test_run_tee(tmp_path):
+    lines = []
+    log = RotatingLog(tmp_path / "tool.log")
+    cp = run_tee(
+        [sys.executable, "-c", SCRIPT, "0"],
+        log_file=log,
+        callback=lambda stream, line: lines.append((stream, line)),
+        tail_lines=3,
+    )
+    log.close()
+
+    assert cp.returncode == 0
+    # Only the tail of each stream is kept
+    assert cp.stdout == b"out997\nout998\nout999\n"
+    assert cp.stderr == b"err997\nerr998\nerr999\n"
+    # ...but everything is passed on to the callback and the log
+    assert len(lines) == 2000
+    assert ("stdout", "out0\n") in lines
+    assert ("stderr", "err999\n") in lines
+    assert len((tmp_path / "tool.log").read_bytes().splitlines()) == 2000
+
+
+def test_run_tee_error():
+    with pytest.raises(subprocess.CalledProcessError) as e:
+        run_tee([sys.executable, "-c", SCRIPT, "3"], check=True, tail_lines=1)
+
+    assert e.value.returncode == 3
+    assert e.value.stdout == b"out999\n"
+    assert e.value.stderr == b"err999\n"
+
+
+def test_rotating_log(tmp_path):
+    log_file = tmp_path / "tool.log"
+    log = RotatingLog(log_file, max_bytes=10, backup_count=2)
+    for i in range(4):
+        log.write(f"line{i}\n".encode())
+    log.close()
+
+    assert log_file.read_text() == "line3\n"
+    assert (tmp_path / "tool.log.1").read_text() == "line2\n"
+    assert (tmp_path / "tool.log.2").read_text() == "line1\n"
+    assert not (tmp_path / "tool.log.3").exists()
+
+
+def test_flow_run_tool_quiet(tmp_path):
+    from edalize.flows.edaflow import Edaflow
+
+    flow = object.__new__(Edaflow)
+    flow.verbose = False
+    flow.stdout = None
+    flow.stderr = None
+    flow.log_file = tmp_path / "flow.log"
+
+    (rc, stdout, stderr) = flow._run_tool(
+        sys.executable, ["-c", SCRIPT, "0"], quiet=True
+    )
+    assert rc == 0
+    # Only the tail of the output is kept for quiet commands...
+    assert len(stdout.splitlines()) == OUTPUT_TAIL_LINES
+    assert stdout.endswith(b"out999\n")
+    # ...but all of it is written to the log
+    assert b"out0\n" in (tmp_path / "flow.log").read_bytes()
+
+    flow.log_file = None
+    (rc, stdout, stderr) = flow._run_tool(
+        sys.executable, ["-c", SCRIPT, "0"], quiet=True
+    )
+    assert len(stderr.splitlines()) == OUTPUT_TAIL_LINES
+
+    # Output read by the caller is returned in full
+    (rc, stdout, stderr) = flow._run_tool(
+        sys.executable, ["-c", SCRIPT, "0"], quiet=True, capture=True
+    )
+    assert stdout.startswith(b"out0\n") and stderr.endswith(b"err999\n")
+    assert len(stdout.splitlines()) == 1000
+
+    with pytest.raises(RuntimeError, match="exited with an error: 2"):
+        flow._run_tool(sys.executable, ["-c", SCRIPT, "2"], quiet=True)